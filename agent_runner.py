@@ -18,6 +18,7 @@ from typing import Any
 
 from atlas_utils import atomic_write_json, atomic_write_text, format_process_error, kill_process
 from mcp_tooling import is_google_calendar_tool_name, normalize_allowed_tools_for_provider
+from skill_registry import SkillRegistry, get_skill_registry
 
 SUPPORTED_PROVIDERS = {"claude", "codex"}
 CLAUDE_MODELS = {"haiku", "sonnet", "opus"}
@@ -48,6 +49,8 @@ CODEX_EXTERNAL_MCP_SERVER_SKIP_NAMES = {
     "google-calendar",
 }
 MCP_SERVER_ALLOW_PATTERN = re.compile(r"^mcp__(?P<server>[A-Za-z0-9._-]+)__\*$")
+PROMPT_CACHE_BOUNDARY = "<!-- atlas:prompt-cache-boundary -->"
+SKILL_INVOCATION_RE = re.compile(r"\brun the ([a-z0-9-]+) skill\b", re.IGNORECASE)
 CALENDAR_CONTEXT_KEYWORD_RE = re.compile(
     r"\b(calendar|meeting|meetings|event|events|scheduling)\b",
     re.IGNORECASE,
@@ -81,6 +84,11 @@ def resolve_skills_dir(bot_dir: str) -> Path:
     return Path(bot_dir) / ".claude" / "skills"
 
 
+def get_bot_skill_registry(bot_dir: str) -> SkillRegistry:
+    """Return the shared skill registry for the bot's resolved skills directory."""
+    return get_skill_registry(resolve_skills_dir(bot_dir))
+
+
 def get_agent_provider() -> str:
     """Return the configured agent provider, defaulting to Claude."""
     provider = os.getenv("ATLAS_AGENT_PROVIDER", "claude").strip().lower()
@@ -185,7 +193,9 @@ def _build_codex_agents_content(
     system_prompt = _read_text_if_exists(system_prompt_path).strip()
     channel_role = _read_text_if_exists(channel_role_path).strip() if channel_role_path else ""
     persistent_context = _read_text_if_exists(context_path).strip()
-    skills_dir = resolve_skills_dir(bot_dir)
+    skill_registry = get_bot_skill_registry(bot_dir)
+    skills_dir = skill_registry.skills_dir
+    skill_names = skill_registry.names()
     calendar_context_path = Path(channel_dir) / CODEX_CALENDAR_CONTEXT_FILENAME
     garmin_workout_help_path = Path(channel_dir) / CODEX_GARMIN_WORKOUT_HELP_FILENAME
     workout_help_path = Path(channel_dir) / CODEX_WORKOUT_HELP_FILENAME
@@ -212,6 +222,11 @@ def _build_codex_agents_content(
         "- Treat the system prompt and persistent context above as authoritative.",
         f"- ATLAS skill definitions live in `{skills_dir}`.",
         "- When a prompt tells you to run a named skill, read the matching file in that directory and follow it.",
+        (
+            f"- Available skills: {', '.join(f'`{name}`' for name in skill_names)}."
+            if skill_names
+            else "- No ATLAS skills are currently installed."
+        ),
         f"- Attachments from Discord are saved under `{Path(channel_dir) / 'attachments'}`.",
         f"- Before using Google Calendar create/update tools, read `{calendar_context_path}`.",
         (
@@ -870,11 +885,6 @@ def _should_retry_codex_for_transient_api_error(
     return any(marker in lowered_output for marker in retry_markers)
 
 
-def _skill_path(bot_dir: str, skill_name: str) -> Path:
-    """Resolve a repo-local ATLAS skill path."""
-    return resolve_skills_dir(bot_dir) / f"{skill_name}.md"
-
-
 def build_prompt_with_attachments(prompt: str, file_paths: list[str]) -> str:
     """Build a provider-neutral prompt that includes an attachment manifest."""
     if not file_paths:
@@ -903,45 +913,50 @@ def build_prompt_with_attachments(prompt: str, file_paths: list[str]) -> str:
     return "\n".join(lines)
 
 
-def _expand_skill_prompt_if_needed(prompt: str, bot_dir: str) -> str:
-    """Inline a skill definition for Codex when the prompt explicitly names one."""
-    match = re.search(r"\brun the ([a-z0-9-]+) skill\b", prompt, re.IGNORECASE)
+def _build_skill_definition_section(prompt: str, bot_dir: str) -> str:
+    """Render the inlined skill definition named by the prompt, if any."""
+    match = SKILL_INVOCATION_RE.search(prompt)
     if not match:
-        return prompt
+        return ""
 
     skill_name = match.group(1).lower()
-    skill_path = _skill_path(bot_dir, skill_name)
-    if not skill_path.exists():
-        return prompt
+    skill = get_bot_skill_registry(bot_dir).get(skill_name)
+    if skill is None:
+        return ""
 
-    skill_contents = skill_path.read_text(encoding="utf-8").strip()
     return (
-        f"{prompt}\n\n"
         f"## ATLAS Skill Definition: {skill_name}\n\n"
         f"Read and follow this skill definition while completing the task:\n\n"
-        f"{skill_contents}\n"
+        f"{skill.content}\n"
     )
 
 
-def _inject_librarian_index_if_needed(prompt: str, vault_path: str) -> str:
-    """Inline the compact vault index summary for librarian-oriented Codex runs."""
+def _expand_skill_prompt_if_needed(prompt: str, bot_dir: str) -> str:
+    """Inline a skill definition for Codex when the prompt explicitly names one."""
+    skill_section = _build_skill_definition_section(prompt, bot_dir)
+    if not skill_section:
+        return prompt
+    return f"{prompt}\n\n{skill_section}"
+
+
+def _build_librarian_index_section(prompt: str, vault_path: str) -> str:
+    """Render the compact vault index summary for librarian-oriented prompts, if any."""
     lowered_prompt = prompt.lower()
     if all(
         marker not in lowered_prompt
         for marker in ("second-brain-librarian", "second-brain librarian", "second brain librarian")
     ):
-        return prompt
+        return ""
 
     index_path = Path(vault_path) / "System" / "vault-index.md"
     if not index_path.exists():
-        return prompt
+        return ""
 
     index_text = index_path.read_text(encoding="utf-8").strip()
     if not index_text:
-        return prompt
+        return ""
 
     return (
-        f"{prompt}\n\n"
         "## Preloaded Vault Index\n\n"
         "Use this preloaded vault index overview as the primary source for the digest. "
         "Only read additional notes if the index is genuinely insufficient.\n\n"
@@ -949,6 +964,14 @@ def _inject_librarian_index_if_needed(prompt: str, vault_path: str) -> str:
     )
 
 
+def _inject_librarian_index_if_needed(prompt: str, vault_path: str) -> str:
+    """Inline the compact vault index summary for librarian-oriented Codex runs."""
+    index_section = _build_librarian_index_section(prompt, vault_path)
+    if not index_section:
+        return prompt
+    return f"{prompt}\n\n{index_section}"
+
+
 def _build_allowed_tools_note(allowed_tools: list[str]) -> str:
     """Render a soft tool-usage constraint note for Codex."""
     if not allowed_tools:
@@ -1031,19 +1054,37 @@ async def _prepare_atlas_prompt(
     include_scheduled_job_note: bool = False,
     include_allowed_tools_note: bool = False,
     include_calendar_context: bool = False,
+    cache_friendly_layout: bool = False,
 ) -> str:
-    """Apply ATLAS-owned prompt augmentation consistently across providers."""
+    """Apply ATLAS-owned prompt augmentation consistently across providers.
+
+    With ``cache_friendly_layout`` the prompt is ordered from most to least stable
+    (execution notes, skill definition, vault index, then the rendered request and
+    calendar context) with a boundary marker after each stable tier, so repeated runs
+    share the longest possible provider-cacheable prefix.
+    """
     attachment_paths = attachment_paths or []
     allowed_tools = allowed_tools or []
 
-    effective_prompt = build_prompt_with_attachments(prompt, attachment_paths)
-    if include_scheduled_job_note:
-        effective_prompt = _build_scheduled_job_note() + effective_prompt
-    if include_allowed_tools_note and allowed_tools:
-        effective_prompt = _build_allowed_tools_note(allowed_tools) + effective_prompt
+    if cache_friendly_layout:
+        effective_prompt = _build_cache_friendly_prompt(
+            prompt=prompt,
+            bot_dir=bot_dir,
+            vault_path=vault_path,
+            attachment_paths=attachment_paths,
+            allowed_tools=allowed_tools,
+            include_scheduled_job_note=include_scheduled_job_note,
+            include_allowed_tools_note=include_allowed_tools_note,
+        )
+    else:
+        effective_prompt = build_prompt_with_attachments(prompt, attachment_paths)
+        if include_scheduled_job_note:
+            effective_prompt = _build_scheduled_job_note() + effective_prompt
+        if include_allowed_tools_note and allowed_tools:
+            effective_prompt = _build_allowed_tools_note(allowed_tools) + effective_prompt
 
-    effective_prompt = _expand_skill_prompt_if_needed(effective_prompt, bot_dir)
-    effective_prompt = _inject_librarian_index_if_needed(effective_prompt, vault_path)
+        effective_prompt = _expand_skill_prompt_if_needed(effective_prompt, bot_dir)
+        effective_prompt = _inject_librarian_index_if_needed(effective_prompt, vault_path)
 
     if include_calendar_context:
         effective_prompt = await _append_calendar_context_if_needed(
@@ -1056,6 +1097,34 @@ async def _prepare_atlas_prompt(
     return effective_prompt
 
 
+def _build_cache_friendly_prompt(
+    *,
+    prompt: str,
+    bot_dir: str,
+    vault_path: str,
+    attachment_paths: list[str],
+    allowed_tools: list[str],
+    include_scheduled_job_note: bool,
+    include_allowed_tools_note: bool,
+) -> str:
+    """Assemble stable prompt tiers ahead of the volatile request text."""
+    execution_notes = ""
+    if include_scheduled_job_note:
+        execution_notes += _build_scheduled_job_note()
+    if include_allowed_tools_note and allowed_tools:
+        execution_notes += _build_allowed_tools_note(allowed_tools)
+
+    stable_tiers = [
+        execution_notes,
+        _build_skill_definition_section(prompt, bot_dir),
+        _build_librarian_index_section(prompt, vault_path),
+    ]
+    prefix = "".join(
+        f"{tier.strip()}\n\n{PROMPT_CACHE_BOUNDARY}\n\n" for tier in stable_tiers if tier.strip()
+    )
+    return prefix + build_prompt_with_attachments(prompt, attachment_paths)
+
+
 def _claude_session_dir_for_channel_dir(channel_dir: str) -> Path:
     """Return Claude's external per-workdir session storage path."""
     abs_channel_dir = str(Path(channel_dir).resolve())
@@ -1398,8 +1467,13 @@ async def run_job_prompt(
     bot_dir: str,
     vault_path: str,
     reasoning_effort: str | None = None,
+    prompt_cache: bool = False,
 ) -> tuple[str, bool]:
-    """Run a one-shot job prompt through the active provider."""
+    """Run a one-shot job prompt through the active provider.
+
+    ``prompt_cache`` switches to the cache-friendly prompt layout and leaves provider
+    prompt caching enabled; otherwise Claude runs with prompt caching disabled.
+    """
     provider = get_agent_provider()
     resolved_model = resolve_model_for_provider(model, provider)
     provider_allowed_tools = normalize_allowed_tools_for_provider(allowed_tools, provider)
@@ -1413,6 +1487,7 @@ async def run_job_prompt(
         include_scheduled_job_note=True,
         include_allowed_tools_note=True,
         include_calendar_context=True,
+        cache_friendly_layout=prompt_cache,
     )
 
     if provider == "codex":
@@ -1449,6 +1524,10 @@ async def run_job_prompt(
             return f"Error (stderr): {stderr.decode().strip()}", False
         return "No response generated (empty Codex output).", False
 
+    claude_env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
+    if not prompt_cache:
+        claude_env["ANTHROPIC_DISABLE_PROMPT_CACHING"] = "1"
+
     process: asyncio.subprocess.Process | None = None
     try:
         process = await asyncio.create_subprocess_exec(
@@ -1464,10 +1543,7 @@ async def run_job_prompt(
             stdin=asyncio.subprocess.DEVNULL,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
-            env={
-                **{k: v for k, v in os.environ.items() if k != "CLAUDECODE"},
-                "ANTHROPIC_DISABLE_PROMPT_CACHING": "1",
-            },
+            env=claude_env,
         )
 
         stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
@@ -0,0 +1,142 @@
+"""Local control API for the running bot: run a prompt in a channel over a Unix socket."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+# Placeholder host for HTTP over the Unix socket; only the path matters.
+CONTROL_URL = "http://atlas"
+
+
+class ControlChannelNotFoundError(LookupError):
+    """The requested channel is not one the bot can see."""
+
+
+class ControlChannelNotAllowedError(PermissionError):
+    """The channel exists but the bot does not respond in it on its own."""
+
+
+ChannelResolver = Callable[[int | None, str | None], Any]
+PromptRunner = Callable[[Any, str], Awaitable[str]]
+
+
+def default_socket_path(bot_dir: str | Path) -> Path:
+    """Return the socket path used when ``ATLAS_CONTROL_SOCKET`` is unset."""
+    return Path(bot_dir) / ".atlas-control.sock"
+
+
+def _parse_prompt_request(body: Any) -> tuple[int | None, str | None, str, bool]:
+    if not isinstance(body, dict):
+        raise ValueError("request body must be a JSON object")
+    prompt = body.get("prompt")
+    if not isinstance(prompt, str) or not prompt.strip():
+        raise ValueError("prompt is required")
+    channel_id = body.get("channel_id")
+    channel_name = body.get("channel")
+    if channel_id is not None:
+        try:
+            channel_id = int(channel_id)
+        except (TypeError, ValueError):
+            raise ValueError("channel_id must be an integer") from None
+    if channel_name is not None and not isinstance(channel_name, str):
+        raise ValueError("channel must be a string")
+    return channel_id, channel_name, prompt, bool(body.get("wait", False))
+
+
+def create_control_app(
+    resolve_channel: ChannelResolver,
+    run_prompt: PromptRunner,
+) -> web.Application:
+    """Build the control API.
+
+    ``POST /prompt`` takes ``{"prompt", "channel" or "channel_id", "wait"}``. The channel
+    is looked up with ``resolve_channel(channel_id, channel_name)``, which raises
+    ``ControlChannelNotFoundError`` for an unknown channel (404) or
+    ``ControlChannelNotAllowedError`` for one the bot must not prompt in (403), and the
+    prompt is run with ``run_prompt(channel, prompt)``. Without ``wait`` the run is
+    scheduled and ``202`` returned at once, and a failure is logged; with it the response
+    text is returned when the agent finishes.
+    ``GET /health`` reports that the bot is up.
+    """
+    background: set[asyncio.Task] = set()
+
+    def finished(task: asyncio.Task) -> None:
+        background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+            print(f"Control prompt failed: {error.__class__.__name__}: {error}")
+
+    async def health(request: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+    async def prompt(request: web.Request) -> web.Response:
+        try:
+            channel_id, channel_name, text, wait = _parse_prompt_request(await request.json())
+        except ValueError as e:
+            return web.json_response({"error": str(e)}, status=400)
+        try:
+            channel = resolve_channel(channel_id, channel_name)
+        except ControlChannelNotFoundError as e:
+            return web.json_response({"error": str(e)}, status=404)
+        except ControlChannelNotAllowedError as e:
+            return web.json_response({"error": str(e)}, status=403)
+
+        if not wait:
+            task = asyncio.create_task(run_prompt(channel, text))
+            background.add(task)
+            task.add_done_callback(finished)
+            return web.json_response({"status": "accepted"}, status=202)
+        response = await run_prompt(channel, text)
+        return web.json_response({"status": "done", "response": response})
+
+    app = web.Application()
+    app.router.add_get("/health", health)
+    app.router.add_post("/prompt", prompt)
+    return app
+
+
+async def start_control_server(app: web.Application, socket_path: str | Path) -> web.AppRunner:
+    """Serve ``app`` on a Unix socket readable only by the bot's user."""
+    path = Path(socket_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.is_socket():
+        path.unlink()
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.UnixSite(runner, str(path)).start()
+    os.chmod(path, 0o600)
+    return runner
+
+
+async def post_control_prompt(
+    prompt: str,
+    *,
+    socket_path: str | Path,
+    channel_id: int | None = None,
+    channel_name: str | None = None,
+    wait: bool = False,
+) -> dict[str, Any]:
+    """Ask the running bot to run ``prompt`` in a channel; raises if the bot is unreachable."""
+    body: dict[str, Any] = {"prompt": prompt, "wait": wait}
+    if channel_id is not None:
+        body["channel_id"] = channel_id
+    if channel_name:
+        body["channel"] = channel_name
+    connector = aiohttp.UnixConnector(path=str(socket_path))
+    # A waited run lasts as long as the agent does, so only bound the connection.
+    timeout = aiohttp.ClientTimeout(total=None if wait else 30, sock_connect=5)
+    async with (
+        aiohttp.ClientSession(connector=connector, timeout=timeout) as session,
+        session.post(f"{CONTROL_URL}/prompt", json=body) as resp,
+    ):
+        payload = await resp.json()
+        if resp.status >= 400:
+            raise RuntimeError(payload.get("error", f"control API returned {resp.status}"))
+        return payload
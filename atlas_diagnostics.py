@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import subprocess
+import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from pathlib import Path
 
+from atlas_utils import env_number
+
 BOT_DIR = Path(__file__).resolve().parent
 CRON_STATE_FILE = BOT_DIR / "cron" / "state" / "last_runs.json"
 CRON_JOBS_FILE = BOT_DIR / "cron" / "jobs.json"
 DEFAULT_ORPHAN_HELPER_MIN_SECONDS = 60 * 60
+PROC_ROOT = Path("/proc")
+# How long `!status` reuses a snapshot before collecting a fresh one.
+STATUS_CACHE_SECONDS = env_number("ATLAS_STATUS_CACHE_SECONDS", default=15.0)
 
 MCP_HELPER_PATTERNS = (
     "mcp_server.py",
@@ -23,7 +31,7 @@ MCP_HELPER_PATTERNS = (
 
 @dataclass(frozen=True)
 class ProcessInfo:
-    """One process row from ps."""
+    """One process row from /proc or ps."""
 
     pid: int
     ppid: int
@@ -169,8 +177,53 @@ def parse_ps_output(output: str) -> tuple[ProcessInfo, ...]:
     return tuple(processes)
 
 
+def _read_proc_process(pid_dir: Path, *, uptime: float, clock_ticks: int) -> ProcessInfo | None:
+    try:
+        stat = (pid_dir / "stat").read_text(encoding="utf-8", errors="replace")
+        cmdline = (pid_dir / "cmdline").read_bytes()
+    except OSError:
+        # The process exited between listing /proc and reading it.
+        return None
+    # The command name is parenthesised and may itself contain spaces or parentheses.
+    open_paren, close_paren = stat.find("("), stat.rfind(")")
+    fields = stat[close_paren + 2 :].split()
+    if open_paren < 0 or close_paren < 0 or len(fields) < 20:
+        return None
+    try:
+        ppid, pgid, sid = int(fields[1]), int(fields[2]), int(fields[3])
+        started = int(fields[19]) / clock_ticks
+    except ValueError:
+        return None
+    args = [arg for arg in cmdline.decode("utf-8", errors="replace").split("\0") if arg]
+    return ProcessInfo(
+        pid=int(pid_dir.name),
+        ppid=ppid,
+        pgid=pgid,
+        sid=sid,
+        stat=fields[0],
+        elapsed_seconds=max(int(uptime - started), 0),
+        cmd=" ".join(args) or f"[{stat[open_paren + 1 : close_paren]}]",
+    )
+
+
+def read_proc_processes(proc_root: Path = PROC_ROOT) -> tuple[ProcessInfo, ...]:
+    """Read the process table straight from ``/proc`` instead of forking ps."""
+    uptime = float((proc_root / "uptime").read_text(encoding="utf-8").split()[0])
+    clock_ticks = os.sysconf("SC_CLK_TCK")
+    processes: list[ProcessInfo] = []
+    for pid_dir in proc_root.iterdir():
+        if not pid_dir.name.isdigit():
+            continue
+        process = _read_proc_process(pid_dir, uptime=uptime, clock_ticks=clock_ticks)
+        if process is not None:
+            processes.append(process)
+    return tuple(sorted(processes, key=lambda process: process.pid))
+
+
 def get_processes() -> tuple[ProcessInfo, ...]:
     """Return current process table rows needed for ATLAS diagnostics."""
+    if (PROC_ROOT / "uptime").exists():
+        return read_proc_processes()
     result = _run_command(["ps", "-eo", "pid,ppid,pgid,sid,stat,etime,cmd"])
     return parse_ps_output(result.stdout)
 
@@ -244,9 +297,8 @@ def _parse_systemctl_show(
     )
 
 
-def get_service_status(name: str = "atlas-bot.service", *, user: bool = False) -> ServiceStatus:
+def _systemctl_show_args(name: str, *, user: bool) -> list[str]:
     args = ["systemctl"]
-    scope = "user" if user else "system"
     if user:
         args.append("--user")
     args.extend(
@@ -265,11 +317,36 @@ def get_service_status(name: str = "atlas-bot.service", *, user: bool = False) -
             "LoadState",
         ]
     )
-    result = _run_command(args)
+    return args
+
+
+def get_service_status(name: str = "atlas-bot.service", *, user: bool = False) -> ServiceStatus:
+    scope = "user" if user else "system"
+    result = _run_command(_systemctl_show_args(name, user=user))
     error = result.stderr.strip() or None
     return _parse_systemctl_show(result.stdout, scope=scope, name=name, error=error)
 
 
+async def get_service_status_async(
+    name: str = "atlas-bot.service", *, user: bool = False
+) -> ServiceStatus:
+    """Like ``get_service_status`` but without blocking the event loop."""
+    scope = "user" if user else "system"
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *_systemctl_show_args(name, user=user),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+    except OSError as e:
+        return _parse_systemctl_show("", scope=scope, name=name, error=str(e))
+    error = stderr.decode("utf-8", errors="replace").strip() or None
+    return _parse_systemctl_show(
+        stdout.decode("utf-8", errors="replace"), scope=scope, name=name, error=error
+    )
+
+
 def _load_json(path: Path) -> dict:
     if not path.exists():
         return {}
@@ -335,6 +412,77 @@ def build_diagnostics_snapshot(
     )
 
 
+async def collect_diagnostics_snapshot(
+    *,
+    orphan_min_seconds: int = DEFAULT_ORPHAN_HELPER_MIN_SECONDS,
+) -> DiagnosticsSnapshot:
+    """Build a snapshot off the event loop.
+
+    The process table and cron files are read in worker threads while both systemctl
+    queries run as concurrent subprocesses.
+    """
+    processes, system_service, user_service, cron_jobs = await asyncio.gather(
+        asyncio.to_thread(get_processes),
+        get_service_status_async("atlas-bot.service"),
+        get_service_status_async("atlas-bot.service", user=True),
+        asyncio.to_thread(get_cron_job_statuses),
+    )
+    return DiagnosticsSnapshot(
+        provider=os.getenv("ATLAS_AGENT_PROVIDER", "claude"),
+        bot_processes=get_bot_processes(processes),
+        orphan_mcp_helpers=get_orphan_mcp_helpers(
+            processes,
+            orphan_min_seconds=orphan_min_seconds,
+        ),
+        system_service=system_service,
+        user_service=user_service,
+        cron_jobs=cron_jobs,
+    )
+
+
+class DiagnosticsCache:
+    """Reuse a diagnostics snapshot for ``ttl_seconds``.
+
+    Callers that arrive while a snapshot is being collected share that collection, so a
+    burst of ``!status`` commands across channels runs the probes once.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = STATUS_CACHE_SECONDS,
+        *,
+        collect: Callable[[], Awaitable[DiagnosticsSnapshot]] = collect_diagnostics_snapshot,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._collect = collect
+        self._clock = clock
+        self._snapshot: DiagnosticsSnapshot | None = None
+        self._taken_at = 0.0
+        self._pending: asyncio.Task[DiagnosticsSnapshot] | None = None
+
+    async def get(self) -> DiagnosticsSnapshot:
+        """Return the cached snapshot, collecting a new one once it has expired."""
+        if self._snapshot is not None and self._clock() - self._taken_at < self.ttl_seconds:
+            return self._snapshot
+        if self._pending is None:
+            self._pending = asyncio.create_task(self._refresh())
+        # Shield the shared collection so one cancelled caller does not cancel the rest.
+        return await asyncio.shield(self._pending)
+
+    async def _refresh(self) -> DiagnosticsSnapshot:
+        try:
+            snapshot = await self._collect()
+            self._snapshot, self._taken_at = snapshot, self._clock()
+            return snapshot
+        finally:
+            self._pending = None
+
+    def clear(self) -> None:
+        """Drop the cached snapshot so the next ``get`` collects a fresh one."""
+        self._snapshot = None
+
+
 def _format_process(process: ProcessInfo) -> str:
     command = process.cmd
     if len(command) > 95:
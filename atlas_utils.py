@@ -16,6 +16,17 @@ def shell_command(program: str, *args: str) -> str:
     return " ".join(shlex.quote(part) for part in (program, *args))
 
 
+def env_number(name: str, *, default: float) -> float:
+    """Read a numeric environment setting, falling back to ``default`` if unset or malformed."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
 def atomic_write_text(path: str | Path, content: str) -> None:
     """Atomically replace a UTF-8 text file."""
     target = Path(path)
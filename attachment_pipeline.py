@@ -0,0 +1,183 @@
+"""Attachment preprocessing: downscale images and extract PDF text before agent runs."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+from atlas_utils import atomic_write_text, env_number
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+
+# About 1265x950 for a 4:3 screenshot; provider vision models downsample larger images anyway.
+ATTACHMENT_IMAGE_MAX_PIXELS = int(env_number("ATLAS_ATTACHMENT_IMAGE_MAX_PIXELS", default=1200000))
+ATTACHMENT_JPEG_QUALITY = int(env_number("ATLAS_ATTACHMENT_JPEG_QUALITY", default=85))
+ATTACHMENT_PDF_MAX_PAGES = int(env_number("ATLAS_ATTACHMENT_PDF_MAX_PAGES", default=20))
+# Below this many extracted characters a PDF is treated as scanned and passed through as-is.
+ATTACHMENT_PDF_MIN_TEXT_CHARS = 200
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_sha256(path: str | Path) -> str:
+    """Return the hex SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _optional_module(name: str) -> Any | None:
+    try:
+        return importlib.import_module(name)
+    except ModuleNotFoundError:
+        return None
+
+
+def _downscale_image(source: Path, target_base: Path) -> Path | None:
+    """Write a downscaled copy of ``source`` next to ``target_base``; ``None`` if not needed."""
+    pil_image = _optional_module("PIL.Image")
+    pil_ops = _optional_module("PIL.ImageOps")
+    if pil_image is None or pil_ops is None:
+        return None
+
+    with pil_image.open(source) as image:
+        if getattr(image, "is_animated", False):
+            return None
+        if image.width * image.height <= ATTACHMENT_IMAGE_MAX_PIXELS:
+            return None
+        # Size the target from the upright image; EXIF orientations 5-8 swap the axes.
+        upright = pil_ops.exif_transpose(image)
+        width, height = upright.size
+        scale = (ATTACHMENT_IMAGE_MAX_PIXELS / (width * height)) ** 0.5
+        resized = upright.resize(
+            (max(int(width * scale), 1), max(int(height * scale), 1)),
+            pil_image.Resampling.LANCZOS,
+        )
+
+    if resized.mode in ("RGBA", "LA") or "transparency" in resized.info:
+        target = Path(f"{target_base}.png")
+        resized.save(target, format="PNG", optimize=True)
+    else:
+        target = Path(f"{target_base}.jpg")
+        resized.convert("RGB").save(
+            target, format="JPEG", quality=ATTACHMENT_JPEG_QUALITY, optimize=True
+        )
+    return target
+
+
+def _extract_pdf_text(source: Path, target_base: Path) -> Path | None:
+    """Write the text of the first pages of ``source``; ``None`` if it has too little text."""
+    pypdf = _optional_module("pypdf")
+    if pypdf is None:
+        return None
+
+    reader = pypdf.PdfReader(str(source))
+    total_pages = len(reader.pages)
+    page_count = min(total_pages, ATTACHMENT_PDF_MAX_PAGES)
+    texts = [(reader.pages[index].extract_text() or "").strip() for index in range(page_count)]
+    if sum(len(text) for text in texts) < ATTACHMENT_PDF_MIN_TEXT_CHARS:
+        return None
+
+    sections = [f"# Extracted PDF text (pages 1-{page_count} of {total_pages})"]
+    if page_count < total_pages:
+        sections.append(
+            f"Only the first {page_count} pages were extracted. The full PDF is in the same "
+            "folder, named like this file with `.pdf` in place of `.atlas.txt`."
+        )
+    sections.extend(f"## Page {index + 1}\n\n{text}" for index, text in enumerate(texts))
+    target = Path(f"{target_base}.txt")
+    atomic_write_text(target, "\n\n".join(sections) + "\n")
+    return target
+
+
+def _cache_variant(suffix: str) -> str | None:
+    if suffix in IMAGE_SUFFIXES:
+        return f"img{ATTACHMENT_IMAGE_MAX_PIXELS}q{ATTACHMENT_JPEG_QUALITY}"
+    if suffix == ".pdf":
+        return f"pdf{ATTACHMENT_PDF_MAX_PAGES}"
+    return None
+
+
+def _derive(source: Path, digest: str, cache_dir: Path) -> Path | None:
+    """Return the cached derivative of ``source``, creating it on first sight of ``digest``.
+
+    A ``.none`` marker records that a file needs no derivative (small image, scanned PDF,
+    missing optional library) so repeat uploads skip re-decoding it.
+    """
+    suffix = source.suffix.lower()
+    variant = _cache_variant(suffix)
+    if variant is None:
+        return None
+
+    cache_base = cache_dir / digest[:2] / f"{digest}.{variant}"
+    existing = next(cache_base.parent.glob(f"{cache_base.name}.*"), None)
+    if existing is not None:
+        # Refresh the entry so attachment garbage collection keeps recently used derivatives.
+        os.utime(existing)
+        return None if existing.suffix == ".none" else existing
+
+    cache_base.parent.mkdir(parents=True, exist_ok=True)
+    if suffix == ".pdf":
+        derived = _extract_pdf_text(source, cache_base)
+        libraries_present = _optional_module("pypdf") is not None
+    else:
+        derived = _downscale_image(source, cache_base)
+        libraries_present = _optional_module("PIL.Image") is not None
+    if derived is None and libraries_present:
+        Path(f"{cache_base}.none").touch()
+    return derived
+
+
+def _link_into(cached: Path, destination: Path) -> Path:
+    if not destination.exists():
+        try:
+            os.link(cached, destination)
+        except OSError:
+            shutil.copy2(cached, destination)
+    return destination
+
+
+def preprocess_attachments(file_paths: list[str], *, cache_dir: str | Path) -> list[str]:
+    """Replace downloaded attachments with smaller derivatives for the agent.
+
+    Identical files within one message are passed once. Images above
+    ``ATTACHMENT_IMAGE_MAX_PIXELS`` are downscaled and re-encoded, and text-bearing PDFs are
+    replaced by their extracted text (first ``ATTACHMENT_PDF_MAX_PAGES`` pages).
+    Derivatives are cached by content hash under ``cache_dir`` and linked next to the
+    original, so a repeat upload of the same file is not decoded again. Any file that
+    cannot be processed is passed through unchanged.
+    """
+    cache_root = Path(cache_dir)
+    seen: set[str] = set()
+    results: list[str] = []
+    for file_path in file_paths:
+        source = Path(file_path)
+        try:
+            digest = file_sha256(source)
+        except OSError as e:
+            print(f"Attachment preprocessing skipped for {source.name}: {e}")
+            results.append(file_path)
+            continue
+        if digest in seen:
+            continue
+        seen.add(digest)
+
+        try:
+            cached = _derive(source, digest, cache_root)
+        except Exception as e:
+            print(f"Attachment preprocessing failed for {source.name}: {e}")
+            cached = None
+        if cached is None:
+            results.append(file_path)
+            continue
+
+        derived = _link_into(cached, source.with_name(f"{source.stem}.atlas{cached.suffix}"))
+        print(f"  Preprocessed {source.name} -> {derived.name}")
+        results.append(str(derived))
+    return results
@@ -0,0 +1,171 @@
+"""Content-addressed storage and garbage collection for Discord attachments."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from attachment_pipeline import file_sha256
+
+DEFAULT_RETENTION_DAYS = 30
+DEFAULT_MAX_STORE_BYTES = 2 * 1024 * 1024 * 1024
+
+
+def default_store_dir(sessions_dir: str | Path) -> Path:
+    """Return the store location used when ``ATLAS_ATTACHMENT_STORE_DIR`` is unset."""
+    return Path(sessions_dir) / ".attachment-store"
+
+
+@dataclass
+class GarbageCollectionResult:
+    """Counts from one ``AttachmentStore.collect_garbage`` pass."""
+
+    session_files_removed: int = 0
+    blobs_removed: int = 0
+    derived_removed: int = 0
+    bytes_freed: int = 0
+    store_bytes: int = 0
+
+
+def _replace_with_link(target: Path, path: Path) -> None:
+    """Atomically make ``path`` a hard link to ``target``."""
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".link-")
+    os.close(fd)
+    os.unlink(temp_name)
+    try:
+        os.link(target, temp_name)
+        os.replace(temp_name, path)
+    except OSError:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+
+class AttachmentStore:
+    """Keep one copy of each attachment, keyed by SHA-256, hard-linked into sessions.
+
+    Session attachment files are hard links to ``blobs/<aa>/<sha256><ext>``, so identical
+    uploads in any channel share one inode, and a blob whose link count drops to one is no
+    longer referenced by any session. A blob's mtime is refreshed on every upload of its
+    content. ``collect_garbage`` removes unreferenced blobs, expires blobs and derived
+    artifacts not uploaded within the retention period together with their session links,
+    then evicts the oldest blobs until the store fits its size cap.
+    """
+
+    def __init__(self, root: str | Path, sessions_dir: str | Path) -> None:
+        self.root = Path(root)
+        self.sessions_dir = Path(sessions_dir)
+        self.blobs_dir = self.root / "blobs"
+
+    def blob_path(self, digest: str, suffix: str) -> Path:
+        """Return where the blob for ``digest`` with ``suffix`` lives."""
+        return self.blobs_dir / digest[:2] / f"{digest}{suffix.lower()}"
+
+    def ingest(self, file_path: str | Path) -> Path:
+        """Move a downloaded file into the store and leave a hard link in its place.
+
+        If the content is already stored, the download is replaced by a link to the existing
+        blob. When the store is on another filesystem the file is left as-is.
+        """
+        path = Path(file_path)
+        blob = self.blob_path(file_sha256(path), path.suffix)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if blob.exists():
+                _replace_with_link(blob, path)
+            else:
+                os.link(path, blob)
+        except FileExistsError:
+            # A concurrent download of the same content created the blob first.
+            _replace_with_link(blob, path)
+        except OSError as e:
+            print(f"Attachment store skipped {path.name}: {e}")
+            return path
+        # Touch the blob so retention and size-cap eviction treat re-uploaded content as fresh.
+        os.utime(blob)
+        return blob
+
+    def _session_attachment_files(self) -> list[Path]:
+        if not self.sessions_dir.is_dir():
+            return []
+        return [
+            path
+            for path in self.sessions_dir.glob("*/attachments/*")
+            if path.is_file() and not path.name.startswith(".")
+        ]
+
+    def _blobs(self) -> list[Path]:
+        if not self.blobs_dir.is_dir():
+            return []
+        return [path for path in self.blobs_dir.glob("*/*") if path.is_file()]
+
+    def collect_garbage(
+        self,
+        *,
+        max_age_days: float = DEFAULT_RETENTION_DAYS,
+        max_bytes: int = DEFAULT_MAX_STORE_BYTES,
+        derived_dirs: tuple[Path, ...] = (),
+        now: float | None = None,
+    ) -> GarbageCollectionResult:
+        """Apply the retention period and size cap; see the class docstring."""
+        current = time.time() if now is None else now
+        cutoff = current - max_age_days * 86400
+        result = GarbageCollectionResult()
+
+        links_by_inode: dict[tuple[int, int], list[Path]] = {}
+        for path in self._session_attachment_files():
+            stat = path.stat()
+            links_by_inode.setdefault((stat.st_dev, stat.st_ino), []).append(path)
+
+        def remove_with_links(path: Path, stat: os.stat_result) -> None:
+            for link in links_by_inode.pop((stat.st_dev, stat.st_ino), []):
+                link.unlink()
+                result.session_files_removed += 1
+            path.unlink()
+            result.bytes_freed += stat.st_size
+
+        managed: set[tuple[int, int]] = set()
+        blobs: list[tuple[float, Path, os.stat_result]] = []
+        for blob in self._blobs():
+            stat = blob.stat()
+            managed.add((stat.st_dev, stat.st_ino))
+            if stat.st_nlink == 1 or stat.st_mtime < cutoff:
+                remove_with_links(blob, stat)
+                result.blobs_removed += 1
+            else:
+                blobs.append((stat.st_mtime, blob, stat))
+
+        for derived_dir in derived_dirs:
+            for path in Path(derived_dir).glob("*/*"):
+                stat = path.stat()
+                managed.add((stat.st_dev, stat.st_ino))
+                if stat.st_mtime < cutoff:
+                    remove_with_links(path, stat)
+                    result.derived_removed += 1
+
+        # Downloads that never made it into the store (older files, or a store on another
+        # filesystem) expire by their own age.
+        for key, paths in links_by_inode.items():
+            if key in managed:
+                continue
+            for path in paths:
+                stat = path.stat()
+                if stat.st_mtime < cutoff:
+                    path.unlink()
+                    result.session_files_removed += 1
+                    if stat.st_nlink == 1:
+                        result.bytes_freed += stat.st_size
+
+        store_bytes = sum(stat.st_size for _, _, stat in blobs)
+        for _, blob, stat in sorted(blobs, key=lambda item: item[0]):
+            if store_bytes <= max_bytes:
+                break
+            remove_with_links(blob, stat)
+            result.blobs_removed += 1
+            store_bytes -= stat.st_size
+
+        result.store_bytes = store_bytes
+        return result
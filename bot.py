@@ -8,6 +8,7 @@ import signal
 import uuid
 from datetime import datetime, timezone
 
+import aiohttp
 import discord
 from dotenv import load_dotenv
 
@@ -22,9 +23,25 @@ from agent_runner import (
     run_channel_message,
 )
 from atlas_config import build_channel_permissions, build_channel_settings
-from atlas_diagnostics import build_diagnostics_snapshot, format_status_report
-from atlas_utils import atomic_write_json, atomic_write_text
-from channel_configs import ChannelConfig, get_channel_config, render_channel_role_context
+from atlas_control import (
+    ControlChannelNotAllowedError,
+    ControlChannelNotFoundError,
+    create_control_app,
+    default_socket_path,
+    start_control_server,
+)
+from atlas_diagnostics import DiagnosticsCache, format_status_report
+from atlas_utils import atomic_write_json, atomic_write_text, env_number
+from attachment_pipeline import preprocess_attachments
+from attachment_store import AttachmentStore, default_store_dir
+from channel_configs import (
+    ChannelConfig,
+    get_channel_config,
+    get_channel_config_by_key,
+    normalize_channel_key,
+    render_channel_role_context,
+)
+from discord_delivery import deliver_response
 from med_config import find_med_by_content
 
 load_dotenv()
@@ -40,11 +57,39 @@ SESSIONS_DIR = os.getenv("SESSIONS_DIR", "./sessions")
 BOT_DIR = os.getenv("BOT_DIR", os.path.dirname(os.path.abspath(__file__)))
 SYSTEM_PROMPT_PATH = resolve_system_prompt_path(VAULT_PATH, os.getenv("SYSTEM_PROMPT_PATH"))
 CONTEXT_PATH = os.getenv("CONTEXT_PATH", f"{VAULT_PATH}/System/ATLAS-Context.md")
-MAX_RESPONSE_LENGTH = 1900
 
 # Supported media types for agent attachment handling (images + PDFs)
 SUPPORTED_MEDIA = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".pdf"}
 
+# Attachment download limits: parallel downloads per message, bytes per file and per message
+ATTACHMENT_DOWNLOAD_CONCURRENCY = max(int(env_number("ATLAS_ATTACHMENT_CONCURRENCY", default=4)), 1)
+ATTACHMENT_MAX_FILE_BYTES = int(
+    env_number("ATLAS_ATTACHMENT_MAX_FILE_BYTES", default=25 * 1024 * 1024)
+)
+ATTACHMENT_MAX_MESSAGE_BYTES = int(
+    env_number("ATLAS_ATTACHMENT_MAX_MESSAGE_BYTES", default=50 * 1024 * 1024)
+)
+ATTACHMENT_CHUNK_BYTES = 64 * 1024
+# Content-hash cache of downscaled images and extracted PDF text, shared across channels
+ATTACHMENT_CACHE_DIR = os.getenv(
+    "ATLAS_ATTACHMENT_CACHE_DIR", os.path.join(SESSIONS_DIR, ".attachment-cache")
+)
+# Content-addressed originals; session attachment files are hard links into this store
+ATTACHMENT_STORE_DIR = os.getenv("ATLAS_ATTACHMENT_STORE_DIR", str(default_store_dir(SESSIONS_DIR)))
+
+# Unix socket for the local control API (cron and scripts); set empty to disable
+CONTROL_SOCKET_PATH = os.getenv("ATLAS_CONTROL_SOCKET", str(default_socket_path(BOT_DIR)))
+# Channels outside the auto-activated set that control prompts may still target
+CONTROL_ALLOWED_CHANNELS = {
+    normalize_channel_key(name)
+    for name in os.getenv("ATLAS_CONTROL_ALLOWED_CHANNELS", "").split(",")
+    if name.strip()
+}
+_control_runner = None
+
+# Diagnostics for !status, collected off the event loop and reused for a short TTL
+status_snapshots = DiagnosticsCache()
+
 # Per-channel concurrency locks to prevent simultaneous agent runs
 channel_locks: dict[int, asyncio.Lock] = {}
 
@@ -138,42 +183,117 @@ def reset_channel_session(channel_id: int) -> bool:
     return cleared
 
 
-async def download_attachments(
-    channel_id: int,
-    attachments: list,
-    *,
-    channel_name: str = "",
-    channel_config: ChannelConfig | None = None,
-) -> list[str]:
-    """Download Discord attachments to session directory."""
-    if not attachments:
-        return []
+class AttachmentTooLargeError(Exception):
+    """Raised when a streamed attachment exceeds its byte limit."""
 
-    channel_dir = ensure_channel_session(
-        channel_id,
-        channel_name=channel_name,
-        channel_config=channel_config,
-    )
-    attachments_dir = os.path.join(channel_dir, "attachments")
-    os.makedirs(attachments_dir, exist_ok=True)
 
-    downloaded = []
-    for att in attachments:
-        _, ext = os.path.splitext(att.filename)
-        if ext.lower() not in SUPPORTED_MEDIA:
+async def _stream_attachment(
+    session: aiohttp.ClientSession,
+    url: str,
+    file_path: str,
+    max_bytes: int,
+) -> int:
+    """Stream an attachment URL to ``file_path``, aborting once ``max_bytes`` is exceeded."""
+    partial_path = f"{file_path}.part"
+    written = 0
+    try:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            with open(partial_path, "wb") as f:
+                async for chunk in response.content.iter_chunked(ATTACHMENT_CHUNK_BYTES):
+                    written += len(chunk)
+                    if written > max_bytes:
+                        raise AttachmentTooLargeError(f"exceeds {max_bytes} bytes")
+                    f.write(chunk)
+        os.replace(partial_path, file_path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+    return written
+
+
+def _attachment_byte_budgets(attachments: list) -> list[int | None]:
+    """Assign each supported attachment a byte limit, or ``None`` to skip it.
+
+    Declared sizes are reserved against the per-message budget in message order, so the
+    outcome does not depend on which concurrent download finishes first. Attachments with
+    no usable size (missing or ``0``) then share what is left, each capped at the
+    per-file limit.
+    """
+    budgets: list[int | None] = [None] * len(attachments)
+    remaining = ATTACHMENT_MAX_MESSAGE_BYTES
+    unknown: list[int] = []
+    for index, att in enumerate(attachments):
+        declared = getattr(att, "size", None)
+        if not isinstance(declared, int) or declared <= 0:
+            unknown.append(index)
+        elif declared > ATTACHMENT_MAX_FILE_BYTES:
+            print(f"Skipping {att.filename}: {declared} bytes exceeds the per-file limit")
+        elif declared > remaining:
+            print(f"Skipping {att.filename}: per-message attachment limit reached")
+        else:
+            remaining -= declared
+            budgets[index] = declared
+
+    for index in unknown:
+        limit = min(ATTACHMENT_MAX_FILE_BYTES, remaining)
+        if limit <= 0:
+            print(
+                f"Skipping {attachments[index].filename}: size unknown and no per-message "
+                "attachment budget left"
+            )
             continue
+        remaining -= limit
+        budgets[index] = limit
+    return budgets
+
+
+async def download_attachments(channel_id: int, attachments: list) -> list[str]:
+    """Download Discord attachments into the channel's session directory.
+
+    Supported files are streamed to disk concurrently, at most
+    ``ATTACHMENT_DOWNLOAD_CONCURRENCY`` at a time, within the per-file and per-message byte
+    limits. Each download is then deduplicated into the attachment store, so identical
+    uploads in any channel share one copy on disk. Only the attachments folder is created
+    here; the full session setup happens when the agent runs.
+    """
+    supported = [
+        att for att in attachments if os.path.splitext(att.filename)[1].lower() in SUPPORTED_MEDIA
+    ]
+    if not supported:
+        return []
+
+    attachments_dir = os.path.join(SESSIONS_DIR, str(channel_id), "attachments")
+    os.makedirs(attachments_dir, exist_ok=True)
+    semaphore = asyncio.Semaphore(ATTACHMENT_DOWNLOAD_CONCURRENCY)
+    store = AttachmentStore(ATTACHMENT_STORE_DIR, SESSIONS_DIR)
 
+    async def download(session: aiohttp.ClientSession, att, max_bytes: int) -> str | None:
         safe_name = _sanitize_attachment_filename(att.filename)
         unique_name = f"{uuid.uuid4().hex[:8]}_{safe_name}"
         file_path = os.path.join(attachments_dir, unique_name)
-
+        async with semaphore:
+            try:
+                await _stream_attachment(session, att.url, file_path, max_bytes)
+            except Exception as e:
+                print(f"Failed to download {att.filename}: {e}")
+                return None
         try:
-            await att.save(file_path)
-            downloaded.append(os.path.abspath(file_path))
-        except Exception as e:
-            print(f"Failed to download {att.filename}: {e}")
-
-    return downloaded
+            await asyncio.to_thread(store.ingest, file_path)
+        except OSError as e:
+            print(f"Attachment store failed for {att.filename}: {e}")
+        return os.path.abspath(file_path)
+
+    budgets = _attachment_byte_budgets(supported)
+    async with aiohttp.ClientSession() as session:
+        results = await asyncio.gather(
+            *(
+                download(session, att, max_bytes)
+                for att, max_bytes in zip(supported, budgets, strict=True)
+                if max_bytes is not None
+            )
+        )
+    return [path for path in results if path is not None]
 
 
 def build_prompt_with_files(content: str, file_paths: list[str]) -> str:
@@ -227,19 +347,6 @@ def build_librarian_prompt(command: str, args: str) -> str:
     return prompts[command]
 
 
-async def send_chunked_response(channel, response: str) -> None:
-    """Send a response, splitting it to fit Discord message limits."""
-    if len(response) <= MAX_RESPONSE_LENGTH:
-        await channel.send(response)
-        return
-
-    chunks = [
-        response[i : i + MAX_RESPONSE_LENGTH] for i in range(0, len(response), MAX_RESPONSE_LENGTH)
-    ]
-    for chunk in chunks:
-        await channel.send(chunk)
-
-
 def strip_bot_mentions(content: str, mentions: list) -> str:
     """Remove Discord mention syntax from message content."""
     stripped_content = content
@@ -368,7 +475,7 @@ async def handle_status_command(
     if content.lower() not in ("!status", "status", "!ops", "ops"):
         return False
 
-    snapshot = build_diagnostics_snapshot()
+    snapshot = await status_snapshots.get()
     channel_name = channel_config.key if channel_config else message.channel.name
     report = format_status_report(
         snapshot,
@@ -376,7 +483,7 @@ async def handle_status_command(
         model=get_channel_model(message.channel.id, channel_config),
         channel_resolution=_describe_channel_resolution(message, channel_config),
     )
-    await send_chunked_response(message.channel, report)
+    await deliver_response(message.channel, report)
     return True
 
 
@@ -454,7 +561,7 @@ async def handle_librarian_command(
                     channel_config=channel_config,
                 )
 
-        await send_chunked_response(message.channel, response)
+        await deliver_response(message.channel, response)
         return True
 
     return False
@@ -533,6 +640,73 @@ async def run_agent(
         return f"Error: {str(e)}"
 
 
+def resolve_control_channel(channel_id: int | None, channel_name: str | None):
+    """Find the Discord channel a control API request targets.
+
+    A channel name resolves through its ``ATLAS_CHANNEL_ID_*`` pin first, then by name
+    across the connected guilds. Like ``on_message``, only auto-activated configured
+    channels accept prompts, plus any listed in ``ATLAS_CONTROL_ALLOWED_CHANNELS``.
+    """
+    if channel_id is None and channel_name:
+        config = get_channel_config_by_key(channel_name, honor_allowlist=False)
+        pinned = os.getenv(config.channel_id_env, "") if config and config.channel_id_env else ""
+        channel_id = int(pinned) if pinned.strip().isdigit() else None
+
+    channel = client.get_channel(channel_id) if channel_id is not None else None
+    if channel is None and channel_name:
+        target_name = normalize_channel_key(channel_name)
+        matches = [
+            candidate
+            for guild in client.guilds
+            for candidate in guild.text_channels
+            if normalize_channel_key(candidate.name) == target_name
+        ]
+        if len(matches) == 1:
+            channel = matches[0]
+    if channel is None:
+        raise ControlChannelNotFoundError(f"Unknown channel: {channel_name or channel_id}")
+
+    channel_config = get_channel_config(channel_id=channel.id, channel_name=channel.name)
+    if (channel_config is None or not channel_config.auto_activate) and normalize_channel_key(
+        channel.name
+    ) not in CONTROL_ALLOWED_CHANNELS:
+        raise ControlChannelNotAllowedError(
+            f"#{channel.name} is not an auto-activated ATLAS channel; "
+            "add it to ATLAS_CONTROL_ALLOWED_CHANNELS to allow control prompts"
+        )
+    return channel
+
+
+async def run_control_prompt(channel, prompt: str) -> str:
+    """Run a control API prompt in ``channel`` as if a user had posted it there."""
+    print(f"Control prompt in #{channel.name}: {prompt[:50]}")
+    channel_config = get_channel_config(channel_id=channel.id, channel_name=channel.name)
+    async with channel.typing():
+        async with get_channel_lock(channel.id):
+            response = await run_agent(
+                channel.id,
+                prompt,
+                channel_name=channel.name,
+                channel_config=channel_config,
+            )
+    await deliver_response(channel, response)
+    return response
+
+
+async def start_control_api() -> None:
+    """Start the control API once per process; reconnects reuse the running server."""
+    global _control_runner
+    if not CONTROL_SOCKET_PATH or _control_runner is not None:
+        return
+    app = create_control_app(resolve_control_channel, run_control_prompt)
+    try:
+        _control_runner = await start_control_server(app, CONTROL_SOCKET_PATH)
+    except OSError as e:
+        print(f"Control API unavailable at {CONTROL_SOCKET_PATH}: {e}")
+        return
+    print(f"Control API listening on {CONTROL_SOCKET_PATH}")
+
+
 @client.event
 async def on_ready():
     print(f"ATLAS online as {client.user}")
@@ -540,6 +714,7 @@ async def on_ready():
         print(f"Connected to: {guild.name}")
         for channel in guild.text_channels:
             print(f"  Channel: {channel.name}")
+    await start_control_api()
 
 
 @client.event
@@ -581,14 +756,12 @@ async def on_message(message):
     # Download attachments (images, PDFs, etc.)
     downloaded_files = []
     if message.attachments:
-        downloaded_files = await download_attachments(
-            message.channel.id,
-            message.attachments,
-            channel_name=message.channel.name,
-            channel_config=channel_config,
-        )
+        downloaded_files = await download_attachments(message.channel.id, message.attachments)
         if downloaded_files:
             print(f"  Downloaded {len(downloaded_files)} attachment(s)")
+            downloaded_files = await asyncio.to_thread(
+                preprocess_attachments, downloaded_files, cache_dir=ATTACHMENT_CACHE_DIR
+            )
 
     # Check if we have something to process
     if not content and not downloaded_files:
@@ -615,7 +788,7 @@ async def on_message(message):
 
     print(f"  Response length: {len(response)}")
 
-    await send_chunked_response(message.channel, response)
+    await deliver_response(message.channel, response)
 
 
 async def log_medication_dose(med_name: str, timestamp: str) -> bool:
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Apply the attachment retention period and store size cap."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+BOT_DIR = Path(__file__).resolve().parents[1]
+if str(BOT_DIR) not in sys.path:
+    sys.path.insert(0, str(BOT_DIR))
+load_dotenv(BOT_DIR / ".env")
+
+from atlas_utils import env_number  # noqa: E402
+from attachment_store import (  # noqa: E402
+    DEFAULT_MAX_STORE_BYTES,
+    DEFAULT_RETENTION_DAYS,
+    AttachmentStore,
+    default_store_dir,
+)
+
+
+def _format_bytes(value: int) -> str:
+    return f"{value / (1024 * 1024):.1f} MiB"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Garbage-collect ATLAS attachments")
+    parser.add_argument(
+        "--max-age-days",
+        type=float,
+        default=env_number("ATLAS_ATTACHMENT_RETENTION_DAYS", default=DEFAULT_RETENTION_DAYS),
+        help="Days since last upload before an attachment is deleted",
+    )
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=int(
+            env_number("ATLAS_ATTACHMENT_STORE_MAX_BYTES", default=DEFAULT_MAX_STORE_BYTES)
+        ),
+        help="Size cap for stored attachments; the oldest are evicted first",
+    )
+    args = parser.parse_args()
+
+    sessions_dir = Path(os.getenv("SESSIONS_DIR", str(BOT_DIR / "sessions"))).expanduser()
+    if not sessions_dir.is_absolute():
+        sessions_dir = BOT_DIR / sessions_dir
+    store_dir = os.getenv("ATLAS_ATTACHMENT_STORE_DIR", str(default_store_dir(sessions_dir)))
+    cache_dir = os.getenv("ATLAS_ATTACHMENT_CACHE_DIR", str(sessions_dir / ".attachment-cache"))
+
+    result = AttachmentStore(store_dir, sessions_dir).collect_garbage(
+        max_age_days=args.max_age_days,
+        max_bytes=args.max_bytes,
+        derived_dirs=(Path(cache_dir),),
+    )
+
+    print(
+        f"Attachment GC: removed {result.session_files_removed} session files, "
+        f"{result.blobs_removed} blobs, {result.derived_removed} derived files; "
+        f"freed {_format_bytes(result.bytes_freed)}, store at {_format_bytes(result.store_bytes)}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -36,9 +36,13 @@ Any threads left incomplete or questions pending.
 
 Be concise. Use bullet points. Skip sections if nothing to report."
 
-# Send via Discord bot (ATLAS will respond and write summary)
+# Hand the prompt to the running bot over its control socket. A direct post would be
+# ignored (the bot skips its own messages), so fail loudly if the bot is unreachable.
 cd "${BOT_DIR}"
-python3 send_message.py "${SUMMARY_PROMPT}"
+if ! python3 send_message.py --transport control "${SUMMARY_PROMPT}"; then
+    echo "ERROR: ATLAS control API unavailable; daily summary was not requested" >&2
+    exit 1
+fi
 
 echo "=== Summary request sent to ATLAS at 23:55 PST ==="
 echo "=== Archive and reset will run at 23:59 PST ==="
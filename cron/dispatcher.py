@@ -14,15 +14,16 @@ import argparse
 import asyncio
 import contextlib
 import fcntl
+import hashlib
 import json
 import math
 import os
+import re
 import sys
-from datetime import datetime
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
-import aiohttp
 from croniter import croniter
 from dotenv import load_dotenv
 
@@ -33,12 +34,22 @@ if str(BOT_DIR) not in sys.path:
 
 from agent_runner import get_agent_provider, run_job_prompt  # noqa: E402
 from atlas_utils import atomic_write_text, kill_process  # noqa: E402
+from health_range import prefetch_calls as prefetch_health_range  # noqa: E402
+from mcp_prefetch import prefetch_server  # noqa: E402
+from webhook_sender import WebhookOutbox, WebhookSender, webhook_parts  # noqa: E402
 
 # Load environment variables from .env file
 load_dotenv(BOT_DIR / ".env")
 CRON_DIR = Path(__file__).parent
 JOBS_FILE = CRON_DIR / "jobs.json"
 STATE_FILE = CRON_DIR / "state" / "last_runs.json"
+RESULT_CACHE_DIR = CRON_DIR / "state" / "result_cache"
+DEFAULT_RESULT_CACHE_MAX_AGE_SECONDS = 6 * 60 * 60
+DEFAULT_PREFETCH_TIMEOUT_SECONDS = 60
+# Pseudo-server whose prefetch entries resolve through health_range.py rather than one MCP server
+HEALTH_RANGE_PREFETCH_SERVER = "health_range"
+PREFETCH_DATE_RE = re.compile(r"\{today(?:-(\d+)d)?\}")
+PREFETCH_DAY_START_RE = re.compile(r"\{day_start(?:\+(\d+)d)?\}")
 LOGS_DIR = BOT_DIR / "logs" / "cron"
 
 
@@ -167,8 +178,6 @@ def is_job_due(job: dict, state: dict, now: datetime) -> bool:
     Cron schedules in jobs.json are specified in the job's timezone, but system
     cron runs in UTC. This function converts the schedule to UTC for comparison.
     """
-    from datetime import timedelta
-
     job_id = job["id"]
     job_tz = ZoneInfo(job.get("timezone", "UTC"))
 
@@ -238,6 +247,204 @@ async def run_shell_command(job: dict) -> tuple[str, bool]:
         return f"Error executing command: {str(e)}", False
 
 
+def _render_job_template(template: str, *, vault_path: str) -> str:
+    """Substitute the stable path placeholders used in job prompts and inputs."""
+    return template.replace("{vault_path}", vault_path).replace("{bot_dir}", str(BOT_DIR))
+
+
+def _fingerprint_input_path(path: Path) -> dict:
+    """Describe one declared cache input by content hash (files) or file mtimes (dirs)."""
+    if path.is_file():
+        stat = path.stat()
+        return {
+            "path": str(path),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+        }
+    if path.is_dir():
+        entries = []
+        for child in sorted(path.rglob("*")):
+            if child.is_file():
+                stat = child.stat()
+                entries.append([str(child.relative_to(path)), stat.st_mtime_ns, stat.st_size])
+        return {"path": str(path), "files": entries}
+    return {"path": str(path), "missing": True}
+
+
+def compute_input_fingerprint(cache_config: dict, *, vault_path: str) -> str:
+    """Hash a job's declared cache inputs into a stable fingerprint."""
+    parts: list = []
+    for raw_path in cache_config.get("inputs") or []:
+        parts.append(
+            _fingerprint_input_path(Path(_render_job_template(raw_path, vault_path=vault_path)))
+        )
+
+    if cache_config.get("vault_index"):
+        index_path = Path(vault_path) / "System" / "vault-index.json"
+        try:
+            generated_at = json.loads(index_path.read_text()).get("generated_at")
+        except (OSError, json.JSONDecodeError, AttributeError):
+            generated_at = None
+        parts.append({"vault_index_generated_at": generated_at})
+
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+def _result_cache_key(job: dict, *, provider: str, vault_path: str) -> str:
+    """Key a job result on its prompt template, execution settings, and input fingerprint."""
+    key_material = {
+        "prompt": _render_job_template(job["prompt"], vault_path=vault_path),
+        "provider": provider,
+        "model": job.get("model", "opus"),
+        "allowed_tools": job.get("allowed_tools", ["Read"]),
+        "reasoning_effort": job.get("reasoning_effort"),
+        "inputs": compute_input_fingerprint(job["result_cache"], vault_path=vault_path),
+    }
+    return hashlib.sha256(json.dumps(key_material, sort_keys=True).encode()).hexdigest()
+
+
+def _result_cache_file(job_id: str) -> Path:
+    return RESULT_CACHE_DIR / f"{job_id}.json"
+
+
+def _resolve_result_cache_max_age(cache_config: dict) -> int:
+    try:
+        return int(cache_config.get("max_age_seconds", DEFAULT_RESULT_CACHE_MAX_AGE_SECONDS))
+    except (TypeError, ValueError):
+        return DEFAULT_RESULT_CACHE_MAX_AGE_SECONDS
+
+
+def load_cached_result(job_id: str, cache_key: str, *, max_age_seconds: int) -> str | None:
+    """Return a cached job output when the key matches and the entry is fresh enough."""
+    cache_file = _result_cache_file(job_id)
+    try:
+        entry = json.loads(cache_file.read_text())
+        stored_at = datetime.fromisoformat(entry["stored_at"])
+    except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+
+    if entry.get("key") != cache_key:
+        return None
+    age_seconds = (datetime.now(ZoneInfo("UTC")) - stored_at).total_seconds()
+    if age_seconds < 0 or age_seconds > max_age_seconds:
+        return None
+    output = entry.get("output")
+    return output if isinstance(output, str) else None
+
+
+def store_cached_result(job_id: str, cache_key: str, output: str) -> None:
+    """Persist a successful job output for later cache hits."""
+    entry = {
+        "key": cache_key,
+        "stored_at": datetime.now(ZoneInfo("UTC")).isoformat(),
+        "output": output,
+    }
+    atomic_write_text(_result_cache_file(job_id), json.dumps(entry, indent=2))
+
+
+def _render_prefetch_value(value: object, *, today: date, tz: tzinfo = timezone.utc) -> object:
+    """Substitute date placeholders in prefetch arguments.
+
+    ``{today}``, ``{today-Nd}`` and ``{yesterday}`` become ISO dates; ``{day_start}`` and
+    ``{day_start+Nd}`` become RFC 3339 timestamps for local midnight in ``tz``, as the
+    calendar tools expect.
+    """
+    if isinstance(value, str):
+        value = value.replace("{yesterday}", "{today-1d}")
+        value = PREFETCH_DAY_START_RE.sub(
+            lambda match: datetime.combine(
+                today + timedelta(days=int(match.group(1) or 0)), time(), tzinfo=tz
+            ).isoformat(),
+            value,
+        )
+        return PREFETCH_DATE_RE.sub(
+            lambda match: (today - timedelta(days=int(match.group(1) or 0))).isoformat(),
+            value,
+        )
+    if isinstance(value, list):
+        return [_render_prefetch_value(item, today=today, tz=tz) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: _render_prefetch_value(item, today=today, tz=tz) for key, item in value.items()
+        }
+    return value
+
+
+def _group_prefetch_calls(
+    prefetch: list, *, today: date, tz: tzinfo = timezone.utc
+) -> dict[str, list[dict]]:
+    """Group a job's prefetch entries by MCP server with rendered arguments."""
+    grouped: dict[str, list[dict]] = {}
+    for entry in prefetch:
+        if not isinstance(entry, dict) or not entry.get("server") or not entry.get("tool"):
+            continue
+        grouped.setdefault(entry["server"], []).append(
+            {
+                "name": entry.get("name") or entry["tool"],
+                "tool": entry["tool"],
+                "args": _render_prefetch_value(entry.get("args") or {}, today=today, tz=tz),
+            }
+        )
+    return grouped
+
+
+def _format_prefetch_section(results: list[tuple[str, dict]]) -> str:
+    """Render prefetched tool results as a prompt section."""
+    lines = [
+        "## Prefetched Data",
+        "",
+        "The dispatcher already fetched the data below. Use it instead of calling the "
+        "matching tools; only call a tool yourself when its entry reports an error.",
+    ]
+    for server, result in results:
+        source = (
+            "health_range.py: merged WHOOP/Garmin range tools"
+            if server == HEALTH_RANGE_PREFETCH_SERVER
+            else f"mcp__{server}__{result.get('tool')}"
+        )
+        lines.extend(["", f"### {result.get('name')} (`{source}`)", ""])
+        if "error" in result:
+            lines.append(f"Error: {result['error']}")
+        else:
+            lines.extend(["```json", json.dumps(result.get("data"), indent=2), "```"])
+    return "\n".join(lines)
+
+
+async def _prefetch_group(server: str, calls: list[dict], *, timeout: int) -> list[dict]:
+    """Run one server's prefetch calls; ``health_range`` merges the WHOOP/Garmin range tools."""
+    if server == HEALTH_RANGE_PREFETCH_SERVER:
+        return await prefetch_health_range(calls, timeout=timeout, env=_build_shell_env())
+    return await prefetch_server(server, calls, timeout=timeout, env=_build_shell_env())
+
+
+async def run_prefetch(job: dict, *, now: datetime) -> str:
+    """Resolve a job's ``prefetch`` entries concurrently and return the prompt section."""
+    grouped = _group_prefetch_calls(
+        job.get("prefetch") or [], today=now.date(), tz=now.tzinfo or timezone.utc
+    )
+    if not grouped:
+        return ""
+
+    try:
+        timeout = int(job.get("prefetch_timeout_seconds", DEFAULT_PREFETCH_TIMEOUT_SECONDS))
+    except (TypeError, ValueError):
+        timeout = DEFAULT_PREFETCH_TIMEOUT_SECONDS
+
+    servers = list(grouped)
+    server_results = await asyncio.gather(
+        *(_prefetch_group(server, grouped[server], timeout=timeout) for server in servers)
+    )
+    results = [
+        (server, result)
+        for server, results_for_server in zip(servers, server_results, strict=True)
+        for result in results_for_server
+    ]
+    failures = sum(1 for _, result in results if "error" in result)
+    log(f"Prefetched {len(results) - failures}/{len(results)} tool results for {job.get('id')}")
+    return _format_prefetch_section(results)
+
+
 async def run_agent_job(job: dict) -> tuple[str, bool]:
     """Execute the active agent CLI with a job prompt. Returns (output, success)."""
     provider = get_agent_provider()
@@ -249,14 +456,44 @@ async def run_agent_job(job: dict) -> tuple[str, bool]:
     tz = ZoneInfo(job.get("timezone", "America/Los_Angeles"))
     now = datetime.now(tz)
     vault_path = os.getenv("VAULT_PATH", "")
-    prompt = (
-        job["prompt"]
-        .replace("{current_datetime}", now.strftime("%A, %B %d, %Y at %I:%M %p %Z"))
-        .replace("{vault_path}", vault_path)
-        .replace("{bot_dir}", str(BOT_DIR))
+    prompt = _render_job_template(
+        job["prompt"].replace("{current_datetime}", now.strftime("%A, %B %d, %Y at %I:%M %p %Z")),
+        vault_path=vault_path,
     )
 
-    return await run_job_prompt(
+    # Jobs that only act on a file (such as today's workout log) skip the prefetch and
+    # the provider run entirely when it is missing.
+    required_path = job.get("run_if_exists")
+    if required_path:
+        rendered_path = _render_prefetch_value(
+            _render_job_template(str(required_path), vault_path=vault_path), today=now.date()
+        )
+        if not Path(rendered_path).exists():
+            log(f"Skipping {job.get('id')}: {rendered_path} does not exist")
+            return "", True
+
+    # Opt-in result cache: the key deliberately ignores {current_datetime} so identical
+    # inputs within max_age_seconds reuse the previous output instead of a provider run.
+    job_id = job.get("id")
+    cache_config = job.get("result_cache")
+    cache_key = None
+    if job_id and isinstance(cache_config, dict):
+        cache_key = _result_cache_key(job, provider=provider, vault_path=vault_path)
+        cached_output = load_cached_result(
+            job_id,
+            cache_key,
+            max_age_seconds=_resolve_result_cache_max_age(cache_config),
+        )
+        if cached_output is not None:
+            log(f"Result cache hit for {job_id}; skipping provider run")
+            return cached_output, True
+
+    if job.get("prefetch"):
+        prefetch_section = await run_prefetch(job, now=now)
+        if prefetch_section:
+            prompt = f"{prompt}\n\n{prefetch_section}"
+
+    output, success = await run_job_prompt(
         prompt=prompt,
         model=model,
         allowed_tools=job.get("allowed_tools", ["Read"]),
@@ -264,8 +501,13 @@ async def run_agent_job(job: dict) -> tuple[str, bool]:
         bot_dir=str(BOT_DIR),
         vault_path=vault_path,
         reasoning_effort=reasoning_effort,
+        prompt_cache=bool(job.get("prompt_cache", True)),
     )
 
+    if cache_key and success and not _is_expected_empty_output(output):
+        store_cached_result(job_id, cache_key, output)
+    return output, success
+
 
 async def run_claude(job: dict) -> tuple[str, bool]:
     """Backward-compatible wrapper for older imports/tests."""
@@ -290,33 +532,67 @@ def resolve_webhook_url(notify_config: dict) -> tuple[str | None, str | None]:
     return None, None
 
 
-async def send_webhook(content: str, notify_config: dict) -> bool:
-    """Send to Discord webhook."""
+_webhook_sender: WebhookSender | None = None
+
+
+def get_webhook_sender() -> WebhookSender:
+    """Return the webhook sender shared by every notification in this dispatcher run."""
+    global _webhook_sender
+    if _webhook_sender is None:
+        _webhook_sender = WebhookSender()
+    return _webhook_sender
+
+
+async def close_webhook_sender() -> None:
+    """Close the shared webhook sender's pooled session."""
+    global _webhook_sender
+    if _webhook_sender is not None:
+        await _webhook_sender.close()
+        _webhook_sender = None
+
+
+def webhook_outbox() -> WebhookOutbox:
+    """Return the outbox of notifications awaiting redelivery, stored beside the state file."""
+    return WebhookOutbox(STATE_FILE.with_name("webhook_outbox.json"))
+
+
+async def deliver_webhook_parts(notify_config: dict, parts: list[dict]) -> int:
+    """Post webhook parts for a notify config; return how many were delivered."""
     url, url_env = resolve_webhook_url(notify_config)
     if not url:
         log(f"Webhook URL not found in fallback chain for: {notify_config.get('url_env')}")
-        return False
+        return 0
     if url_env != notify_config.get("url_env", "DISCORD_WEBHOOK_URL"):
         log(f"Webhook env fallback: {notify_config.get('url_env')} -> {url_env}")
 
-    username = notify_config.get("username", "ATLAS Cron")
-
-    # Discord has 2000 char limit, use 1900 to be safe
-    chunks = [content[i : i + 1900] for i in range(0, len(content), 1900)]
-
     try:
-        async with aiohttp.ClientSession() as session:
-            for chunk in chunks:
-                async with session.post(url, json={"content": chunk, "username": username}) as resp:
-                    if resp.status not in (200, 204):
-                        log(f"Webhook failed with status {resp.status}")
-                        return False
-                await asyncio.sleep(0.5)  # Rate limiting
-        return True
+        return await get_webhook_sender().send_parts(url, parts)
     except Exception as e:
         log(f"Webhook error: {e}")
+        return 0
+
+
+async def send_webhook(content: str, notify_config: dict) -> bool:
+    """Send to Discord webhook, queueing anything undelivered for the next dispatcher run."""
+    if resolve_webhook_url(notify_config)[0] is None:
+        log(f"Webhook URL not found in fallback chain for: {notify_config.get('url_env')}")
         return False
 
+    parts = webhook_parts(content, username=notify_config.get("username", "ATLAS Cron"))
+    sent = await deliver_webhook_parts(notify_config, parts)
+    if sent < len(parts):
+        webhook_outbox().enqueue(notify_config, parts[sent:])
+        log(f"Queued {len(parts) - sent} webhook message(s) for retry on the next run")
+        return False
+    return True
+
+
+async def flush_webhook_outbox() -> None:
+    """Retry notifications that failed on earlier dispatcher runs."""
+    delivered = await webhook_outbox().flush(deliver_webhook_parts)
+    if delivered:
+        log(f"Delivered {delivered} queued webhook notification(s)")
+
 
 async def execute_job(job: dict) -> bool:
     """Run a single job. Returns success status."""
@@ -396,6 +672,21 @@ async def main(run_now: str | None = None):
         log("No jobs defined")
         return
 
+    try:
+        await flush_webhook_outbox()
+        await run_due_jobs(jobs, now, run_now=run_now)
+    finally:
+        await close_webhook_sender()
+
+    # If --run-now was specified but job wasn't found
+    if run_now and not any(j.get("id") == run_now for j in jobs):
+        log(f"Job not found: {run_now}")
+        log(f"Available jobs: {[j.get('id') for j in jobs]}")
+        sys.exit(1)
+
+
+async def run_due_jobs(jobs: list[dict], now: datetime, *, run_now: str | None = None) -> None:
+    """Run each job that is due, or only ``run_now`` when given, recording state."""
     for job in jobs:
         job_id = job.get("id")
         if not job_id:
@@ -464,12 +755,6 @@ async def main(run_now: str | None = None):
             else:
                 log(f"Job {job_id} failed ({job_state['failures']}/3) - will retry next run")
 
-    # If --run-now was specified but job wasn't found
-    if run_now and not any(j.get("id") == run_now for j in jobs):
-        log(f"Job not found: {run_now}")
-        log(f"Available jobs: {[j.get('id') for j in jobs]}")
-        sys.exit(1)
-
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="ATLAS Cron Job Dispatcher")
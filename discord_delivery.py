@@ -0,0 +1,109 @@
+"""Discord message delivery: boundary-aware chunking, file fallback and send pacing."""
+
+from __future__ import annotations
+
+import io
+import re
+
+import discord
+
+from atlas_utils import env_number
+from rate_limit import TokenBucket
+
+# Discord rejects messages over 2000 characters; leave room for fence repair.
+MAX_MESSAGE_CHARS = 1900
+# Replies longer than this are sent as one file instead of a run of messages.
+FILE_THRESHOLD_CHARS = int(env_number("ATLAS_DISCORD_FILE_THRESHOLD", default=6000))
+RESPONSE_FILENAME = "response.md"
+# Opening section of a file reply that is also posted inline.
+FILE_PREVIEW_CHARS = 800
+
+# Discord allows about five messages per five seconds in a channel.
+CHANNEL_SEND_RATE = 1.0
+CHANNEL_SEND_BURST = 5
+
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+
+
+_channel_buckets: dict[object, TokenBucket] = {}
+
+
+def channel_bucket(key: object) -> TokenBucket:
+    """Return the send bucket shared by everything posting to ``key`` in this process."""
+    bucket = _channel_buckets.get(key)
+    if bucket is None:
+        bucket = _channel_buckets[key] = TokenBucket(CHANNEL_SEND_RATE, CHANNEL_SEND_BURST)
+    return bucket
+
+
+def _cut_point(text: str, limit: int) -> int:
+    """Return where to end a chunk of ``text``: a paragraph, line, then word boundary."""
+    window = text[:limit]
+    floor = limit // 2
+    for separator in ("\n\n", "\n", " "):
+        index = window.rfind(separator)
+        if index >= floor:
+            return index
+    return limit
+
+
+def _open_fence(chunk: str, fence: str | None) -> str | None:
+    """Return the opening line of a code fence left open at the end of ``chunk``."""
+    for line in chunk.split("\n"):
+        if _FENCE_RE.match(line):
+            fence = None if fence else line.strip()
+    return fence
+
+
+def split_message(text: str, limit: int = MAX_MESSAGE_CHARS) -> list[str]:
+    """Split ``text`` into Discord-sized chunks without breaking words or code blocks.
+
+    Chunks are packed as full as possible and end on the last paragraph break, else line
+    break, else space in the second half of the window. A code fence open at a cut is
+    closed in that chunk and reopened, with its language tag, at the start of the next.
+    """
+    text = text.strip("\n")
+    chunks: list[str] = []
+    fence: str | None = None
+    while text:
+        prefix = f"{fence}\n" if fence else ""
+        body_limit = limit - len(prefix)
+        if len(text) <= body_limit:
+            chunks.append(prefix + text)
+            break
+        # Reserve room for a closing fence in case this chunk ends inside a code block.
+        cut = _cut_point(text, body_limit - 4)
+        body = text[:cut].rstrip()
+        fence = _open_fence(body, fence)
+        chunks.append(prefix + body + (f"\n{fence.lstrip()[:3]}" if fence else ""))
+        text = text[cut:].lstrip("\n" if fence else "\n ")
+    return [chunk for chunk in chunks if chunk.strip()]
+
+
+def response_file(text: str) -> discord.File:
+    """Wrap a long reply as a Markdown attachment."""
+    return discord.File(io.BytesIO(text.encode("utf-8")), filename=RESPONSE_FILENAME)
+
+
+def file_preview(text: str) -> str:
+    """Return the message posted alongside a reply sent as a file."""
+    note = f"*Full response ({len(text):,} characters) attached as `{RESPONSE_FILENAME}`.*"
+    opening = split_message(text, FILE_PREVIEW_CHARS)
+    return f"{opening[0]}\n\n{note}" if opening else note
+
+
+async def deliver_response(channel, response: str) -> None:
+    """Send a reply to a Discord channel, paced by the channel's token bucket.
+
+    Replies up to ``FILE_THRESHOLD_CHARS`` go out as boundary-aware chunks; longer ones are
+    sent as a single Markdown file with the opening section inline.
+    """
+    bucket = channel_bucket(getattr(channel, "id", channel))
+    if len(response) > FILE_THRESHOLD_CHARS:
+        await bucket.acquire()
+        await channel.send(file_preview(response), file=response_file(response))
+        return
+
+    for chunk in split_message(response) or [response]:
+        await bucket.acquire()
+        await channel.send(chunk)
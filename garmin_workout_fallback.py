@@ -8,7 +8,8 @@ import importlib
 import json
 import os
 import warnings
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -38,6 +39,7 @@ GARMIN_ACTIVITY_TOOL_NAMES = (
 )
 GARMIN_TOOL_PREFIX = "mcp__garmin__"
 READINESS_MORNING_CONTEXT = "AFTER_WAKEUP_RESET"
+FETCH_CONCURRENCY = 5
 
 
 class GarminFallbackError(RuntimeError):
@@ -511,6 +513,66 @@ def _resolve_body_battery_impact(
     return fallback_value
 
 
+def _fetch_sleep(
+    client: GarminClientProtocol,
+    *,
+    activity_date: str,
+    auth_home: Path,
+    warnings_list: list[str],
+) -> GarminSleepSummary | None:
+    """Resolve the profile display name, then fetch sleep; the only dependent follow-up."""
+    profile = {}
+    try:
+        profile = client.profile
+    except Exception as exc:
+        if _is_auth_error(str(exc)):
+            raise GarminTokensExpiredError(
+                f"Garmin auth in {auth_home} is no longer valid: {exc}",
+                hint="Refresh the local Garmin login so the configured token directory contains a valid session.",
+            ) from exc
+        warnings_list.append(f"Garmin profile unavailable: {exc}")
+
+    display_name = profile.get("displayName") if isinstance(profile, dict) else None
+    if not isinstance(display_name, str) or not display_name:
+        warnings_list.append("Sleep unavailable: Garmin profile did not include a display name.")
+        return None
+    return _best_effort(
+        lambda: _normalize_sleep(
+            _connectapi(
+                client,
+                f"/wellness-service/wellness/dailySleepData/{display_name}",
+                auth_home=auth_home,
+                optional=True,
+                params={"date": activity_date, "nonSleepBufferMinutes": 60},
+            )
+        ),
+        warnings_list,
+        "Sleep unavailable",
+    )
+
+
+def _run_concurrently(
+    fetchers: Sequence[Callable[[list[str]], Any]],
+    warnings_list: list[str],
+) -> list[Any]:
+    """Run independent best-effort fetchers in a thread pool.
+
+    Each fetcher collects warnings in its own list; they are merged in fetcher order so the
+    output matches a sequential run. Errors that ``_best_effort`` re-raises propagate from
+    the first failing fetcher in that order.
+    """
+    task_warnings: list[list[str]] = [[] for _ in fetchers]
+    with ThreadPoolExecutor(max_workers=min(len(fetchers), FETCH_CONCURRENCY)) as executor:
+        futures = [
+            executor.submit(fetcher, fetcher_warnings)
+            for fetcher, fetcher_warnings in zip(fetchers, task_warnings, strict=True)
+        ]
+    results = [future.result() for future in futures]
+    for fetcher_warnings in task_warnings:
+        warnings_list.extend(fetcher_warnings)
+    return results
+
+
 def fetch_workout_snapshot(
     *,
     activity_date: str | None = None,
@@ -557,91 +619,79 @@ def fetch_workout_snapshot(
     if not isinstance(summary_dto, dict):
         summary_dto = {}
 
-    warnings_list: list[str] = []
-    readiness = _best_effort(
-        lambda: _normalize_readiness(
-            _connectapi(
-                resolved_client,
-                f"/metrics-service/metrics/trainingreadiness/{resolved_date}",
-                auth_home=resolved_auth_home,
-                optional=True,
-            )
-        ),
-        warnings_list,
-        "Training readiness unavailable",
-    )
-    hrv = _best_effort(
-        lambda: _normalize_hrv(
-            _connectapi(
-                resolved_client,
-                f"/hrv-service/hrv/{resolved_date}",
-                auth_home=resolved_auth_home,
-                optional=True,
-            )
-        ),
-        warnings_list,
-        "HRV unavailable",
-    )
-
-    profile = {}
-    try:
-        profile = resolved_client.profile
-    except Exception as exc:
-        if _is_auth_error(str(exc)):
-            raise GarminTokensExpiredError(
-                f"Garmin auth in {resolved_auth_home} is no longer valid: {exc}",
-                hint="Refresh the local Garmin login so the configured token directory contains a valid session.",
-            ) from exc
-        warnings_list.append(f"Garmin profile unavailable: {exc}")
-
-    sleep = None
-    display_name = profile.get("displayName") if isinstance(profile, dict) else None
-    if isinstance(display_name, str) and display_name:
-        sleep = _best_effort(
-            lambda: _normalize_sleep(
+    def fetch_readiness(task_warnings: list[str]) -> Any:
+        return _best_effort(
+            lambda: _normalize_readiness(
                 _connectapi(
                     resolved_client,
-                    f"/wellness-service/wellness/dailySleepData/{display_name}",
+                    f"/metrics-service/metrics/trainingreadiness/{resolved_date}",
                     auth_home=resolved_auth_home,
                     optional=True,
-                    params={"date": resolved_date, "nonSleepBufferMinutes": 60},
                 )
             ),
-            warnings_list,
-            "Sleep unavailable",
+            task_warnings,
+            "Training readiness unavailable",
         )
-    else:
-        warnings_list.append("Sleep unavailable: Garmin profile did not include a display name.")
 
-    hr_zones = _best_effort(
-        lambda: (
-            _normalize_hr_zones(
+    def fetch_hrv(task_warnings: list[str]) -> Any:
+        return _best_effort(
+            lambda: _normalize_hrv(
                 _connectapi(
                     resolved_client,
-                    f"/activity-service/activity/{resolved_activity_id}/hrTimeInZones",
+                    f"/hrv-service/hrv/{resolved_date}",
                     auth_home=resolved_auth_home,
                     optional=True,
                 )
-            )
-            or []
-        ),
-        warnings_list,
-        "Heart-rate zones unavailable",
-    )
-    if hr_zones is None:
-        hr_zones = []
+            ),
+            task_warnings,
+            "HRV unavailable",
+        )
 
-    body_battery_impact = _best_effort(
-        lambda: _resolve_body_battery_impact(
+    def fetch_sleep(task_warnings: list[str]) -> Any:
+        return _fetch_sleep(
             resolved_client,
-            activity_id=resolved_activity_id,
             activity_date=resolved_date,
             auth_home=resolved_auth_home,
-            fallback_value=_safe_int(summary_dto.get("differenceBodyBattery")),
-        ),
+            warnings_list=task_warnings,
+        )
+
+    def fetch_hr_zones(task_warnings: list[str]) -> Any:
+        return _best_effort(
+            lambda: (
+                _normalize_hr_zones(
+                    _connectapi(
+                        resolved_client,
+                        f"/activity-service/activity/{resolved_activity_id}/hrTimeInZones",
+                        auth_home=resolved_auth_home,
+                        optional=True,
+                    )
+                )
+                or []
+            ),
+            task_warnings,
+            "Heart-rate zones unavailable",
+        )
+
+    def fetch_body_battery_impact(task_warnings: list[str]) -> Any:
+        return _best_effort(
+            lambda: _resolve_body_battery_impact(
+                resolved_client,
+                activity_id=resolved_activity_id,
+                activity_date=resolved_date,
+                auth_home=resolved_auth_home,
+                fallback_value=_safe_int(summary_dto.get("differenceBodyBattery")),
+            ),
+            task_warnings,
+            "Body battery impact unavailable",
+        )
+
+    warnings_list: list[str] = []
+    readiness, hrv, sleep, hr_zones, body_battery_impact = _run_concurrently(
+        [fetch_readiness, fetch_hrv, fetch_sleep, fetch_hr_zones, fetch_body_battery_impact],
         warnings_list,
-        "Body battery impact unavailable",
     )
+    if hr_zones is None:
+        hr_zones = []
 
     duration_seconds = _safe_float(
         _coalesce(summary_dto.get("duration"), selected_activity.get("duration"))
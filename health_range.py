@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Merge WHOOP and Garmin batched range tools into one per-day health table.
+
+Cron jobs get the merged table through a ``prefetch`` entry with ``"server": "health_range"``
+(see ``prefetch_calls``); the CLI prints the same table for ad-hoc lookups.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from mcp_prefetch import prefetch_server
+
+RANGE_TOOLS = {
+    "whoop": "get_daily_summary_range",
+    "garmin": "get_daily_health_range",
+}
+DEFAULT_PROVIDERS = ("whoop", "garmin")
+DEFAULT_RANGE_DAYS = 28
+DEFAULT_TIMEOUT_SECONDS = 120
+PREFETCH_TOOL = "get_health_range"
+
+
+def merge_range_tables(start_date: str, end_date: str, tables: dict[str, Any]) -> dict[str, Any]:
+    """Join provider tables on ``date`` and prefix each provider's columns with its name."""
+    start_day = date.fromisoformat(start_date)
+    days = [
+        (start_day + timedelta(days=offset)).isoformat()
+        for offset in range((date.fromisoformat(end_date) - start_day).days + 1)
+    ]
+    columns = ["date"]
+    rows: dict[str, list[Any]] = {day: [day] for day in days}
+    errors: dict[str, Any] = {}
+
+    for provider, table in tables.items():
+        if not isinstance(table, dict) or "columns" not in table:
+            error = table.get("error") if isinstance(table, dict) else None
+            errors[provider] = error or "No range table returned"
+            continue
+        if table.get("errors"):
+            errors[provider] = table["errors"]
+
+        provider_columns = [column for column in table["columns"] if column != "date"]
+        date_index = table["columns"].index("date")
+        value_indexes = [table["columns"].index(column) for column in provider_columns]
+        by_day = {row[date_index]: row for row in table.get("rows") or []}
+        columns.extend(f"{provider}_{column}" for column in provider_columns)
+        for day in days:
+            row = by_day.get(day)
+            rows[day].extend(row[index] if row else None for index in value_indexes)
+
+    merged: dict[str, Any] = {
+        "start_date": start_date,
+        "end_date": end_date,
+        "columns": columns,
+        "rows": [rows[day] for day in days],
+    }
+    if errors:
+        merged["errors"] = errors
+    return merged
+
+
+async def fetch_health_range(
+    start_date: str,
+    end_date: str,
+    *,
+    providers: Sequence[str] = DEFAULT_PROVIDERS,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    env: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Fetch every provider's batched range tool concurrently and merge the results."""
+    if date.fromisoformat(end_date) < date.fromisoformat(start_date):
+        raise ValueError("end_date must be on or after start_date")
+
+    call_args = {"start_date": start_date, "end_date": end_date}
+    results = await asyncio.gather(
+        *(
+            prefetch_server(
+                provider,
+                [{"name": provider, "tool": RANGE_TOOLS[provider], "args": call_args}],
+                timeout=timeout,
+                env=env,
+            )
+            for provider in providers
+        )
+    )
+    tables = {
+        provider: result[0].get("data") if "data" in result[0] else {"error": result[0]["error"]}
+        for provider, result in zip(providers, results, strict=True)
+    }
+    return merge_range_tables(start_date, end_date, tables)
+
+
+async def prefetch_calls(
+    calls: Sequence[dict[str, Any]],
+    *,
+    timeout: float,
+    env: dict[str, str] | None = None,
+) -> list[dict[str, Any]]:
+    """Resolve dispatcher prefetch calls for the merged table, one result per call.
+
+    Matches ``mcp_prefetch.prefetch_server`` so the dispatcher can treat ``health_range``
+    as another prefetch server. Each call takes ``start_date``, ``end_date`` and optional
+    ``providers`` args.
+    """
+
+    async def resolve(call: dict[str, Any]) -> dict[str, Any]:
+        tool_name = call.get("tool")
+        result: dict[str, Any] = {"name": call.get("name") or tool_name, "tool": tool_name}
+        if tool_name != PREFETCH_TOOL:
+            result["error"] = f"Unknown tool: {tool_name}"
+            return result
+        args = call.get("args") or {}
+        providers = args.get("providers") or DEFAULT_PROVIDERS
+        unknown = sorted(set(providers) - set(RANGE_TOOLS))
+        try:
+            if unknown:
+                raise ValueError(f"Unsupported providers: {', '.join(unknown)}")
+            result["data"] = await fetch_health_range(
+                str(args["start_date"]),
+                str(args["end_date"]),
+                providers=providers,
+                timeout=timeout,
+                env=env,
+            )
+        except (KeyError, ValueError) as exc:
+            result["error"] = f"{exc.__class__.__name__}: {exc}"
+        return result
+
+    return list(await asyncio.gather(*(resolve(call) for call in calls)))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point for cross-provider health trend lookups."""
+    today = datetime.now().astimezone().date()
+    parser = argparse.ArgumentParser(description="Fetch a merged WHOOP/Garmin per-day table.")
+    parser.add_argument(
+        "--start",
+        default=(today - timedelta(days=DEFAULT_RANGE_DAYS - 1)).isoformat(),
+        help=f"First date (YYYY-MM-DD). Defaults to {DEFAULT_RANGE_DAYS} days ago.",
+    )
+    parser.add_argument("--end", default=today.isoformat(), help="Last date (YYYY-MM-DD).")
+    parser.add_argument(
+        "--providers",
+        default=",".join(DEFAULT_PROVIDERS),
+        help="Comma-separated providers to include (whoop, garmin).",
+    )
+    args = parser.parse_args(argv)
+
+    providers = [provider.strip() for provider in args.providers.split(",") if provider.strip()]
+    unknown = sorted(set(providers) - set(RANGE_TOOLS))
+    if unknown:
+        parser.error(f"Unsupported providers: {', '.join(unknown)}")
+
+    try:
+        merged = asyncio.run(fetch_health_range(args.start, args.end, providers=providers))
+    except ValueError as exc:
+        print(json.dumps({"error": str(exc)}))
+        return 1
+
+    print(json.dumps(merged, separators=(",", ":")))
+    return 0 if len(merged.get("errors") or {}) < len(providers) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,6 +6,8 @@ from __future__ import annotations
 import logging
 import os
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import structlog
@@ -45,13 +47,15 @@ from mcp.server import FastMCP
 from mcp.server.fastmcp import Context
 
 from src.auth_manager import GarminAuthManager, RecoverableTokenError, UnrecoverableTokenError
-from src.garmin_api.client import GarminAPIClient
+from src.garmin_api.client import GarminAPIClient, build_response_cache
 from src.garmin_mcp import tools
 
 logger = structlog.get_logger(__name__)
 
+response_cache = build_response_cache()
+
 try:
-    api_client = GarminAPIClient()
+    api_client = GarminAPIClient(cache=response_cache)
     tools.set_api_client(api_client)
     logger.info("Garmin token manager initialized")
 except UnrecoverableTokenError as exc:
@@ -61,15 +65,28 @@ except UnrecoverableTokenError as exc:
     ) from exc
 except RecoverableTokenError as exc:  # pragma: no cover - transient startup warning
     logger.warning("Garmin initialization warning", error=str(exc))
-    api_client = GarminAPIClient(GarminAuthManager(validate_on_init=False))
+    api_client = GarminAPIClient(GarminAuthManager(validate_on_init=False), response_cache)
     tools.set_api_client(api_client)
 except Exception as exc:  # pragma: no cover - startup warning path
     logger.warning("Unexpected Garmin initialization warning", error=str(exc))
-    api_client = GarminAPIClient(GarminAuthManager(validate_on_init=False))
+    api_client = GarminAPIClient(GarminAuthManager(validate_on_init=False), response_cache)
     tools.set_api_client(api_client)
 
+
+@asynccontextmanager
+async def garmin_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Shut down the Garmin worker pool and response cache when the server stops."""
+    try:
+        yield
+    finally:
+        tools.shutdown_executor()
+        if response_cache is not None:
+            response_cache.close()
+
+
 mcp = FastMCP(
     name="garmin",
+    lifespan=garmin_lifespan,
     instructions=(
         "Repo-managed Garmin Connect MCP server for ATLAS. Prefer get_activities_fordate and "
         "get_activity for workout logging compatibility, and use the normalized daily tools for "
@@ -159,6 +176,19 @@ async def get_body_battery_events(context: Context, date: str) -> dict[str, obje
     return await tools.get_body_battery_events_tool(context, date)
 
 
+@mcp.tool(name="get_daily_health_range")
+async def get_daily_health_range(
+    context: Context,
+    start_date: str,
+    end_date: str,
+) -> dict[str, object]:
+    """Get a compact per-day Garmin table (steps, sleep, HRV, readiness, body battery).
+
+    Prefer this over per-day calls for trends across a date range.
+    """
+    return await tools.get_daily_health_range_tool(context, start_date, end_date)
+
+
 if __name__ == "__main__":
     logger.info("Starting Garmin MCP server")
     mcp.run()
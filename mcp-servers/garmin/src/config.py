@@ -18,6 +18,11 @@ def default_repo_token_dir() -> Path:
     return repo_root() / "mcp-servers" / "credentials" / "garminconnect"
 
 
+def default_cache_path() -> Path:
+    """Return the default Garmin response cache database path."""
+    return repo_root() / "mcp-servers" / "garmin" / "cache" / "garmin-responses.sqlite3"
+
+
 def default_legacy_token_dir() -> Path:
     """Return the legacy token directory used by garmin-mcp-auth."""
     return Path.home() / ".garminconnect"
@@ -37,6 +42,16 @@ def _env_bool(name: str, *, default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _env_number(name: str, *, default: float) -> float:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
 def python_for_server() -> str:
     """Return the preferred Python executable for repo-managed server registration."""
     repo_python = repo_root() / "venv" / "bin" / "python3"
@@ -52,6 +67,12 @@ class GarminSettings:
     legacy_token_dir: Path
     is_cn: bool
     startup_validate: bool
+    call_workers: int = 4
+    call_timeout_seconds: float = 30.0
+    cache_enabled: bool = True
+    cache_path: Path | None = None
+    cache_recent_ttl_seconds: int = 900
+    cache_historical_ttl_seconds: int = 30 * 86400
 
     @classmethod
     def from_env(cls) -> GarminSettings:
@@ -61,6 +82,16 @@ class GarminSettings:
             legacy_token_dir=_env_path("GARMIN_LEGACY_TOKEN_DIR") or default_legacy_token_dir(),
             is_cn=_env_bool("GARMIN_IS_CN", default=False),
             startup_validate=_env_bool("GARMIN_STARTUP_VALIDATE", default=True),
+            call_workers=max(int(_env_number("GARMIN_CALL_WORKERS", default=4)), 1),
+            call_timeout_seconds=_env_number("GARMIN_CALL_TIMEOUT_SECONDS", default=30.0),
+            cache_enabled=_env_bool("GARMIN_CACHE_ENABLED", default=True),
+            cache_path=_env_path("GARMIN_CACHE_PATH"),
+            cache_recent_ttl_seconds=int(
+                _env_number("GARMIN_CACHE_RECENT_TTL_SECONDS", default=900),
+            ),
+            cache_historical_ttl_seconds=int(
+                _env_number("GARMIN_CACHE_HISTORICAL_TTL_SECONDS", default=30 * 86400),
+            ),
         )
 
     def preferred_token_dir(self) -> Path:
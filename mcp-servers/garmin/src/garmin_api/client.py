@@ -2,16 +2,53 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from typing import Any, TypeVar
 
 from src.auth_manager import GarminAuthManager
+from src.config import GarminSettings, default_cache_path, settings
+from src.garmin_api.response_cache import GarminResponseCache
+
+T = TypeVar("T")
+
+
+def build_response_cache(
+    current_settings: GarminSettings = settings,
+) -> GarminResponseCache | None:
+    """Return the configured persistent response cache, or ``None`` when disabled."""
+    if not current_settings.cache_enabled:
+        return None
+    return GarminResponseCache(
+        current_settings.cache_path or default_cache_path(),
+        recent_ttl_seconds=current_settings.cache_recent_ttl_seconds,
+        historical_ttl_seconds=current_settings.cache_historical_ttl_seconds,
+    )
 
 
 class GarminAPIClient:
     """High-level wrapper around the authenticated Garmin client."""
 
-    def __init__(self, auth_manager: GarminAuthManager | None = None) -> None:
+    def __init__(
+        self,
+        auth_manager: GarminAuthManager | None = None,
+        cache: GarminResponseCache | None = None,
+    ) -> None:
         self._auth_manager = auth_manager or GarminAuthManager()
+        self._cache = cache
+
+    def _cached(
+        self,
+        method: str,
+        args: tuple[Any, ...],
+        operation_name: str,
+        callback: Callable[[Any], T],
+    ) -> T:
+        def load() -> T:
+            return self._auth_manager.run_with_client(operation_name, callback)
+
+        if self._cache is None:
+            return load()
+        return self._cache.fetch(method, args, load)
 
     def get_activities_fordate(self, fordate: str) -> dict[str, Any]:
         return self._auth_manager.run_with_client(
@@ -31,7 +68,9 @@ class GarminAPIClient:
         )
 
     def get_activity(self, activity_id: int) -> dict[str, Any]:
-        return self._auth_manager.run_with_client(
+        return self._cached(
+            "get_activity",
+            (activity_id,),
             f"activity {activity_id}",
             lambda client: client.get_activity(str(activity_id)),
         )
@@ -49,25 +88,33 @@ class GarminAPIClient:
         )
 
     def get_stats(self, cdate: str) -> dict[str, Any]:
-        return self._auth_manager.run_with_client(
+        return self._cached(
+            "get_stats",
+            (cdate,),
             f"daily stats for {cdate}",
             lambda client: client.get_stats(cdate),
         )
 
     def get_sleep_data(self, cdate: str) -> dict[str, Any]:
-        return self._auth_manager.run_with_client(
+        return self._cached(
+            "get_sleep_data",
+            (cdate,),
             f"sleep data for {cdate}",
             lambda client: client.get_sleep_data(cdate),
         )
 
     def get_hrv_data(self, cdate: str) -> dict[str, Any] | None:
-        return self._auth_manager.run_with_client(
+        return self._cached(
+            "get_hrv_data",
+            (cdate,),
             f"hrv data for {cdate}",
             lambda client: client.get_hrv_data(cdate),
         )
 
     def get_training_readiness(self, cdate: str) -> dict[str, Any] | list[dict[str, Any]]:
-        return self._auth_manager.run_with_client(
+        return self._cached(
+            "get_training_readiness",
+            (cdate,),
             f"training readiness for {cdate}",
             lambda client: client.get_training_readiness(cdate),
         )
@@ -77,11 +124,21 @@ class GarminAPIClient:
         start_date: str,
         end_date: str | None = None,
     ) -> list[dict[str, Any]]:
-        return self._auth_manager.run_with_client(
+        return self._cached(
+            "get_body_battery",
+            (start_date, end_date or start_date),
             f"body battery from {start_date} to {end_date or start_date}",
             lambda client: client.get_body_battery(start_date, end_date),
         )
 
+    def get_daily_steps(self, start_date: str, end_date: str) -> list[dict[str, Any]]:
+        return self._cached(
+            "get_daily_steps",
+            (start_date, end_date),
+            f"daily steps from {start_date} to {end_date}",
+            lambda client: client.get_daily_steps(start_date, end_date),
+        )
+
     def get_body_battery_events(self, cdate: str) -> list[dict[str, Any]]:
         return self._auth_manager.run_with_client(
             f"body battery events for {cdate}",
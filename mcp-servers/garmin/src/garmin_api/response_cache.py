@@ -0,0 +1,119 @@
+"""SQLite-backed cache of raw Garmin Connect payloads keyed by method and arguments."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections.abc import Callable
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_MISSING = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    method TEXT NOT NULL,
+    args TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (method, args)
+);
+"""
+
+
+def _latest_date(args: tuple[Any, ...]) -> date | None:
+    latest: date | None = None
+    for value in args:
+        if not isinstance(value, str):
+            continue
+        try:
+            parsed = date.fromisoformat(value)
+        except ValueError:
+            continue
+        latest = parsed if latest is None or parsed > latest else latest
+    return latest
+
+
+class GarminResponseCache:
+    """Persist Garmin responses and expire them by how final their data is.
+
+    Payloads whose newest date argument was already before yesterday (in local time) when
+    they were fetched are treated as settled and kept for ``historical_ttl_seconds``.
+    Anything fetched while its day was still today or yesterday, and calls without a date
+    argument, use ``recent_ttl_seconds`` even after the day has passed. Empty payloads are never stored, so a day
+    that has not synced yet is retried on the next call.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        recent_ttl_seconds: int = 900,
+        historical_ttl_seconds: int = 30 * 86400,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.recent_ttl_seconds = recent_ttl_seconds
+        self.historical_ttl_seconds = historical_ttl_seconds
+        self._clock = clock or (lambda: datetime.now(timezone.utc).astimezone())
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+    def ttl_for(self, args: tuple[Any, ...], *, fetched_at: datetime | None = None) -> int:
+        """Return the TTL in seconds for a payload of ``args`` fetched at ``fetched_at``."""
+        latest = _latest_date(args)
+        fetched_at = fetched_at or self._clock()
+        yesterday = fetched_at.astimezone(self._clock().tzinfo).date() - timedelta(days=1)
+        if latest is not None and latest < yesterday:
+            return self.historical_ttl_seconds
+        return self.recent_ttl_seconds
+
+    def get(self, method: str, args: tuple[Any, ...]) -> Any:
+        """Return a fresh cached payload, or ``_MISSING`` when absent or expired."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT fetched_at, payload FROM responses WHERE method = ? AND args = ?",
+                (method, json.dumps(args)),
+            ).fetchone()
+        if row is None:
+            return _MISSING
+        fetched_at = datetime.fromisoformat(row[0])
+        age = (self._clock() - fetched_at).total_seconds()
+        if age > self.ttl_for(args, fetched_at=fetched_at):
+            return _MISSING
+        return json.loads(row[1])
+
+    def put(self, method: str, args: tuple[Any, ...], payload: Any) -> None:
+        """Store ``payload`` unless it is empty."""
+        if not payload:
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (method, args, fetched_at, payload) "
+                "VALUES (?, ?, ?, ?)",
+                (method, json.dumps(args), self._clock().isoformat(), json.dumps(payload)),
+            )
+
+    def fetch(self, method: str, args: tuple[Any, ...], load: Callable[[], Any]) -> Any:
+        """Return the cached payload for ``method(*args)`` or load and store it."""
+        cached = self.get(method, args)
+        if cached is not _MISSING:
+            logger.info("Garmin cache hit", method=method, args=list(args))
+            return cached
+        logger.info("Garmin cache miss", method=method, args=list(args))
+        payload = load()
+        self.put(method, args, payload)
+        return payload
@@ -2,14 +2,47 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date as date_type
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from mcp.server.fastmcp import Context
 
+from src.config import settings
+
 if TYPE_CHECKING:
     from src.garmin_api.client import GarminAPIClient
 
+T = TypeVar("T")
+
 _api_client: Any | None = None
+_executor: ThreadPoolExecutor | None = None
+
+MAX_RANGE_DAYS = 92
+RANGE_FETCH_CONCURRENCY = 4
+READINESS_MORNING_CONTEXT = "AFTER_WAKEUP_RESET"
+DAILY_HEALTH_COLUMNS = (
+    "date",
+    "steps",
+    "distance_meters",
+    "resting_heart_rate_bpm",
+    "sleep_score",
+    "sleep_hours",
+    "sleep_avg_heart_rate_bpm",
+    "hrv_last_night_avg",
+    "hrv_weekly_avg",
+    "hrv_status",
+    "readiness_score",
+    "readiness_level",
+    "body_battery_high",
+    "body_battery_low",
+    "body_battery_charged",
+    "body_battery_drained",
+)
 
 
 def set_api_client(client: GarminAPIClient) -> None:
@@ -24,6 +57,47 @@ def _client() -> GarminAPIClient:
     return _api_client
 
 
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.call_workers,
+            thread_name_prefix="garmin-call",
+        )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Stop the Garmin worker pool, dropping calls that have not started yet."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def _run_client_call(
+    label: str,
+    func: Callable[..., T],
+    *args: Any,
+    timeout: float | None = None,
+) -> T:
+    """Run a blocking Garmin client call in the bounded worker pool.
+
+    The event loop stays free while garminconnect blocks on HTTP. On timeout or
+    cancellation a queued call is dropped; a call already running finishes in its worker
+    thread, but its result is discarded.
+    """
+    resolved_timeout = settings.call_timeout_seconds if timeout is None else timeout
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_get_executor(), functools.partial(func, *args))
+    try:
+        return await asyncio.wait_for(future, resolved_timeout)
+    except asyncio.TimeoutError as exc:
+        raise TimeoutError(
+            f"Garmin {label} timed out after {resolved_timeout:g} seconds",
+        ) from exc
+
+
 def _clean_mapping(data: dict[str, Any]) -> dict[str, Any]:
     return {key: value for key, value in data.items() if value is not None}
 
@@ -369,10 +443,84 @@ def curate_body_battery_events(date: str, payload: list[dict[str, Any]]) -> dict
     }
 
 
+def _date_range(start_date: str, end_date: str) -> list[str]:
+    start_day = date_type.fromisoformat(start_date)
+    end_day = date_type.fromisoformat(end_date)
+    if end_day < start_day:
+        raise ValueError("end_date must be on or after start_date")
+    days = [
+        (start_day + timedelta(days=offset)).isoformat()
+        for offset in range((end_day - start_day).days + 1)
+    ]
+    if len(days) > MAX_RANGE_DAYS:
+        raise ValueError(f"Date range is limited to {MAX_RANGE_DAYS} days")
+    return days
+
+
+def _primary_readiness_entry(entries: list[dict[str, Any]]) -> dict[str, Any]:
+    for entry in entries:
+        if entry.get("context") == READINESS_MORNING_CONTEXT:
+            return entry
+    return entries[0] if entries else {}
+
+
+def build_daily_health_table(
+    days: list[str],
+    *,
+    steps: list[dict[str, Any]],
+    body_battery: list[dict[str, Any]],
+    sleep_by_day: dict[str, dict[str, Any]],
+    hrv_by_day: dict[str, dict[str, Any] | None],
+    readiness_by_day: dict[str, dict[str, Any] | list[dict[str, Any]]],
+) -> list[list[Any]]:
+    """Project Garmin range and per-day payloads onto rows in ``DAILY_HEALTH_COLUMNS`` order."""
+    steps_by_day = {
+        entry.get("calendarDate"): entry for entry in steps if isinstance(entry, dict)
+    }
+    battery_by_day = {
+        day["date"]: day for day in curate_body_battery(days[0], days[-1], body_battery)["days"]
+    }
+
+    rows: list[list[Any]] = []
+    for day in days:
+        step_entry = steps_by_day.get(day) or {}
+        sleep_payload = sleep_by_day.get(day) or {}
+        sleep = curate_sleep_data(day, sleep_payload)
+        hrv = curate_hrv_data(day, hrv_by_day.get(day))
+        readiness = _primary_readiness_entry(
+            curate_training_readiness(day, readiness_by_day.get(day) or [])["entries"]
+        )
+        battery = battery_by_day.get(day) or {}
+        sleep_seconds = sleep.get("sleep_time_seconds")
+        values = {
+            "date": day,
+            "steps": step_entry.get("totalSteps"),
+            "distance_meters": step_entry.get("totalDistance"),
+            "resting_heart_rate_bpm": sleep_payload.get("restingHeartRate"),
+            "sleep_score": sleep.get("sleep_score"),
+            "sleep_hours": round(sleep_seconds / 3600, 2) if sleep_seconds else None,
+            "sleep_avg_heart_rate_bpm": sleep.get("avg_heart_rate_bpm"),
+            "hrv_last_night_avg": hrv.get("last_night_avg"),
+            "hrv_weekly_avg": hrv.get("weekly_avg"),
+            "hrv_status": hrv.get("status"),
+            "readiness_score": readiness.get("score"),
+            "readiness_level": readiness.get("level"),
+            "body_battery_high": battery.get("body_battery_high"),
+            "body_battery_low": battery.get("body_battery_low"),
+            "body_battery_charged": battery.get("body_battery_charged"),
+            "body_battery_drained": battery.get("body_battery_drained"),
+        }
+        rows.append([values[column] for column in DAILY_HEALTH_COLUMNS])
+    return rows
+
+
 async def get_activities_fordate_tool(context: Context, date: str) -> dict[str, Any]:
     """Get activities for a specific date in Garmin Connect."""
     del context
-    return curate_activities_for_date(date, _client().get_activities_fordate(date))
+    return curate_activities_for_date(
+        date,
+        await _run_client_call("activity lookup", _client().get_activities_fordate, date),
+    )
 
 
 async def get_activities_by_date_tool(
@@ -387,7 +535,13 @@ async def get_activities_by_date_tool(
     return curate_activities_by_date(
         start_date,
         end_date,
-        _client().get_activities_by_date(start_date, end_date, normalized_type),
+        await _run_client_call(
+            "activity range lookup",
+            _client().get_activities_by_date,
+            start_date,
+            end_date,
+            normalized_type,
+        ),
         normalized_type,
     )
 
@@ -395,43 +549,63 @@ async def get_activities_by_date_tool(
 async def get_activity_tool(context: Context, activity_id: int) -> dict[str, Any]:
     """Get Garmin activity details for a specific activity id."""
     del context
-    return curate_activity(_client().get_activity(activity_id))
+    return curate_activity(await _run_client_call("activity", _client().get_activity, activity_id))
 
 
 async def get_activity_splits_tool(context: Context, activity_id: int) -> dict[str, Any]:
     """Get Garmin activity split details for a specific activity id."""
     del context
-    return curate_activity_splits(activity_id, _client().get_activity_splits(activity_id))
+    return curate_activity_splits(
+        activity_id,
+        await _run_client_call("activity splits", _client().get_activity_splits, activity_id),
+    )
 
 
 async def get_activity_hr_in_timezones_tool(context: Context, activity_id: int) -> dict[str, Any]:
     """Get time spent in heart-rate zones for an activity."""
     del context
-    return curate_hr_time_in_zones(activity_id, _client().get_activity_hr_in_timezones(activity_id))
+    return curate_hr_time_in_zones(
+        activity_id,
+        await _run_client_call(
+            "activity hr zones",
+            _client().get_activity_hr_in_timezones,
+            activity_id,
+        ),
+    )
 
 
 async def get_stats_tool(context: Context, date: str) -> dict[str, Any]:
     """Get Garmin daily stats for a date."""
     del context
-    return curate_stats(date, _client().get_stats(date))
+    return curate_stats(date, await _run_client_call("daily stats", _client().get_stats, date))
 
 
 async def get_sleep_data_tool(context: Context, date: str) -> dict[str, Any]:
     """Get Garmin sleep data for a date."""
     del context
-    return curate_sleep_data(date, _client().get_sleep_data(date))
+    return curate_sleep_data(
+        date,
+        await _run_client_call("sleep data", _client().get_sleep_data, date),
+    )
 
 
 async def get_hrv_data_tool(context: Context, date: str) -> dict[str, Any]:
     """Get Garmin HRV data for a date."""
     del context
-    return curate_hrv_data(date, _client().get_hrv_data(date))
+    return curate_hrv_data(date, await _run_client_call("hrv data", _client().get_hrv_data, date))
 
 
 async def get_training_readiness_tool(context: Context, date: str) -> dict[str, Any]:
     """Get Garmin training readiness data for a date."""
     del context
-    return curate_training_readiness(date, _client().get_training_readiness(date))
+    return curate_training_readiness(
+        date,
+        await _run_client_call(
+            "training readiness",
+            _client().get_training_readiness,
+            date,
+        ),
+    )
 
 
 async def get_body_battery_tool(
@@ -445,17 +619,80 @@ async def get_body_battery_tool(
     return curate_body_battery(
         start_date,
         resolved_end,
-        _client().get_body_battery(start_date, resolved_end),
+        await _run_client_call(
+            "body battery",
+            _client().get_body_battery,
+            start_date,
+            resolved_end,
+        ),
     )
 
 
 async def get_body_battery_events_tool(context: Context, date: str) -> dict[str, Any]:
     """Get Garmin body battery events for a date."""
     del context
-    return curate_body_battery_events(date, _client().get_body_battery_events(date))
+    return curate_body_battery_events(
+        date,
+        await _run_client_call(
+            "body battery events",
+            _client().get_body_battery_events,
+            date,
+        ),
+    )
 
 
 async def get_profile_tool(context: Context) -> dict[str, str | None]:
     """Verify Garmin auth and return a minimal profile identity."""
     del context
-    return {"full_name": _client().get_full_name()}
+    return {"full_name": await _run_client_call("profile lookup", _client().get_full_name)}
+
+
+async def get_daily_health_range_tool(
+    context: Context,
+    start_date: str,
+    end_date: str,
+) -> dict[str, Any]:
+    """Get a compact per-day Garmin health table for a date range.
+
+    Steps and body battery come from range endpoints; sleep, HRV, and readiness have no
+    range endpoint, so those per-day lookups overlap in the shared Garmin worker pool.
+    """
+    del context
+    days = _date_range(start_date, end_date)
+    client = _client()
+    semaphore = asyncio.Semaphore(RANGE_FETCH_CONCURRENCY)
+    errors: list[str] = []
+
+    async def fetch(label: str, func: Any, *args: str) -> Any:
+        async with semaphore:
+            try:
+                return await _run_client_call(label, func, *args)
+            except Exception as exc:
+                errors.append(f"{label}: {exc}")
+                return None
+
+    steps, body_battery, *per_day = await asyncio.gather(
+        fetch("steps", client.get_daily_steps, days[0], days[-1]),
+        fetch("body_battery", client.get_body_battery, days[0], days[-1]),
+        *(fetch(f"sleep {day}", client.get_sleep_data, day) for day in days),
+        *(fetch(f"hrv {day}", client.get_hrv_data, day) for day in days),
+        *(fetch(f"readiness {day}", client.get_training_readiness, day) for day in days),
+    )
+    day_count = len(days)
+    summary: dict[str, Any] = {
+        "source": "garmin",
+        "start_date": days[0],
+        "end_date": days[-1],
+        "columns": list(DAILY_HEALTH_COLUMNS),
+        "rows": build_daily_health_table(
+            days,
+            steps=steps or [],
+            body_battery=body_battery or [],
+            sleep_by_day=dict(zip(days, per_day[:day_count], strict=True)),
+            hrv_by_day=dict(zip(days, per_day[day_count : 2 * day_count], strict=True)),
+            readiness_by_day=dict(zip(days, per_day[2 * day_count :], strict=True)),
+        ),
+    }
+    if errors:
+        summary["errors"] = sorted(errors)
+    return summary
@@ -0,0 +1,132 @@
+"""Tests for the persistent Garmin response cache."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.garmin_api.client import GarminAPIClient
+from src.garmin_api.response_cache import GarminResponseCache
+
+NOW = datetime(2026, 4, 22, 9, 0, tzinfo=timezone.utc)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class _FakeAuthManager:
+    def __init__(self, payload: object) -> None:
+        self.payload = payload
+        self.operations: list[str] = []
+
+    def run_with_client(self, operation_name, callback):  # noqa: ANN001, ANN201
+        self.operations.append(operation_name)
+        return callback(self)
+
+    def get_stats(self, cdate: str) -> object:
+        return self.payload
+
+    def get_hrv_data(self, cdate: str) -> object:
+        return self.payload
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock: _Clock) -> Iterator[GarminResponseCache]:  # noqa: ANN001
+    response_cache = GarminResponseCache(
+        tmp_path / "garmin.sqlite3",
+        recent_ttl_seconds=600,
+        historical_ttl_seconds=86400,
+        clock=clock,
+    )
+    yield response_cache
+    response_cache.close()
+
+
+def test_ttl_is_long_only_for_dates_before_yesterday(cache: GarminResponseCache) -> None:
+    assert cache.ttl_for(("2026-04-22",)) == 600
+    assert cache.ttl_for(("2026-04-21",)) == 600
+    assert cache.ttl_for(("2026-04-20",)) == 86400
+    assert cache.ttl_for(("2026-04-01", "2026-04-21")) == 600
+    assert cache.ttl_for((12345,)) == 600
+
+
+def test_client_serves_historical_dates_from_cache(
+    cache: GarminResponseCache,
+    clock: _Clock,
+) -> None:
+    auth = _FakeAuthManager({"calendarDate": "2026-04-10", "totalSteps": 8000})
+    client = GarminAPIClient(auth, cache)  # type: ignore[arg-type]
+
+    first = client.get_stats("2026-04-10")
+    clock.now += timedelta(hours=12)
+    second = client.get_stats("2026-04-10")
+    clock.now += timedelta(days=2)
+    client.get_stats("2026-04-10")
+
+    assert second == first
+    assert auth.operations == ["daily stats for 2026-04-10", "daily stats for 2026-04-10"]
+
+
+def test_payload_fetched_while_day_was_open_stays_on_recent_ttl(
+    cache: GarminResponseCache,
+    clock: _Clock,
+) -> None:
+    auth = _FakeAuthManager({"calendarDate": "2026-04-22", "totalSteps": 1200})
+    client = GarminAPIClient(auth, cache)  # type: ignore[arg-type]
+    client.get_stats("2026-04-22")
+
+    auth.payload = {"calendarDate": "2026-04-22", "totalSteps": 9400}
+    clock.now += timedelta(days=3)
+    later = client.get_stats("2026-04-22")
+    clock.now += timedelta(hours=1)
+    client.get_stats("2026-04-22")
+
+    assert later["totalSteps"] == 9400
+    # Only the refetch made after the day closed is kept on the historical TTL.
+    assert len(auth.operations) == 2
+
+
+def test_client_refreshes_recent_dates_after_short_ttl(
+    cache: GarminResponseCache,
+    clock: _Clock,
+) -> None:
+    auth = _FakeAuthManager({"calendarDate": "2026-04-22", "totalSteps": 100})
+    client = GarminAPIClient(auth, cache)  # type: ignore[arg-type]
+
+    client.get_stats("2026-04-22")
+    client.get_stats("2026-04-22")
+    clock.now += timedelta(minutes=11)
+    client.get_stats("2026-04-22")
+
+    assert len(auth.operations) == 2
+
+
+def test_empty_payloads_are_not_cached(cache: GarminResponseCache) -> None:
+    auth = _FakeAuthManager(None)
+    client = GarminAPIClient(auth, cache)  # type: ignore[arg-type]
+
+    assert client.get_hrv_data("2026-04-01") is None
+    assert client.get_hrv_data("2026-04-01") is None
+    assert len(auth.operations) == 2
+
+
+def test_client_without_cache_always_calls_garmin() -> None:
+    auth = _FakeAuthManager({"totalSteps": 1})
+    client = GarminAPIClient(auth)  # type: ignore[arg-type]
+
+    client.get_stats("2026-04-01")
+    client.get_stats("2026-04-01")
+
+    assert len(auth.operations) == 2
@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.garmin_mcp import tools
 from src.garmin_mcp.tools import (
+    DAILY_HEALTH_COLUMNS,
     curate_activities_by_date,
     curate_activities_for_date,
     curate_activity,
@@ -121,3 +129,110 @@ def test_curate_body_battery_events_compacts_event_fields() -> None:
     assert curated["events"][0]["activity_id"] == 777
     assert curated["events"][0]["event_type"] == "RECORDED_ACTIVITY"
     assert curated["events"][0]["body_battery_impact"] == -12
+
+
+class _FakeRangeClient:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, ...]] = []
+
+    def get_daily_steps(self, start_date: str, end_date: str) -> list[dict[str, object]]:
+        self.calls.append(("steps", start_date, end_date))
+        return [{"calendarDate": "2026-04-20", "totalSteps": 9000, "totalDistance": 7100}]
+
+    def get_body_battery(self, start_date: str, end_date: str) -> list[dict[str, object]]:
+        self.calls.append(("body_battery", start_date, end_date))
+        return [{"calendarDate": "2026-04-21", "bodyBatteryHighestValue": 88}]
+
+    def get_sleep_data(self, cdate: str) -> dict[str, object]:
+        self.calls.append(("sleep", cdate))
+        return {
+            "restingHeartRate": 48,
+            "dailySleepDTO": {"sleepTimeSeconds": 27000, "sleepScores": {"overall": {"value": 82}}},
+        }
+
+    def get_hrv_data(self, cdate: str) -> dict[str, object] | None:
+        self.calls.append(("hrv", cdate))
+        if cdate == "2026-04-21":
+            raise RuntimeError("HRV unavailable")
+        return {"hrvSummary": {"lastNightAvg": 61, "weeklyAvg": 58, "status": "BALANCED"}}
+
+    def get_training_readiness(self, cdate: str) -> list[dict[str, object]]:
+        self.calls.append(("readiness", cdate))
+        return [
+            {"inputContext": "UPDATE_REALTIME_VARIABLES", "score": 40},
+            {"inputContext": "AFTER_WAKEUP_RESET", "score": 71, "level": "HIGH"},
+        ]
+
+
+@pytest.mark.asyncio
+async def test_daily_health_range_uses_range_endpoints_and_builds_rows() -> None:
+    client = _FakeRangeClient()
+    tools.set_api_client(client)  # type: ignore[arg-type]
+
+    summary = await tools.get_daily_health_range_tool(None, "2026-04-20", "2026-04-21")
+
+    assert ("steps", "2026-04-20", "2026-04-21") in client.calls
+    assert ("body_battery", "2026-04-20", "2026-04-21") in client.calls
+    assert summary["columns"] == list(DAILY_HEALTH_COLUMNS)
+    first = dict(zip(DAILY_HEALTH_COLUMNS, summary["rows"][0], strict=True))
+    second = dict(zip(DAILY_HEALTH_COLUMNS, summary["rows"][1], strict=True))
+    assert first["steps"] == 9000
+    assert first["sleep_hours"] == 7.5
+    assert first["resting_heart_rate_bpm"] == 48
+    assert first["hrv_last_night_avg"] == 61
+    assert first["readiness_score"] == 71
+    assert second["body_battery_high"] == 88
+    assert second["hrv_status"] is None
+    assert summary["errors"] == ["hrv 2026-04-21: HRV unavailable"]
+
+
+@pytest.mark.asyncio
+async def test_daily_health_range_rejects_inverted_ranges() -> None:
+    tools.set_api_client(_FakeRangeClient())  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError, match="on or after"):
+        await tools.get_daily_health_range_tool(None, "2026-04-21", "2026-04-20")
+
+
+class _BlockingStatsClient:
+    def __init__(self, release: threading.Event | None = None, delay: float = 0.0) -> None:
+        self.release = release
+        self.delay = delay
+        self.threads: set[str] = set()
+
+    def get_stats(self, cdate: str) -> dict[str, object]:
+        self.threads.add(threading.current_thread().name)
+        if self.release is not None:
+            self.release.wait(timeout=5)
+        time.sleep(self.delay)
+        return {"calendarDate": cdate, "totalSteps": 1000}
+
+
+@pytest.mark.asyncio
+async def test_client_calls_run_off_the_event_loop_and_overlap() -> None:
+    client = _BlockingStatsClient(delay=0.2)
+    tools.set_api_client(client)  # type: ignore[arg-type]
+
+    started = time.monotonic()
+    results = await asyncio.gather(
+        tools.get_stats_tool(None, "2026-04-20"),
+        tools.get_stats_tool(None, "2026-04-21"),
+        tools.get_stats_tool(None, "2026-04-22"),
+    )
+    elapsed = time.monotonic() - started
+
+    assert [result["date"] for result in results] == ["2026-04-20", "2026-04-21", "2026-04-22"]
+    assert elapsed < 0.5
+    assert all(name.startswith("garmin-call") for name in client.threads)
+
+
+@pytest.mark.asyncio
+async def test_client_calls_time_out_without_blocking_the_loop() -> None:
+    release = threading.Event()
+    client = _BlockingStatsClient(release=release)
+
+    try:
+        with pytest.raises(TimeoutError, match="daily stats timed out after 0.05 seconds"):
+            await tools._run_client_call("daily stats", client.get_stats, "2026-04-20", timeout=0.05)
+    finally:
+        release.set()
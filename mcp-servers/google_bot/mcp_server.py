@@ -6,6 +6,8 @@ from __future__ import annotations
 import logging
 import os
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
@@ -43,7 +45,10 @@ sys.path.insert(0, str(CURRENT_DIR))
 from mcp.server import FastMCP
 from mcp.server.fastmcp import Context
 
+from src.calendar_mirror import close_calendar_mirror
 from src.google_bot_mcp import tools
+from src.google_client import shutdown_executor
+from src.message_store import close_message_store
 from src.oauth_manager import GoogleBotAuthMissingError, get_google_credentials
 
 logger = structlog.get_logger(__name__)
@@ -62,8 +67,20 @@ except Exception as exc:  # pragma: no cover - startup warning path
     logger.warning("Google bot OAuth initialization warning", error=str(exc))
 
 
+@asynccontextmanager
+async def google_bot_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Shut down the Google API worker pool and local caches when the server stops."""
+    try:
+        yield
+    finally:
+        shutdown_executor()
+        close_calendar_mirror()
+        close_message_store()
+
+
 mcp = FastMCP(
     name="google_bot",
+    lifespan=google_bot_lifespan,
     instructions=(
         "Google bot MCP server for ATLAS. Provides Gmail and Google Calendar tools backed by "
         "a repo-managed OAuth flow so ATLAS can use a bot-owned Google account independent of "
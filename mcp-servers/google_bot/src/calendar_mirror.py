@@ -0,0 +1,397 @@
+"""SQLite mirror of Google Calendar events kept current with incremental sync tokens."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from .google_client import _env_number
+
+logger = structlog.get_logger(__name__)
+
+
+def _default_mirror_path() -> Path:
+    return Path(__file__).resolve().parents[1] / "cache" / "calendar-mirror.sqlite3"
+
+
+CALENDAR_MIRROR_ENABLED = os.getenv("GOOGLE_BOT_CALENDAR_MIRROR", "true").lower() not in {
+    "0",
+    "false",
+    "no",
+}
+CALENDAR_MIRROR_PATH = Path(
+    os.getenv("GOOGLE_BOT_CALENDAR_MIRROR_PATH", _default_mirror_path())
+).expanduser()
+CALENDAR_MAX_STALENESS_SECONDS = _env_number(
+    "GOOGLE_BOT_CALENDAR_MAX_STALENESS_SECONDS", default=120.0
+)
+CALENDAR_OUTAGE_GRACE_SECONDS = _env_number(
+    "GOOGLE_BOT_CALENDAR_OUTAGE_GRACE_SECONDS", default=21600.0
+)
+# The full sync only mirrors events in this window around the time it runs.
+CALENDAR_PAST_DAYS = _env_number("GOOGLE_BOT_CALENDAR_MIRROR_PAST_DAYS", default=30)
+CALENDAR_FUTURE_DAYS = _env_number("GOOGLE_BOT_CALENDAR_MIRROR_FUTURE_DAYS", default=365)
+
+SYNC_PAGE_SIZE = 2500
+DAY_SECONDS = 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS calendars (
+    calendar_id TEXT PRIMARY KEY,
+    sync_token TEXT,
+    synced_at REAL NOT NULL,
+    stale INTEGER NOT NULL DEFAULT 0,
+    window_start REAL,
+    window_end REAL
+);
+CREATE TABLE IF NOT EXISTS events (
+    calendar_id TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    search_text TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (calendar_id, event_id)
+);
+CREATE INDEX IF NOT EXISTS events_by_start ON events (calendar_id, start_ts);
+"""
+
+
+def _parse_rfc3339(value: str) -> datetime:
+    # datetime.fromisoformat only accepts a trailing "Z" from Python 3.11 onwards.
+    if value.endswith(("Z", "z")):
+        value = f"{value[:-1]}+00:00"
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _event_timestamp(boundary: dict[str, Any] | None) -> float | None:
+    boundary = boundary or {}
+    if isinstance(boundary.get("dateTime"), str):
+        return _parse_rfc3339(boundary["dateTime"]).timestamp()
+    if isinstance(boundary.get("date"), str):
+        # All-day events carry no zone; anchor them to local midnight like the Calendar UI.
+        day = date.fromisoformat(boundary["date"])
+        return datetime(day.year, day.month, day.day).astimezone().timestamp()
+    return None
+
+
+def _search_text(event: dict[str, Any]) -> str:
+    parts = [event.get("summary"), event.get("description"), event.get("location")]
+    for person in [event.get("organizer") or {}, *(event.get("attendees") or [])]:
+        if isinstance(person, dict):
+            parts.extend([person.get("email"), person.get("displayName")])
+    return " ".join(part for part in parts if isinstance(part, str)).lower()
+
+
+def _rfc3339(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def _is_gone(exc: Exception) -> bool:
+    return getattr(getattr(exc, "resp", None), "status", None) == 410
+
+
+class CalendarMirror:
+    """Keep a local copy of each calendar's expanded events and answer searches from it.
+
+    The first read of a calendar performs a full ``events().list`` sync bounded to
+    ``past_days`` before and ``future_days`` after the sync; later reads that find the copy
+    older than ``max_staleness_seconds`` fetch only the changes since the stored
+    ``nextSyncToken``. The window is moved with a new full sync once less than half of
+    ``future_days`` remains ahead of it. If that fetch fails, a copy synced within
+    ``outage_grace_seconds`` is served instead of raising. ``mark_stale`` forces the next
+    read to sync, which the write tools call after changing a calendar.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        max_staleness_seconds: float = 120,
+        outage_grace_seconds: float = 6 * 3600,
+        past_days: float = 30,
+        future_days: float = 365,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.max_staleness_seconds = max_staleness_seconds
+        self.outage_grace_seconds = outage_grace_seconds
+        self.past_days = past_days
+        self.future_days = future_days
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(calendars)")}
+        for column in ("window_start", "window_end"):
+            # Mirrors created before the sync window existed hold the full calendar.
+            if column not in columns:
+                self._connection.execute(f"ALTER TABLE calendars ADD COLUMN {column} REAL")
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _sync_state(self, calendar_id: str) -> tuple[str | None, float | None, bool]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT sync_token, synced_at, stale FROM calendars WHERE calendar_id = ?",
+                (calendar_id,),
+            ).fetchone()
+        return (row[0], row[1], bool(row[2])) if row else (None, None, True)
+
+    def _new_window(self) -> tuple[float, float]:
+        now = self._clock()
+        return now - self.past_days * DAY_SECONDS, now + self.future_days * DAY_SECONDS
+
+    def _window(self, calendar_id: str) -> tuple[float, float] | None:
+        """Return the mirrored time range, or ``None`` when the whole calendar is held."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT window_start, window_end FROM calendars WHERE calendar_id = ?",
+                (calendar_id,),
+            ).fetchone()
+        if row is None:
+            return self._new_window()
+        return None if row[0] is None or row[1] is None else (row[0], row[1])
+
+    def _window_needs_moving(self, window: tuple[float, float] | None) -> bool:
+        if window is None:
+            return False
+        return window[1] - self._clock() < self.future_days * DAY_SECONDS / 2
+
+    def covers(self, calendar_id: str, time_min: str | None, time_max: str | None) -> bool:
+        """Return whether explicit search bounds fall inside the mirrored window."""
+        window = self._window(calendar_id)
+        if window is None:
+            return True
+        if self._window_needs_moving(window):
+            window = self._new_window()
+        if time_min and _parse_rfc3339(time_min).timestamp() < window[0]:
+            return False
+        return not (time_max and _parse_rfc3339(time_max).timestamp() > window[1])
+
+    def _is_fresh(self, calendar_id: str) -> bool:
+        _, synced_at, stale = self._sync_state(calendar_id)
+        if stale or synced_at is None:
+            return False
+        return self._clock() - synced_at <= self.max_staleness_seconds
+
+    def mark_stale(self, calendar_id: str) -> None:
+        """Force the next read of ``calendar_id`` to sync with Google first."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE calendars SET stale = 1 WHERE calendar_id = ?",
+                (calendar_id,),
+            )
+
+    def _list_changes(
+        self,
+        calendar_service: Any,
+        calendar_id: str,
+        sync_token: str | None,
+        window: tuple[float, float] | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        changes: list[dict[str, Any]] = []
+        page_token: str | None = None
+        while True:
+            params: dict[str, Any] = {
+                "calendarId": calendar_id,
+                "singleEvents": True,
+                "showDeleted": True,
+                "maxResults": SYNC_PAGE_SIZE,
+            }
+            if sync_token:
+                params["syncToken"] = sync_token
+            elif window is not None:
+                params["timeMin"], params["timeMax"] = (_rfc3339(bound) for bound in window)
+            if page_token:
+                params["pageToken"] = page_token
+            response = calendar_service.events().list(**params).execute()
+            changes.extend(item for item in response.get("items") or [] if isinstance(item, dict))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return changes, response.get("nextSyncToken")
+
+    def _apply(
+        self,
+        calendar_id: str,
+        changes: list[dict[str, Any]],
+        next_sync_token: str | None,
+        *,
+        full: bool,
+        window: tuple[float, float] | None,
+    ) -> None:
+        with self._lock, self._connection:
+            if full:
+                self._connection.execute("DELETE FROM events WHERE calendar_id = ?", (calendar_id,))
+            for event in changes:
+                event_id = event.get("id")
+                if not isinstance(event_id, str):
+                    continue
+                start_ts = _event_timestamp(event.get("start"))
+                end_ts = _event_timestamp(event.get("end"))
+                if event.get("status") == "cancelled" or start_ts is None:
+                    self._connection.execute(
+                        "DELETE FROM events WHERE calendar_id = ? AND event_id = ?",
+                        (calendar_id, event_id),
+                    )
+                    continue
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO events "
+                    "(calendar_id, event_id, start_ts, end_ts, search_text, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        calendar_id,
+                        event_id,
+                        start_ts,
+                        end_ts if end_ts is not None else start_ts,
+                        _search_text(event),
+                        json.dumps(event),
+                    ),
+                )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO calendars "
+                "(calendar_id, sync_token, synced_at, stale, window_start, window_end) "
+                "VALUES (?, ?, ?, 0, ?, ?)",
+                (
+                    calendar_id,
+                    next_sync_token,
+                    self._clock(),
+                    *(window if window is not None else (None, None)),
+                ),
+            )
+
+    def sync(self, calendar_service: Any, calendar_id: str) -> None:
+        """Bring ``calendar_id`` up to date, incrementally when a sync token is stored."""
+        sync_token, _, _ = self._sync_state(calendar_id)
+        window = self._window(calendar_id)
+        full = sync_token is None or self._window_needs_moving(window)
+        if full:
+            sync_token, window = None, self._new_window()
+        try:
+            changes, next_sync_token = self._list_changes(
+                calendar_service, calendar_id, sync_token, window
+            )
+        except Exception as exc:
+            if full or not _is_gone(exc):
+                raise
+            # Google expires sync tokens; a 410 means the mirror must be rebuilt from scratch.
+            logger.info("Calendar sync token expired; running full sync", calendar_id=calendar_id)
+            full, window = True, self._new_window()
+            changes, next_sync_token = self._list_changes(
+                calendar_service, calendar_id, None, window
+            )
+        self._apply(calendar_id, changes, next_sync_token, full=full, window=window)
+        logger.info(
+            "Calendar mirror synced",
+            calendar_id=calendar_id,
+            full=full,
+            changes=len(changes),
+        )
+
+    def _ensure_fresh(self, calendar_service_factory: Callable[[], Any], calendar_id: str) -> None:
+        if self._is_fresh(calendar_id):
+            return
+        with self._sync_lock:
+            # Another worker may have synced this calendar while we waited for the lock.
+            if self._is_fresh(calendar_id):
+                return
+            try:
+                self.sync(calendar_service_factory(), calendar_id)
+            except Exception as exc:
+                _, synced_at, _ = self._sync_state(calendar_id)
+                if synced_at is None or self._clock() - synced_at > self.outage_grace_seconds:
+                    raise
+                logger.warning(
+                    "Calendar sync failed; serving mirrored events",
+                    calendar_id=calendar_id,
+                    age_seconds=round(self._clock() - synced_at),
+                    error=str(exc),
+                )
+
+    def search(
+        self,
+        calendar_service_factory: Callable[[], Any],
+        calendar_id: str,
+        *,
+        query: str | None,
+        time_min: str | None,
+        time_max: str | None,
+        max_results: int,
+    ) -> list[dict[str, Any]] | None:
+        """Return mirrored events overlapping the window and matching every query term.
+
+        Mirrors ``events().list(singleEvents=True, orderBy="startTime")``: ``time_min`` bounds
+        event ends, ``time_max`` bounds event starts, and results are ordered by start.
+        Returns ``None`` when an explicit bound lies outside the mirrored window, so the
+        caller can query Google directly; an omitted bound is limited to the window.
+        """
+        if not self.covers(calendar_id, time_min, time_max):
+            return None
+        self._ensure_fresh(calendar_service_factory, calendar_id)
+        sql = "SELECT search_text, payload FROM events WHERE calendar_id = ?"
+        params: list[Any] = [calendar_id]
+        if time_min:
+            sql += " AND end_ts > ?"
+            params.append(_parse_rfc3339(time_min).timestamp())
+        if time_max:
+            sql += " AND start_ts < ?"
+            params.append(_parse_rfc3339(time_max).timestamp())
+        sql += " ORDER BY start_ts, event_id"
+        terms = (query or "").lower().split()
+
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        events: list[dict[str, Any]] = []
+        for search_text, payload in rows:
+            if all(term in search_text for term in terms):
+                events.append(json.loads(payload))
+                if len(events) >= max_results:
+                    break
+        return events
+
+
+_calendar_mirror: CalendarMirror | None = None
+_calendar_mirror_lock = threading.Lock()
+
+
+def get_calendar_mirror() -> CalendarMirror | None:
+    """Return the process-wide calendar mirror, or ``None`` when it is disabled."""
+    global _calendar_mirror
+    if not CALENDAR_MIRROR_ENABLED:
+        return None
+    with _calendar_mirror_lock:
+        if _calendar_mirror is None:
+            _calendar_mirror = CalendarMirror(
+                CALENDAR_MIRROR_PATH,
+                max_staleness_seconds=CALENDAR_MAX_STALENESS_SECONDS,
+                outage_grace_seconds=CALENDAR_OUTAGE_GRACE_SECONDS,
+                past_days=CALENDAR_PAST_DAYS,
+                future_days=CALENDAR_FUTURE_DAYS,
+            )
+        return _calendar_mirror
+
+
+def close_calendar_mirror() -> None:
+    """Close the process-wide calendar mirror if it was opened."""
+    global _calendar_mirror
+    with _calendar_mirror_lock:
+        if _calendar_mirror is not None:
+            _calendar_mirror.close()
+            _calendar_mirror = None
@@ -3,16 +3,41 @@
 from __future__ import annotations
 
 import base64
+import threading
+import time
 import uuid
+from collections.abc import Callable
 from email.mime.text import MIMEText
-from typing import Any
+from typing import Any, TypeVar
 
 try:
     from mcp.server.fastmcp import Context
 except ModuleNotFoundError:  # pragma: no cover - test environment without MCP installed
     Context = Any
 
-from src.google_client import build_calendar_service, build_gmail_service, get_http_error_type
+from src.calendar_mirror import get_calendar_mirror
+from src.google_client import (
+    build_calendar_service,
+    build_gmail_service,
+    get_http_error_type,
+    run_google_call,
+)
+from src.message_store import get_message_store
+
+T = TypeVar("T")
+
+GMAIL_BATCH_SIZE = 50
+# Gmail rejects some items of a busy batch with 429s; those ids are re-batched after a pause.
+GMAIL_BATCH_RETRIES = 2
+GMAIL_BATCH_RETRY_DELAY_SECONDS = 1.0
+MESSAGE_METADATA_HEADERS = ["Subject", "From", "To", "Cc", "Date"]
+MESSAGE_METADATA_FIELDS = "id,threadId,labelIds,snippet,internalDate,payload/headers"
+GMAIL_BATCH_MODIFY_SIZE = 1000
+LABEL_CACHE_TTL_SECONDS = 300.0
+
+_label_cache: dict[str, str] | None = None
+_label_cache_loaded_at = 0.0
+_label_cache_lock = threading.Lock()
 
 
 def _google_error_message(exc: Exception) -> str:
@@ -33,6 +58,21 @@ def _google_error_message(exc: Exception) -> str:
     return str(exc)
 
 
+async def _dispatch(
+    context: Context,
+    label: str,
+    func: Callable[[], T],
+    *,
+    mutating: bool = False,
+) -> T:
+    """Run a blocking Google API call in the shared worker pool and report failures."""
+    try:
+        return await run_google_call(label, func, mutating=mutating)
+    except Exception as exc:
+        await context.error(_google_error_message(exc))
+        raise
+
+
 def _normalize_headers(headers: list[dict[str, str]] | None) -> dict[str, str]:
     normalized: dict[str, str] = {}
     for header in headers or []:
@@ -140,19 +180,84 @@ def _event_summary(event: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _label_name_map(gmail_service: Any) -> dict[str, str]:
-    response = gmail_service.users().labels().list(userId="me").execute()
+def _batch_get_messages(
+    gmail_service: Any,
+    message_ids: list[str],
+    **get_kwargs: Any,
+) -> list[dict[str, Any]]:
+    """Fetch messages through Gmail batch requests, ``GMAIL_BATCH_SIZE`` per round-trip.
+
+    Results keep the order of ``message_ids``. Ids whose sub-request failed are re-batched
+    with exponential backoff up to ``GMAIL_BATCH_RETRIES`` times, then fetched one by one,
+    so only an id that keeps failing on its own raises.
+    """
+    messages: dict[str, dict[str, Any]] = {}
+    failed: list[str] = []
+
+    def on_response(request_id: str, response: Any, exception: Exception | None) -> None:
+        if exception is not None:
+            failed.append(request_id)
+        elif isinstance(response, dict):
+            messages[request_id] = response
+
+    def get_request(message_id: str) -> Any:
+        return gmail_service.users().messages().get(userId="me", id=message_id, **get_kwargs)
+
+    pending = list(message_ids)
+    for attempt in range(GMAIL_BATCH_RETRIES + 1):
+        if attempt:
+            time.sleep(GMAIL_BATCH_RETRY_DELAY_SECONDS * 2 ** (attempt - 1))
+        failed.clear()
+        for offset in range(0, len(pending), GMAIL_BATCH_SIZE):
+            batch = gmail_service.new_batch_http_request(callback=on_response)
+            for message_id in pending[offset : offset + GMAIL_BATCH_SIZE]:
+                batch.add(get_request(message_id), request_id=message_id)
+            batch.execute()
+        pending = list(failed)
+        if not pending:
+            break
+    for message_id in pending:
+        messages[message_id] = get_request(message_id).execute()
+    return [messages[message_id] for message_id in message_ids if message_id in messages]
+
+
+def _store_label_map(labels: list[dict[str, Any]]) -> dict[str, str]:
+    global _label_cache, _label_cache_loaded_at
     label_map: dict[str, str] = {}
-    for label in response.get("labels") or []:
+    for label in labels:
         label_id = label.get("id")
         name = label.get("name")
         if isinstance(label_id, str) and isinstance(name, str):
             label_map[name] = label_id
-    return label_map
+    with _label_cache_lock:
+        _label_cache = label_map
+        _label_cache_loaded_at = time.monotonic()
+    return dict(label_map)
+
+
+def invalidate_label_cache() -> None:
+    """Drop the cached Gmail label-name map so the next lookup lists labels again."""
+    global _label_cache
+    with _label_cache_lock:
+        _label_cache = None
+
+
+def _label_name_map(gmail_service: Any, *, refresh: bool = False) -> dict[str, str]:
+    """Return Gmail label names mapped to ids, listing labels at most every few minutes."""
+    with _label_cache_lock:
+        cached = _label_cache
+        fresh = time.monotonic() - _label_cache_loaded_at < LABEL_CACHE_TTL_SECONDS
+    if cached is not None and fresh and not refresh:
+        return dict(cached)
+    response = gmail_service.users().labels().list(userId="me").execute()
+    return _store_label_map(response.get("labels") or [])
 
 
 def _ensure_labels(gmail_service: Any, names: list[str], create_missing_labels: bool) -> dict[str, str]:
     label_map = _label_name_map(gmail_service)
+    if any(name not in label_map for name in names):
+        # The cache may predate labels created outside this server; re-list once before failing.
+        label_map = _label_name_map(gmail_service, refresh=True)
     for name in names:
         if name in label_map:
             continue
@@ -171,15 +276,43 @@ def _ensure_labels(gmail_service: Any, names: list[str], create_missing_labels:
             )
             .execute()
         )
+        invalidate_label_cache()
         label_id = created.get("id")
         if isinstance(label_id, str):
             label_map[name] = label_id
     return label_map
 
 
+def _batch_modify_messages(
+    gmail_service: Any,
+    message_ids: list[str],
+    *,
+    add_label_ids: list[str],
+    remove_label_ids: list[str],
+) -> None:
+    """Apply one label change to many messages, ``GMAIL_BATCH_MODIFY_SIZE`` ids per call."""
+    unique_ids = list(dict.fromkeys(message_ids))
+    for offset in range(0, len(unique_ids), GMAIL_BATCH_MODIFY_SIZE):
+        gmail_service.users().messages().batchModify(
+            userId="me",
+            body={
+                "ids": unique_ids[offset : offset + GMAIL_BATCH_MODIFY_SIZE],
+                "addLabelIds": add_label_ids,
+                "removeLabelIds": remove_label_ids,
+            },
+        ).execute()
+
+
+def _mark_calendar_stale(calendar_id: str) -> None:
+    mirror = get_calendar_mirror()
+    if mirror is not None:
+        mirror.mark_stale(calendar_id)
+
+
 async def get_profile_tool(context: Context) -> dict[str, Any]:
     """Return the connected Gmail identity plus visible calendars."""
-    try:
+
+    def run() -> dict[str, Any]:
         gmail_service = build_gmail_service()
         calendar_service = build_calendar_service()
         gmail_profile = gmail_service.users().getProfile(userId="me").execute()
@@ -200,16 +333,17 @@ async def get_profile_tool(context: Context) -> dict[str, Any]:
                 if isinstance(item, dict)
             ],
         }
-    except Exception as exc:
-        await context.error(_google_error_message(exc))
-        raise
+
+    return await _dispatch(context, "get_profile", run)
 
 
 async def list_labels_tool(context: Context) -> list[dict[str, Any]]:
     """List Gmail labels with counts."""
-    try:
+
+    def run() -> list[dict[str, Any]]:
         gmail_service = build_gmail_service()
         response = gmail_service.users().labels().list(userId="me").execute()
+        _store_label_map(response.get("labels") or [])
         return [
             {
                 "id": label.get("id"),
@@ -223,9 +357,8 @@ async def list_labels_tool(context: Context) -> list[dict[str, Any]]:
             for label in (response.get("labels") or [])
             if isinstance(label, dict)
         ]
-    except Exception as exc:
-        await context.error(_google_error_message(exc))
-        raise
+
+    return await _dispatch(context, "list_labels", run)
 
 
 async def search_emails_tool(
@@ -234,38 +367,54 @@ async def search_emails_tool(
     query: str | None,
     max_results: int,
 ) -> list[dict[str, Any]]:
-    """Search Gmail messages and return lightweight summaries."""
-    try:
+    """Search Gmail messages and return lightweight summaries, reusing cached ones."""
+
+    def run() -> list[dict[str, Any]]:
         gmail_service = build_gmail_service()
         response = (
             gmail_service.users()
             .messages()
-            .list(userId="me", q=query, maxResults=max_results)
+            .list(userId="me", q=query, maxResults=max_results, fields="messages/id")
             .execute()
         )
-        messages = []
-        for item in response.get("messages") or []:
-            message = (
-                gmail_service.users()
-                .messages()
-                .get(
-                    userId="me",
-                    id=item["id"],
-                    format="metadata",
-                    metadataHeaders=["Subject", "From", "To", "Cc", "Date"],
-                )
-                .execute()
-            )
-            messages.append(_message_summary(message))
-        return messages
-    except Exception as exc:
-        await context.error(_google_error_message(exc))
-        raise
+        message_ids = [item["id"] for item in response.get("messages") or []]
+        store = get_message_store()
+        summaries: dict[str, dict[str, Any]] = {}
+        if store is not None:
+            store.ensure_synced(build_gmail_service)
+            summaries = store.get_summaries(message_ids)
+        messages = _batch_get_messages(
+            gmail_service,
+            [message_id for message_id in message_ids if message_id not in summaries],
+            format="metadata",
+            metadataHeaders=MESSAGE_METADATA_HEADERS,
+            fields=MESSAGE_METADATA_FIELDS,
+        )
+        for message in messages:
+            summary = _message_summary(message)
+            summaries[summary["id"]] = summary
+            if store is not None:
+                store.put(summary)
+        return [summaries[message_id] for message_id in message_ids if message_id in summaries]
+
+    return await _dispatch(context, "search_emails", run)
 
 
 async def read_email_tool(context: Context, message_id: str) -> dict[str, Any]:
-    """Read a Gmail message including decoded body text and attachment metadata."""
-    try:
+    """Read a Gmail message including decoded body text and attachment metadata.
+
+    Decoded messages are served from the local message store once cached; their label state
+    is kept current by replaying Gmail history.
+    """
+
+    def run() -> dict[str, Any]:
+        store = get_message_store()
+        if store is not None:
+            store.ensure_synced(build_gmail_service)
+            cached = store.get_message(message_id)
+            if cached is not None:
+                return cached
+
         gmail_service = build_gmail_service()
         message = (
             gmail_service.users()
@@ -276,17 +425,16 @@ async def read_email_tool(context: Context, message_id: str) -> dict[str, Any]:
         payload = message.get("payload") or {}
         plain_text, html_text = _extract_text_bodies(payload)
         summary = _message_summary(message)
-        summary.update(
-            {
-                "plain_text_body": plain_text,
-                "html_body": html_text,
-                "attachments": _extract_attachments(payload),
-            }
-        )
-        return summary
-    except Exception as exc:
-        await context.error(_google_error_message(exc))
-        raise
+        detail = {
+            "plain_text_body": plain_text,
+            "html_body": html_text,
+            "attachments": _extract_attachments(payload),
+        }
+        if store is not None:
+            store.put(summary, detail)
+        return {**summary, **detail}
+
+    return await _dispatch(context, "read_email", run)
 
 
 async def send_email_tool(
@@ -299,7 +447,8 @@ async def send_email_tool(
     bcc: str | None,
 ) -> dict[str, Any]:
     """Send a plain-text email from the bot account."""
-    try:
+
+    def run() -> dict[str, Any]:
         gmail_service = build_gmail_service()
         message = MIMEText(body)
         message["To"] = to
@@ -316,9 +465,8 @@ async def send_email_tool(
             "thread_id": sent.get("threadId"),
             "label_ids": sent.get("labelIds") or [],
         }
-    except Exception as exc:
-        await context.error(_google_error_message(exc))
-        raise
+
+    return await _dispatch(context, "send_email", run, mutating=True)
 
 
 async def modify_email_labels_tool(
@@ -330,8 +478,13 @@ async def modify_email_labels_tool(
     create_missing_labels: bool,
     archive: bool,
 ) -> list[dict[str, Any]]:
-    """Add/remove labels across one or more Gmail messages."""
-    try:
+    """Add/remove labels across one or more Gmail messages.
+
+    All messages receive the same change through ``users.messages.batchModify``, so the
+    result echoes the applied label ids rather than each message's full label set.
+    """
+
+    def run() -> list[dict[str, Any]]:
         gmail_service = build_gmail_service()
         names_to_ensure = sorted(set((add_label_names or []) + (remove_label_names or [])))
         label_map = _ensure_labels(gmail_service, names_to_ensure, create_missing_labels)
@@ -343,32 +496,30 @@ async def modify_email_labels_tool(
         if archive:
             remove_label_ids = [*remove_label_ids, "INBOX"]
 
-        results: list[dict[str, Any]] = []
-        for message_id in message_ids:
-            updated = (
-                gmail_service.users()
-                .messages()
-                .modify(
-                    userId="me",
-                    id=message_id,
-                    body={
-                        "addLabelIds": add_label_ids,
-                        "removeLabelIds": remove_label_ids,
-                    },
-                )
-                .execute()
+        if message_ids and (add_label_ids or remove_label_ids):
+            _batch_modify_messages(
+                gmail_service,
+                message_ids,
+                add_label_ids=add_label_ids,
+                remove_label_ids=remove_label_ids,
             )
-            results.append(
-                {
-                    "id": updated.get("id"),
-                    "thread_id": updated.get("threadId"),
-                    "label_ids": updated.get("labelIds") or [],
-                }
-            )
-        return results
-    except Exception as exc:
-        await context.error(_google_error_message(exc))
-        raise
+            store = get_message_store()
+            if store is not None:
+                store.apply_label_change(
+                    message_ids,
+                    add_label_ids=add_label_ids,
+                    remove_label_ids=remove_label_ids,
+                )
+        return [
+            {
+                "id": message_id,
+                "added_label_ids": add_label_ids,
+                "removed_label_ids": remove_label_ids,
+            }
+            for message_id in message_ids
+        ]
+
+    return await _dispatch(context, "modify_email_labels", run, mutating=True)
 
 
 async def archive_emails_tool(context: Context, *, message_ids: list[str]) -> list[dict[str, Any]]:
@@ -385,7 +536,8 @@ async def archive_emails_tool(context: Context, *, message_ids: list[str]) -> li
 
 async def list_calendars_tool(context: Context, *, max_results: int) -> list[dict[str, Any]]:
     """List calendars visible to the connected bot account."""
-    try:
+
+    def run() -> list[dict[str, Any]]:
         calendar_service = build_calendar_service()
         response = calendar_service.calendarList().list(maxResults=max_results).execute()
         return [
@@ -400,9 +552,8 @@ async def list_calendars_tool(context: Context, *, max_results: int) -> list[dic
             for item in (response.get("items") or [])
             if isinstance(item, dict)
         ]
-    except Exception as exc:
-        await context.error(_google_error_message(exc))
-        raise
+
+    return await _dispatch(context, "list_calendars", run)
 
 
 async def search_events_tool(
@@ -414,8 +565,23 @@ async def search_events_tool(
     time_max: str | None,
     max_results: int,
 ) -> list[dict[str, Any]]:
-    """Search Google Calendar events for the requested calendar."""
-    try:
+    """Search Google Calendar events, answered from the local calendar mirror when enabled."""
+
+    def run() -> list[dict[str, Any]]:
+        mirror = get_calendar_mirror()
+        events = None
+        if mirror is not None:
+            events = mirror.search(
+                build_calendar_service,
+                calendar_id,
+                query=query,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+            )
+        if events is not None:
+            return [_event_summary(event) for event in events]
+
         calendar_service = build_calendar_service()
         response = (
             calendar_service.events()
@@ -435,9 +601,8 @@ async def search_events_tool(
             for event in (response.get("items") or [])
             if isinstance(event, dict)
         ]
-    except Exception as exc:
-        await context.error(_google_error_message(exc))
-        raise
+
+    return await _dispatch(context, "search_events", run)
 
 
 async def create_event_tool(
@@ -456,7 +621,8 @@ async def create_event_tool(
     transparency: str | None,
 ) -> dict[str, Any]:
     """Create a Google Calendar event."""
-    try:
+
+    def run() -> dict[str, Any]:
         calendar_service = build_calendar_service()
         body: dict[str, Any] = {
             "summary": title,
@@ -483,10 +649,10 @@ async def create_event_tool(
             conferenceDataVersion=1 if add_google_meet else 0,
         )
         created = request.execute()
+        _mark_calendar_stale(calendar_id)
         return _event_summary(created)
-    except Exception as exc:
-        await context.error(_google_error_message(exc))
-        raise
+
+    return await _dispatch(context, "create_event", run, mutating=True)
 
 
 async def update_event_tool(
@@ -507,7 +673,8 @@ async def update_event_tool(
     transparency: str | None,
 ) -> dict[str, Any]:
     """Update an existing Google Calendar event."""
-    try:
+
+    def run() -> dict[str, Any]:
         calendar_service = build_calendar_service()
         event = calendar_service.events().get(calendarId=calendar_id, eventId=event_id).execute()
 
@@ -558,18 +725,19 @@ async def update_event_tool(
             )
             .execute()
         )
+        _mark_calendar_stale(calendar_id)
         return _event_summary(updated)
-    except Exception as exc:
-        await context.error(_google_error_message(exc))
-        raise
+
+    return await _dispatch(context, "update_event", run, mutating=True)
 
 
 async def delete_event_tool(context: Context, *, event_id: str, calendar_id: str) -> dict[str, Any]:
     """Delete a Google Calendar event."""
-    try:
+
+    def run() -> dict[str, Any]:
         calendar_service = build_calendar_service()
         calendar_service.events().delete(calendarId=calendar_id, eventId=event_id, sendUpdates="all").execute()
+        _mark_calendar_stale(calendar_id)
         return {"deleted": True, "event_id": event_id, "calendar_id": calendar_id}
-    except Exception as exc:
-        await context.error(_google_error_message(exc))
-        raise
+
+    return await _dispatch(context, "delete_event", run, mutating=True)
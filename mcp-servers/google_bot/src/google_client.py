@@ -2,10 +2,38 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
 
 from .oauth_manager import get_google_credentials
 
+T = TypeVar("T")
+
+
+
+def _env_number(name: str, *, default: float) -> float:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+CALL_WORKERS = max(int(_env_number("GOOGLE_BOT_CALL_WORKERS", default=4)), 1)
+CALL_TIMEOUT_SECONDS = _env_number("GOOGLE_BOT_CALL_TIMEOUT_SECONDS", default=60.0)
+
+_executor: ThreadPoolExecutor | None = None
+
+# httplib2 connections are not thread-safe, so each worker thread keeps its own service
+# objects. They are rebuilt only when the in-memory credentials object is replaced.
+_thread_services = threading.local()
+
 
 def _load_google_api_dependencies() -> tuple[Any, Any]:
     try:
@@ -19,19 +47,84 @@ def _load_google_api_dependencies() -> tuple[Any, Any]:
     return build, HttpError
 
 
-def build_gmail_service() -> Any:
-    """Build an authenticated Gmail API client."""
+def _cached_service(api_name: str, api_version: str) -> Any:
+    credentials = get_google_credentials()
+    services: dict[tuple[str, str], tuple[Any, Any]] | None = getattr(
+        _thread_services, "services", None
+    )
+    if services is None:
+        services = _thread_services.services = {}
+
+    cached = services.get((api_name, api_version))
+    if cached is not None and cached[0] is credentials:
+        return cached[1]
+
     build, _ = _load_google_api_dependencies()
-    return build("gmail", "v1", credentials=get_google_credentials(), cache_discovery=False)
+    # static_discovery uses the discovery document bundled with google-api-python-client.
+    service = build(
+        api_name,
+        api_version,
+        credentials=credentials,
+        cache_discovery=False,
+        static_discovery=True,
+    )
+    services[(api_name, api_version)] = (credentials, service)
+    return service
+
+
+def build_gmail_service() -> Any:
+    """Return this thread's authenticated Gmail API client."""
+    return _cached_service("gmail", "v1")
 
 
 def build_calendar_service() -> Any:
-    """Build an authenticated Google Calendar API client."""
-    build, _ = _load_google_api_dependencies()
-    return build("calendar", "v3", credentials=get_google_credentials(), cache_discovery=False)
+    """Return this thread's authenticated Google Calendar API client."""
+    return _cached_service("calendar", "v3")
 
 
 def get_http_error_type() -> Any:
     """Return the Google API HTTP error type for exception handling."""
     _, http_error = _load_google_api_dependencies()
     return http_error
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=CALL_WORKERS, thread_name_prefix="google-call")
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Stop the Google API worker pool, dropping calls that have not started yet."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def run_google_call(
+    label: str,
+    func: Callable[[], T],
+    *,
+    timeout: float | None = None,
+    mutating: bool = False,
+) -> T:
+    """Run blocking Google API work in the bounded worker pool.
+
+    At most ``CALL_WORKERS`` calls run at once; the rest queue. On timeout or cancellation
+    a queued call is dropped, while one already running finishes in its worker and its
+    result is discarded. ``mutating`` calls (sends and writes) are not timed out: the
+    write may still land after a timeout, so reporting failure would invite a duplicate
+    retry.
+    """
+    resolved_timeout = CALL_TIMEOUT_SECONDS if timeout is None else timeout
+    future = asyncio.get_running_loop().run_in_executor(_get_executor(), func)
+    if mutating:
+        return await future
+    try:
+        return await asyncio.wait_for(future, resolved_timeout)
+    except asyncio.TimeoutError as exc:
+        raise TimeoutError(
+            f"Google API call {label} timed out after {resolved_timeout:g} seconds"
+        ) from exc
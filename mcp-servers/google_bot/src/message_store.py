@@ -0,0 +1,289 @@
+"""SQLite store of decoded Gmail messages kept current with ``users.history.list``."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from .google_client import _env_number
+
+logger = structlog.get_logger(__name__)
+
+
+def _default_store_path() -> Path:
+    return Path(__file__).resolve().parents[1] / "cache" / "gmail-messages.sqlite3"
+
+
+GMAIL_CACHE_ENABLED = os.getenv("GOOGLE_BOT_GMAIL_CACHE", "true").lower() not in {
+    "0",
+    "false",
+    "no",
+}
+GMAIL_CACHE_PATH = Path(
+    os.getenv("GOOGLE_BOT_GMAIL_CACHE_PATH", _default_store_path())
+).expanduser()
+GMAIL_SYNC_INTERVAL_SECONDS = _env_number("GOOGLE_BOT_GMAIL_SYNC_INTERVAL_SECONDS", default=60.0)
+GMAIL_CACHE_MAX_MESSAGES = int(_env_number("GOOGLE_BOT_GMAIL_CACHE_MAX_MESSAGES", default=5000))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    message_id TEXT PRIMARY KEY,
+    label_ids TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    detail TEXT,
+    cached_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _is_not_found(exc: Exception) -> bool:
+    return getattr(getattr(exc, "resp", None), "status", None) == 404
+
+
+class GmailMessageStore:
+    """Cache message summaries and decoded bodies, tracking label changes via history.
+
+    Message content never changes once delivered, so summaries and decoded bodies are kept
+    until the message is deleted or evicted past ``max_messages``. Label state is replayed
+    from ``users.history.list`` starting at the stored history id, at most once every
+    ``sync_interval_seconds``. If Google no longer has that history (HTTP 404), the store is
+    cleared and starts again from the mailbox's current history id.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        sync_interval_seconds: float = 60,
+        max_messages: int = 5000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.sync_interval_seconds = sync_interval_seconds
+        self.max_messages = max_messages
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._synced_at: float | None = None
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _history_id(self) -> str | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM sync_state WHERE key = 'history_id'"
+            ).fetchone()
+        return row[0] if row else None
+
+    def _reset(self, history_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM messages")
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_state (key, value) VALUES ('history_id', ?)",
+                (history_id,),
+            )
+
+    def _list_history(
+        self,
+        gmail_service: Any,
+        start_history_id: str,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        records: list[dict[str, Any]] = []
+        page_token: str | None = None
+        while True:
+            params: dict[str, Any] = {"userId": "me", "startHistoryId": start_history_id}
+            if page_token:
+                params["pageToken"] = page_token
+            response = gmail_service.users().history().list(**params).execute()
+            records.extend(record for record in response.get("history") or [] if record)
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return records, response.get("historyId")
+
+    def _apply_history(self, records: list[dict[str, Any]], history_id: str | None) -> int:
+        updated = 0
+        with self._lock, self._connection:
+            for record in records:
+                for entry in record.get("messagesDeleted") or []:
+                    message_id = (entry.get("message") or {}).get("id")
+                    updated += self._connection.execute(
+                        "DELETE FROM messages WHERE message_id = ?", (message_id,)
+                    ).rowcount
+                for key in ("messagesAdded", "labelsAdded", "labelsRemoved"):
+                    for entry in record.get(key) or []:
+                        message = entry.get("message") or {}
+                        if "labelIds" not in message:
+                            continue
+                        updated += self._connection.execute(
+                            "UPDATE messages SET label_ids = ? WHERE message_id = ?",
+                            (json.dumps(message["labelIds"]), message.get("id")),
+                        ).rowcount
+            if history_id:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO sync_state (key, value) VALUES ('history_id', ?)",
+                    (str(history_id),),
+                )
+        return updated
+
+    def sync(self, gmail_service: Any) -> None:
+        """Replay mailbox history since the stored history id onto cached messages."""
+        start_history_id = self._history_id()
+        if start_history_id is None:
+            profile = gmail_service.users().getProfile(userId="me").execute()
+            self._reset(str(profile["historyId"]))
+            logger.info("Gmail message store initialised", history_id=profile["historyId"])
+            return
+        try:
+            records, history_id = self._list_history(gmail_service, start_history_id)
+        except Exception as exc:
+            if not _is_not_found(exc):
+                raise
+            profile = gmail_service.users().getProfile(userId="me").execute()
+            self._reset(str(profile["historyId"]))
+            logger.info("Gmail history expired; message store cleared")
+            return
+        updated = self._apply_history(records, history_id)
+        logger.info("Gmail message store synced", records=len(records), updated=updated)
+
+    def ensure_synced(self, gmail_service_factory: Callable[[], Any]) -> None:
+        """Sync with Gmail unless that happened within ``sync_interval_seconds``."""
+        with self._sync_lock:
+            now = self._clock()
+            if self._synced_at is not None and now - self._synced_at < self.sync_interval_seconds:
+                return
+            self.sync(gmail_service_factory())
+            self._synced_at = now
+
+    def get_summaries(self, message_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Return cached summaries for whichever of ``message_ids`` are stored."""
+        ids = list(message_ids)
+        if not ids:
+            return {}
+        placeholders = ",".join("?" for _ in ids)
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT message_id, label_ids, summary FROM messages "
+                f"WHERE message_id IN ({placeholders})",
+                ids,
+            ).fetchall()
+        return {row[0]: {**json.loads(row[2]), "label_ids": json.loads(row[1])} for row in rows}
+
+    def get_message(self, message_id: str) -> dict[str, Any] | None:
+        """Return the cached summary merged with its decoded body, if the body is stored."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT label_ids, summary, detail FROM messages WHERE message_id = ?",
+                (message_id,),
+            ).fetchone()
+        if row is None or row[2] is None:
+            return None
+        return {**json.loads(row[1]), **json.loads(row[2]), "label_ids": json.loads(row[0])}
+
+    def put(
+        self,
+        summary: dict[str, Any],
+        detail: dict[str, Any] | None = None,
+    ) -> None:
+        """Store a message summary, plus its decoded body when ``detail`` is given."""
+        message_id = summary.get("id")
+        if not isinstance(message_id, str):
+            return
+        with self._lock, self._connection:
+            if detail is None:
+                # Keep an already decoded body when only fresher metadata arrives.
+                self._connection.execute(
+                    "INSERT INTO messages (message_id, label_ids, summary, detail, cached_at) "
+                    "VALUES (?, ?, ?, NULL, ?) ON CONFLICT(message_id) DO UPDATE SET "
+                    "label_ids = excluded.label_ids, summary = excluded.summary",
+                    (
+                        message_id,
+                        json.dumps(summary.get("label_ids") or []),
+                        json.dumps(summary),
+                        self._clock(),
+                    ),
+                )
+            else:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO messages "
+                    "(message_id, label_ids, summary, detail, cached_at) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        message_id,
+                        json.dumps(summary.get("label_ids") or []),
+                        json.dumps(summary),
+                        json.dumps(detail),
+                        self._clock(),
+                    ),
+                )
+            self._connection.execute(
+                "DELETE FROM messages WHERE message_id IN ("
+                "SELECT message_id FROM messages ORDER BY cached_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_messages,),
+            )
+
+    def apply_label_change(
+        self,
+        message_ids: Iterable[str],
+        *,
+        add_label_ids: list[str],
+        remove_label_ids: list[str],
+    ) -> None:
+        """Reflect a label change made through this server before history reports it."""
+        with self._lock, self._connection:
+            for message_id in message_ids:
+                row = self._connection.execute(
+                    "SELECT label_ids FROM messages WHERE message_id = ?", (message_id,)
+                ).fetchone()
+                if row is None:
+                    continue
+                labels = [label for label in json.loads(row[0]) if label not in remove_label_ids]
+                labels.extend(label for label in add_label_ids if label not in labels)
+                self._connection.execute(
+                    "UPDATE messages SET label_ids = ? WHERE message_id = ?",
+                    (json.dumps(labels), message_id),
+                )
+
+
+_message_store: GmailMessageStore | None = None
+_message_store_lock = threading.Lock()
+
+
+def get_message_store() -> GmailMessageStore | None:
+    """Return the process-wide Gmail message store, or ``None`` when it is disabled."""
+    global _message_store
+    if not GMAIL_CACHE_ENABLED:
+        return None
+    with _message_store_lock:
+        if _message_store is None:
+            _message_store = GmailMessageStore(
+                GMAIL_CACHE_PATH,
+                sync_interval_seconds=GMAIL_SYNC_INTERVAL_SECONDS,
+                max_messages=GMAIL_CACHE_MAX_MESSAGES,
+            )
+        return _message_store
+
+
+def close_message_store() -> None:
+    """Close the process-wide Gmail message store if it was opened."""
+    global _message_store
+    with _message_store_lock:
+        if _message_store is not None:
+            _message_store.close()
+            _message_store = None
@@ -6,6 +6,7 @@ import json
 import os
 import stat
 import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
@@ -43,6 +44,11 @@ class GoogleBotAuthMissingError(GoogleBotAuthError):
 
 
 _CREDENTIAL_LOCK = threading.Lock()
+REFRESH_MARGIN = timedelta(minutes=5)
+
+# Process-lifetime credentials, reloaded only when the token file changes on disk.
+_cached_credentials: Any | None = None
+_cached_token_mtime_ns: int | None = None
 
 
 def _write_json_secure(path: Path, data: dict[str, Any]) -> None:
@@ -98,27 +104,64 @@ def _refresh_credentials(credentials: Any, request_cls: Any) -> Any:
     return credentials
 
 
+def _expires_soon(credentials: Any) -> bool:
+    expiry = getattr(credentials, "expiry", None)
+    if expiry is None:
+        return False
+    # google-auth stores expiry as a naive UTC datetime.
+    if expiry.tzinfo is None:
+        expiry = expiry.replace(tzinfo=timezone.utc)
+    return expiry - datetime.now(timezone.utc) <= REFRESH_MARGIN
+
+
+def _load_credentials_from_file(credentials_cls: Any) -> Any:
+    token_payload = _load_json_file(TOKEN_FILE)
+    credentials = credentials_cls.from_authorized_user_info(token_payload or {}, SCOPES)
+
+    granted_scopes = token_payload.get("granted_scopes") if token_payload else None
+    if not _scopes_match(granted_scopes or credentials.scopes):
+        raise GoogleBotAuthMissingError(
+            "Google bot token is missing required scopes. "
+            "Re-run 'python3 mcp-servers/google_bot/oauth_setup.py --client-secret-file <path>'."
+        )
+    return credentials
+
+
+def reset_google_credentials() -> None:
+    """Drop the in-memory credentials so the next call reloads the token file."""
+    global _cached_credentials, _cached_token_mtime_ns
+    with _CREDENTIAL_LOCK:
+        _cached_credentials = None
+        _cached_token_mtime_ns = None
+
+
 def get_google_credentials() -> Any:
-    """Return valid Google OAuth credentials for the repo-managed bot account."""
+    """Return valid Google OAuth credentials for the repo-managed bot account.
+
+    Credentials stay in memory for the life of the process. The token file is re-read only
+    when its mtime changes, and the access token is refreshed only when it is invalid or
+    within ``REFRESH_MARGIN`` of expiry.
+    """
+    global _cached_credentials, _cached_token_mtime_ns
     with _CREDENTIAL_LOCK:
-        if not TOKEN_FILE.exists():
+        try:
+            token_mtime_ns = TOKEN_FILE.stat().st_mtime_ns
+        except FileNotFoundError:
+            _cached_credentials = None
             raise GoogleBotAuthMissingError(
                 f"Google bot token file is missing: {TOKEN_FILE}. "
                 "Run 'python3 mcp-servers/google_bot/oauth_setup.py --client-secret-file <path>'."
-            )
+            ) from None
 
         Credentials, Request = _load_google_auth_dependencies()
-        token_payload = _load_json_file(TOKEN_FILE)
-        credentials = Credentials.from_authorized_user_info(token_payload or {}, SCOPES)
-
-        granted_scopes = token_payload.get("granted_scopes") if token_payload else None
-        if not _scopes_match(granted_scopes or credentials.scopes):
-            raise GoogleBotAuthMissingError(
-                "Google bot token is missing required scopes. "
-                "Re-run 'python3 mcp-servers/google_bot/oauth_setup.py --client-secret-file <path>'."
-            )
+        credentials = _cached_credentials
+        if credentials is None or token_mtime_ns != _cached_token_mtime_ns:
+            credentials = _load_credentials_from_file(Credentials)
 
-        if credentials.expired or not credentials.valid:
+        if not credentials.valid or _expires_soon(credentials):
             credentials = _refresh_credentials(credentials, Request)
+            token_mtime_ns = TOKEN_FILE.stat().st_mtime_ns
 
+        _cached_credentials = credentials
+        _cached_token_mtime_ns = token_mtime_ns
         return credentials
@@ -0,0 +1,265 @@
+"""Tests for the local Google Calendar mirror."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from src.calendar_mirror import CalendarMirror
+from src.google_bot_mcp import tools
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 4, 20, tzinfo=timezone.utc).timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _GoneError(Exception):
+    class resp:  # noqa: N801
+        status = 410
+
+
+class _FakeRequest:
+    def __init__(self, result: Any) -> None:
+        self.result = result
+
+    def execute(self) -> Any:
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def _event(event_id: str, summary: str, start: str, end: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "status": "confirmed",
+        "summary": summary,
+        "start": {"dateTime": start},
+        "end": {"dateTime": end},
+        **extra,
+    }
+
+
+class _FakeCalendarService:
+    """Serves queued ``events().list`` responses and records the parameters used."""
+
+    def __init__(self, responses: list[Any]) -> None:
+        self.responses = list(responses)
+        self.list_calls: list[dict[str, Any]] = []
+
+    def events(self) -> _FakeCalendarService:
+        return self
+
+    def list(self, **kwargs: Any) -> _FakeRequest:
+        self.list_calls.append(kwargs)
+        return _FakeRequest(self.responses.pop(0))
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture
+def mirror(tmp_path, clock: _Clock) -> Iterator[CalendarMirror]:  # noqa: ANN001
+    calendar_mirror = CalendarMirror(
+        tmp_path / "calendar.sqlite3",
+        max_staleness_seconds=60,
+        outage_grace_seconds=3600,
+        clock=clock,
+    )
+    yield calendar_mirror
+    calendar_mirror.close()
+
+
+def _search(mirror: CalendarMirror, service: _FakeCalendarService, **kwargs: Any) -> list[str]:
+    params = {"query": None, "time_min": None, "time_max": None, "max_results": 20, **kwargs}
+    events = mirror.search(lambda: service, "primary", **params)
+    return [event["id"] for event in events]
+
+
+def test_full_sync_then_local_range_and_text_queries(mirror: CalendarMirror) -> None:
+    service = _FakeCalendarService(
+        [
+            {
+                "items": [
+                    _event(
+                        "late",
+                        "Dinner",
+                        "2026-04-20T18:00:00-07:00",
+                        "2026-04-20T19:00:00-07:00",
+                    ),
+                ],
+                "nextPageToken": "page-2",
+            },
+            {
+                "items": [
+                    _event(
+                        "early",
+                        "Lift session",
+                        "2026-04-20T07:00:00-07:00",
+                        "2026-04-20T08:00:00-07:00",
+                        location="Gym",
+                    ),
+                    {"id": "gone", "status": "cancelled"},
+                ],
+                "nextSyncToken": "token-1",
+            },
+        ]
+    )
+
+    assert _search(mirror, service) == ["early", "late"]
+    assert _search(mirror, service, query="gym") == ["early"]
+    assert _search(mirror, service, time_min="2026-04-20T15:30:00Z") == ["late"]
+    assert _search(mirror, service, time_max="2026-04-20T15:00:00Z") == ["early"]
+    assert _search(mirror, service, max_results=1) == ["early"]
+
+    assert len(service.list_calls) == 2
+    assert "syncToken" not in service.list_calls[0]
+    assert service.list_calls[1]["pageToken"] == "page-2"
+
+
+def test_stale_mirror_applies_incremental_changes(mirror: CalendarMirror, clock: _Clock) -> None:
+    service = _FakeCalendarService(
+        [
+            {
+                "items": [
+                    _event("a", "Standup", "2026-04-20T09:00:00Z", "2026-04-20T09:15:00Z"),
+                    _event("b", "Review", "2026-04-20T10:00:00Z", "2026-04-20T11:00:00Z"),
+                ],
+                "nextSyncToken": "token-1",
+            },
+            {
+                "items": [
+                    {"id": "a", "status": "cancelled"},
+                    _event("c", "Planning", "2026-04-21T09:00:00Z", "2026-04-21T10:00:00Z"),
+                ],
+                "nextSyncToken": "token-2",
+            },
+        ]
+    )
+
+    _search(mirror, service)
+    clock.now += 61
+
+    assert _search(mirror, service) == ["b", "c"]
+    assert service.list_calls[1]["syncToken"] == "token-1"
+
+
+def test_expired_sync_token_triggers_full_resync(mirror: CalendarMirror, clock: _Clock) -> None:
+    service = _FakeCalendarService(
+        [
+            {
+                "items": [_event("a", "Old", "2026-04-20T09:00:00Z", "2026-04-20T10:00:00Z")],
+                "nextSyncToken": "token-1",
+            },
+            _GoneError(),
+            {
+                "items": [_event("b", "New", "2026-04-20T09:00:00Z", "2026-04-20T10:00:00Z")],
+                "nextSyncToken": "token-2",
+            },
+        ]
+    )
+
+    _search(mirror, service)
+    mirror.mark_stale("primary")
+
+    assert _search(mirror, service) == ["b"]
+    assert "syncToken" not in service.list_calls[2]
+
+
+def test_outage_serves_mirror_within_grace_period(mirror: CalendarMirror, clock: _Clock) -> None:
+    service = _FakeCalendarService(
+        [
+            {
+                "items": [_event("a", "Standup", "2026-04-20T09:00:00Z", "2026-04-20T09:15:00Z")],
+                "nextSyncToken": "token-1",
+            },
+            RuntimeError("backend unavailable"),
+            RuntimeError("backend unavailable"),
+        ]
+    )
+
+    _search(mirror, service)
+    clock.now += 120
+    assert _search(mirror, service) == ["a"]
+
+    clock.now += 3600
+    with pytest.raises(RuntimeError, match="backend unavailable"):
+        _search(mirror, service)
+
+
+def test_full_sync_is_bounded_and_outside_searches_fall_through(
+    mirror: CalendarMirror, clock: _Clock
+) -> None:
+    service = _FakeCalendarService(
+        [
+            {
+                "items": [_event("a", "Standup", "2026-04-20T09:00:00Z", "2026-04-20T09:15:00Z")],
+                "nextSyncToken": "token-1",
+            },
+            {"items": [], "nextSyncToken": "token-2"},
+        ]
+    )
+
+    assert _search(mirror, service, time_min="2026-04-01T00:00:00Z") == ["a"]
+    assert service.list_calls[0]["timeMin"] == "2026-03-21T00:00:00+00:00"
+    assert service.list_calls[0]["timeMax"] == "2027-04-20T00:00:00+00:00"
+
+    params = {"query": None, "time_max": None, "max_results": 20}
+    assert (
+        mirror.search(lambda: service, "primary", time_min="2025-01-01T00:00:00Z", **params) is None
+    )
+    assert len(service.list_calls) == 1
+
+    # Once less than half of the future window is left, the next sync moves the window.
+    clock.now += 200 * 86400
+    _search(mirror, service, time_min="2026-11-01T00:00:00Z")
+    assert "syncToken" not in service.list_calls[1]
+    assert service.list_calls[1]["timeMin"] == "2026-10-07T00:00:00+00:00"
+
+
+class _FakeWriteService:
+    def __init__(self) -> None:
+        self.deleted: list[str] = []
+
+    def events(self) -> _FakeWriteService:
+        return self
+
+    def delete(self, **kwargs: Any) -> _FakeRequest:
+        self.deleted.append(kwargs["eventId"])
+        return _FakeRequest("")
+
+
+class _FakeContext:
+    async def error(self, message: str) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_delete_event_marks_calendar_stale(monkeypatch, mirror: CalendarMirror) -> None:
+    service = _FakeCalendarService(
+        [
+            {
+                "items": [_event("a", "Standup", "2026-04-20T09:00:00Z", "2026-04-20T09:15:00Z")],
+                "nextSyncToken": "token-1",
+            },
+            {"items": [{"id": "a", "status": "cancelled"}], "nextSyncToken": "token-2"},
+        ]
+    )
+    write_service = _FakeWriteService()
+    monkeypatch.setattr(tools, "get_calendar_mirror", lambda: mirror)
+    monkeypatch.setattr(tools, "build_calendar_service", lambda: write_service)
+
+    assert _search(mirror, service) == ["a"]
+    await tools.delete_event_tool(_FakeContext(), event_id="a", calendar_id="primary")
+
+    assert write_service.deleted == ["a"]
+    assert _search(mirror, service) == []
+    assert service.list_calls[1]["syncToken"] == "token-1"
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src import google_client, oauth_manager
+
+
+class _FakeCredentials:
+    loads = 0
+
+    def __init__(self, payload: dict) -> None:
+        self.token = payload.get("token")
+        self.refresh_token = payload.get("refresh_token")
+        self.scopes = list(oauth_manager.SCOPES)
+        self.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+        self.refreshes = 0
+
+    @classmethod
+    def from_authorized_user_info(cls, payload: dict, scopes: tuple[str, ...]) -> _FakeCredentials:
+        cls.loads += 1
+        return cls(payload)
+
+    @property
+    def valid(self) -> bool:
+        return self.token is not None
+
+    def refresh(self, request: object) -> None:
+        self.refreshes += 1
+        self.token = f"refreshed-{self.refreshes}"
+        self.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+
+    def to_json(self) -> str:
+        return json.dumps({"token": self.token, "refresh_token": self.refresh_token})
+
+
+@pytest.fixture
+def token_file(tmp_path, monkeypatch):
+    path = tmp_path / "tokens.json"
+    path.write_text(
+        json.dumps(
+            {
+                "token": "initial",
+                "refresh_token": "refresh",
+                "granted_scopes": list(oauth_manager.SCOPES),
+            }
+        ),
+        encoding="utf-8",
+    )
+    _FakeCredentials.loads = 0
+    monkeypatch.setattr(oauth_manager, "TOKEN_FILE", path)
+    monkeypatch.setattr(
+        oauth_manager, "_load_google_auth_dependencies", lambda: (_FakeCredentials, object)
+    )
+    oauth_manager.reset_google_credentials()
+    yield path
+    oauth_manager.reset_google_credentials()
+
+
+def test_credentials_are_reused_in_memory(token_file):
+    first = oauth_manager.get_google_credentials()
+    second = oauth_manager.get_google_credentials()
+
+    assert second is first
+    assert _FakeCredentials.loads == 1
+    assert first.refreshes == 0
+
+
+def test_credentials_refresh_only_near_expiry(token_file):
+    credentials = oauth_manager.get_google_credentials()
+    credentials.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=2)
+
+    refreshed = oauth_manager.get_google_credentials()
+
+    assert refreshed is credentials
+    assert refreshed.refreshes == 1
+    assert _FakeCredentials.loads == 1
+    assert json.loads(token_file.read_text(encoding="utf-8"))["token"] == "refreshed-1"
+
+
+def test_credentials_reload_when_token_file_changes(token_file):
+    first = oauth_manager.get_google_credentials()
+    stat = token_file.stat()
+    os.utime(token_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    second = oauth_manager.get_google_credentials()
+
+    assert second is not first
+    assert _FakeCredentials.loads == 2
+
+
+def test_services_are_cached_per_thread_and_credentials(monkeypatch):
+    builds: list[tuple[str, str, bool]] = []
+    credentials = [object()]
+
+    def fake_build(name, version, *, credentials, cache_discovery, static_discovery):
+        builds.append((name, version, static_discovery))
+        return object()
+
+    monkeypatch.setattr(google_client, "_load_google_api_dependencies", lambda: (fake_build, None))
+    monkeypatch.setattr(google_client, "get_google_credentials", lambda: credentials[0])
+    monkeypatch.setattr(google_client, "_thread_services", threading.local())
+
+    gmail = google_client.build_gmail_service()
+    assert google_client.build_gmail_service() is gmail
+    google_client.build_calendar_service()
+
+    other_thread: list[object] = []
+    thread = threading.Thread(
+        target=lambda: other_thread.append(google_client.build_gmail_service())
+    )
+    thread.start()
+    thread.join()
+
+    credentials[0] = object()
+    assert google_client.build_gmail_service() is not gmail
+
+    assert other_thread[0] is not gmail
+    assert builds == [
+        ("gmail", "v1", True),
+        ("calendar", "v3", True),
+        ("gmail", "v1", True),
+        ("gmail", "v1", True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_google_call_times_out():
+    release = threading.Event()
+
+    try:
+        with pytest.raises(TimeoutError, match="search_events timed out after 0.05 seconds"):
+            await google_client.run_google_call(
+                "search_events",
+                lambda: release.wait(timeout=5),
+                timeout=0.05,
+            )
+    finally:
+        release.set()
+
+
+@pytest.mark.asyncio
+async def test_run_google_call_returns_worker_result():
+    result = await google_client.run_google_call("noop", lambda: "done")
+
+    assert result == "done"
+
+
+@pytest.mark.asyncio
+async def test_mutating_calls_are_not_timed_out(monkeypatch):
+    monkeypatch.setattr(google_client, "CALL_TIMEOUT_SECONDS", 0.01)
+
+    def slow_send() -> str:
+        time.sleep(0.1)
+        return "sent"
+
+    assert await google_client.run_google_call("send_email", slow_send, mutating=True) == "sent"
+
+
+def test_env_numbers_fall_back_on_malformed_values(monkeypatch):
+    monkeypatch.setenv("GOOGLE_BOT_CALL_TIMEOUT_SECONDS", "sixty")
+
+    assert google_client._env_number("GOOGLE_BOT_CALL_TIMEOUT_SECONDS", default=60.0) == 60.0
+    assert google_client._env_number("GOOGLE_BOT_CALL_WORKERS_UNSET", default=4) == 4
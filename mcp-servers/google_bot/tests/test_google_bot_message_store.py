@@ -0,0 +1,249 @@
+"""Tests for the local Gmail message store."""
+
+from __future__ import annotations
+
+import base64
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.google_bot_mcp import tools
+from src.message_store import GmailMessageStore
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _NotFoundError(Exception):
+    class resp:  # noqa: N801
+        status = 404
+
+
+class _FakeRequest:
+    def __init__(self, result: Any) -> None:
+        self.result = result
+
+    def execute(self) -> Any:
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def _encoded(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii")
+
+
+class _FakeGmailService:
+    """Gmail fake with a history id, queued history pages, and full-format messages."""
+
+    def __init__(self) -> None:
+        self.history_id = "100"
+        self.history_pages: list[Any] = []
+        self.history_calls: list[dict[str, Any]] = []
+        self.get_calls: list[dict[str, Any]] = []
+        self.labels = {"m1": ["INBOX", "UNREAD"], "m2": ["INBOX"]}
+
+    def users(self) -> _FakeGmailService:
+        return self
+
+    def messages(self) -> _FakeGmailService:
+        return self
+
+    def history(self) -> _FakeGmailService:
+        return self
+
+    def getProfile(self, **kwargs: Any) -> _FakeRequest:  # noqa: N802
+        return _FakeRequest({"emailAddress": "bot@example.com", "historyId": self.history_id})
+
+    def list(self, **kwargs: Any) -> _FakeRequest:
+        if "startHistoryId" in kwargs:
+            self.history_calls.append(kwargs)
+            return _FakeRequest(self.history_pages.pop(0))
+        return _FakeRequest({"messages": [{"id": "m1"}, {"id": "m2"}]})
+
+    def get(self, **kwargs: Any) -> _FakeRequest:
+        self.get_calls.append(kwargs)
+        message_id = kwargs["id"]
+        return _FakeRequest(
+            {
+                "id": message_id,
+                "threadId": f"thread-{message_id}",
+                "labelIds": self.labels[message_id],
+                "payload": {
+                    "mimeType": "text/plain",
+                    "headers": [{"name": "Subject", "value": f"Subject {message_id}"}],
+                    "body": {"data": _encoded(f"Body of {message_id}")},
+                },
+            }
+        )
+
+    def new_batch_http_request(self, callback: Any) -> _FakeBatch:
+        return _FakeBatch(callback)
+
+
+class _FakeBatch:
+    def __init__(self, callback: Any) -> None:
+        self.callback = callback
+        self.requests: list[tuple[str, _FakeRequest]] = []
+
+    def add(self, request: _FakeRequest, request_id: str) -> None:
+        self.requests.append((request_id, request))
+
+    def execute(self) -> None:
+        for request_id, request in self.requests:
+            self.callback(request_id, request.execute(), None)
+
+
+class _FakeContext:
+    async def error(self, message: str) -> None:
+        return None
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture
+def store(tmp_path, clock: _Clock) -> Iterator[GmailMessageStore]:  # noqa: ANN001
+    message_store = GmailMessageStore(
+        tmp_path / "gmail.sqlite3",
+        sync_interval_seconds=60,
+        max_messages=10,
+        clock=clock,
+    )
+    yield message_store
+    message_store.close()
+
+
+@pytest.fixture
+def service(monkeypatch, store: GmailMessageStore) -> _FakeGmailService:
+    gmail_service = _FakeGmailService()
+    monkeypatch.setattr(tools, "build_gmail_service", lambda: gmail_service)
+    monkeypatch.setattr(tools, "get_message_store", lambda: store)
+    return gmail_service
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_are_served_from_the_store(service: _FakeGmailService) -> None:
+    first = await tools.read_email_tool(_FakeContext(), "m1")
+    second = await tools.read_email_tool(_FakeContext(), "m1")
+
+    assert second == first
+    assert first["plain_text_body"] == "Body of m1"
+    assert first["label_ids"] == ["INBOX", "UNREAD"]
+    assert len(service.get_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_history_sync_updates_cached_label_state(
+    service: _FakeGmailService,
+    clock: _Clock,
+) -> None:
+    await tools.read_email_tool(_FakeContext(), "m1")
+    service.history_pages = [
+        {
+            "history": [
+                {"labelsRemoved": [{"message": {"id": "m1", "labelIds": ["INBOX"]}}]},
+            ],
+            "nextPageToken": "page-2",
+        },
+        {
+            "history": [
+                {"labelsAdded": [{"message": {"id": "m1", "labelIds": ["INBOX", "STARRED"]}}]},
+            ],
+            "historyId": "120",
+        },
+    ]
+    clock.now += 61
+
+    message = await tools.read_email_tool(_FakeContext(), "m1")
+
+    assert message["label_ids"] == ["INBOX", "STARRED"]
+    assert len(service.get_calls) == 1
+    assert service.history_calls[0]["startHistoryId"] == "100"
+    assert service.history_calls[1]["pageToken"] == "page-2"
+
+
+@pytest.mark.asyncio
+async def test_deleted_messages_are_dropped_from_the_store(
+    service: _FakeGmailService,
+    clock: _Clock,
+) -> None:
+    await tools.read_email_tool(_FakeContext(), "m1")
+    service.history_pages = [
+        {"history": [{"messagesDeleted": [{"message": {"id": "m1"}}]}], "historyId": "101"}
+    ]
+    clock.now += 61
+
+    await tools.read_email_tool(_FakeContext(), "m1")
+
+    assert len(service.get_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_search_reuses_cached_summaries(service: _FakeGmailService) -> None:
+    await tools.read_email_tool(_FakeContext(), "m1")
+
+    results = await tools.search_emails_tool(_FakeContext(), query="in:inbox", max_results=10)
+
+    assert [result["subject"] for result in results] == ["Subject m1", "Subject m2"]
+    assert [call["id"] for call in service.get_calls] == ["m1", "m2"]
+    assert service.get_calls[1]["format"] == "metadata"
+
+
+def test_expired_history_clears_the_store(
+    store: GmailMessageStore,
+    clock: _Clock,
+) -> None:
+    gmail_service = _FakeGmailService()
+    store.sync(gmail_service)
+    store.put({"id": "m1", "label_ids": ["INBOX"]}, {"plain_text_body": "cached"})
+    gmail_service.history_pages = [_NotFoundError()]
+    gmail_service.history_id = "500"
+
+    store.sync(gmail_service)
+
+    assert store.get_message("m1") is None
+    assert store._history_id() == "500"
+
+
+def test_label_changes_and_eviction(store: GmailMessageStore, clock: _Clock) -> None:
+    for index in range(12):
+        clock.now += 1
+        store.put({"id": f"m{index}", "label_ids": ["INBOX"]}, {"plain_text_body": str(index)})
+
+    store.apply_label_change(["m11"], add_label_ids=["Label_1"], remove_label_ids=["INBOX"])
+
+    assert store.get_message("m0") is None
+    assert store.get_message("m11")["label_ids"] == ["Label_1"]
+    assert len(store.get_summaries(f"m{index}" for index in range(12))) == 10
+
+
+def test_malformed_env_settings_fall_back_to_defaults(monkeypatch):
+    # Import in a fresh interpreter: module-level settings are read once at import.
+    monkeypatch.setenv("GOOGLE_BOT_GMAIL_SYNC_INTERVAL_SECONDS", "a minute")
+    monkeypatch.setenv("GOOGLE_BOT_GMAIL_CACHE_MAX_MESSAGES", "5k")
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from src import message_store as m; "
+            "print(m.GMAIL_SYNC_INTERVAL_SECONDS, m.GMAIL_CACHE_MAX_MESSAGES)",
+        ],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.split() == ["60.0", "5000"]
@@ -1,8 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from src.google_bot_mcp import tools
 from src.google_bot_mcp.tools import _decode_body_data, _event_summary, _extract_text_bodies
 
 
+@pytest.fixture(autouse=True)
+def _live_google_reads(monkeypatch):
+    """Exercise the API paths; the local mirror and message store have their own tests."""
+    monkeypatch.setattr(tools, "get_calendar_mirror", lambda: None)
+    monkeypatch.setattr(tools, "get_message_store", lambda: None)
+
+
 def test_decode_body_data_handles_base64url():
     assert _decode_body_data("SGVsbG8=") == "Hello"
 
@@ -38,3 +53,283 @@ def test_event_summary_handles_datetime_and_attendees():
     assert summary["calendar_id"] == "claudiamooney00@gmail.com"
     assert summary["start"] == "2026-04-20T18:00:00-07:00"
     assert summary["attendees"][0]["email"] == "a@example.com"
+
+
+class _FakeRequest:
+    def __init__(self, result: Any) -> None:
+        self.result = result
+
+    def execute(self) -> Any:
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+class _FakeBatch:
+    def __init__(self, service: _FakeGmailService, callback: Any) -> None:
+        self.service = service
+        self.callback = callback
+        self.requests: list[tuple[str, _FakeRequest]] = []
+
+    def add(self, request: _FakeRequest, request_id: str) -> None:
+        self.requests.append((request_id, request))
+
+    def execute(self) -> None:
+        self.service.batch_sizes.append(len(self.requests))
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except Exception as exc:
+                self.callback(request_id, None, exc)
+
+
+class _FakeGmailService:
+    def __init__(
+        self,
+        message_ids: list[str],
+        failing: set[str] | None = None,
+        failing_once: set[str] | None = None,
+    ) -> None:
+        self.message_ids = message_ids
+        self.failing = failing or set()
+        self.failing_once = set(failing_once or ())
+        self.batch_sizes: list[int] = []
+        self.list_kwargs: dict[str, Any] = {}
+        self.get_kwargs: list[dict[str, Any]] = []
+
+    def users(self) -> _FakeGmailService:
+        return self
+
+    def messages(self) -> _FakeGmailService:
+        return self
+
+    def list(self, **kwargs: Any) -> _FakeRequest:
+        self.list_kwargs = kwargs
+        return _FakeRequest({"messages": [{"id": message_id} for message_id in self.message_ids]})
+
+    def get(self, **kwargs: Any) -> _FakeRequest:
+        self.get_kwargs.append(kwargs)
+        message_id = kwargs["id"]
+        if message_id in self.failing:
+            return _FakeRequest(RuntimeError(f"boom {message_id}"))
+        if message_id in self.failing_once:
+            self.failing_once.discard(message_id)
+            return _FakeRequest(RuntimeError("429 Too many concurrent requests for user"))
+        return _FakeRequest(
+            {
+                "id": message_id,
+                "threadId": f"thread-{message_id}",
+                "payload": {"headers": [{"name": "Subject", "value": f"Subject {message_id}"}]},
+            }
+        )
+
+    def new_batch_http_request(self, callback: Any) -> _FakeBatch:
+        return _FakeBatch(self, callback)
+
+
+class _FakeContext:
+    def __init__(self) -> None:
+        self.errors: list[str] = []
+
+    async def error(self, message: str) -> None:
+        self.errors.append(message)
+
+
+@pytest.mark.asyncio
+async def test_search_emails_fetches_metadata_in_batches(monkeypatch):
+    message_ids = [f"m{index}" for index in range(60)]
+    service = _FakeGmailService(message_ids)
+    monkeypatch.setattr(tools, "build_gmail_service", lambda: service)
+
+    results = await tools.search_emails_tool(_FakeContext(), query="in:inbox", max_results=60)
+
+    assert [result["id"] for result in results] == message_ids
+    assert results[0]["subject"] == "Subject m0"
+    assert service.batch_sizes == [50, 10]
+    assert service.list_kwargs["fields"] == "messages/id"
+    assert service.get_kwargs[0]["fields"] == tools.MESSAGE_METADATA_FIELDS
+    assert service.get_kwargs[0]["format"] == "metadata"
+
+
+@pytest.mark.asyncio
+async def test_search_emails_retries_failed_batch_items(monkeypatch):
+    monkeypatch.setattr(tools, "GMAIL_BATCH_RETRY_DELAY_SECONDS", 0)
+    service = _FakeGmailService(["m1", "m2", "m3"], failing_once={"m2"})
+    monkeypatch.setattr(tools, "build_gmail_service", lambda: service)
+    context = _FakeContext()
+
+    results = await tools.search_emails_tool(context, query=None, max_results=10)
+
+    assert [result["id"] for result in results] == ["m1", "m2", "m3"]
+    assert service.batch_sizes == [3, 1]
+    assert context.errors == []
+
+
+@pytest.mark.asyncio
+async def test_search_emails_raises_items_that_keep_failing(monkeypatch):
+    monkeypatch.setattr(tools, "GMAIL_BATCH_RETRY_DELAY_SECONDS", 0)
+    service = _FakeGmailService(["m1", "m2"], failing={"m2"})
+    monkeypatch.setattr(tools, "build_gmail_service", lambda: service)
+    context = _FakeContext()
+
+    with pytest.raises(RuntimeError, match="boom m2"):
+        await tools.search_emails_tool(context, query=None, max_results=10)
+
+    assert service.batch_sizes == [2, 1, 1]
+    assert context.errors == ["boom m2"]
+
+
+class _SlowService:
+    """Stands in for both Gmail and Calendar: every request blocks for ``delay`` seconds."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.threads: set[str] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args, **kwargs: self
+
+    def execute(self) -> dict[str, Any]:
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return {"id": "item", "items": [], "payload": {}}
+
+
+@pytest.mark.asyncio
+async def test_calendar_and_email_calls_overlap_off_the_event_loop(monkeypatch):
+    service = _SlowService(delay=0.2)
+    monkeypatch.setattr(tools, "build_gmail_service", lambda: service)
+    monkeypatch.setattr(tools, "build_calendar_service", lambda: service)
+    context = _FakeContext()
+
+    started = time.monotonic()
+    email, events = await asyncio.gather(
+        tools.read_email_tool(context, "item"),
+        tools.search_events_tool(
+            context,
+            calendar_id="primary",
+            query=None,
+            time_min=None,
+            time_max=None,
+            max_results=10,
+        ),
+    )
+
+    assert email["id"] == "item"
+    assert events == []
+    assert time.monotonic() - started < 0.35
+    assert all(name.startswith("google-call") for name in service.threads)
+
+
+
+class _FakeLabelService:
+    def __init__(self, label_ids: dict[str, str]) -> None:
+        self.label_ids = dict(label_ids)
+        self.list_calls = 0
+        self.created: list[str] = []
+        self.batch_modify_bodies: list[dict[str, Any]] = []
+
+    def users(self) -> _FakeLabelService:
+        return self
+
+    def labels(self) -> _FakeLabelService:
+        return self
+
+    def messages(self) -> _FakeLabelService:
+        return self
+
+    def list(self, **kwargs: Any) -> _FakeRequest:
+        self.list_calls += 1
+        labels = [{"id": label_id, "name": name} for name, label_id in self.label_ids.items()]
+        return _FakeRequest({"labels": labels})
+
+    def create(self, **kwargs: Any) -> _FakeRequest:
+        name = kwargs["body"]["name"]
+        self.created.append(name)
+        self.label_ids[name] = f"Label_{name}"
+        return _FakeRequest({"id": self.label_ids[name], "name": name})
+
+    def batchModify(self, **kwargs: Any) -> _FakeRequest:  # noqa: N802
+        self.batch_modify_bodies.append(kwargs["body"])
+        return _FakeRequest("")
+
+
+@pytest.fixture
+def label_service(monkeypatch):
+    service = _FakeLabelService({"INBOX": "INBOX", "Receipts": "Label_1"})
+    monkeypatch.setattr(tools, "build_gmail_service", lambda: service)
+    tools.invalidate_label_cache()
+    yield service
+    tools.invalidate_label_cache()
+
+
+@pytest.mark.asyncio
+async def test_archive_emails_uses_batch_modify_chunks(label_service):
+    message_ids = [f"m{index}" for index in range(2500)]
+
+    results = await tools.archive_emails_tool(_FakeContext(), message_ids=message_ids)
+
+    assert [len(body["ids"]) for body in label_service.batch_modify_bodies] == [1000, 1000, 500]
+    assert label_service.batch_modify_bodies[0]["removeLabelIds"] == ["INBOX"]
+    assert results[0] == {"id": "m0", "added_label_ids": [], "removed_label_ids": ["INBOX"]}
+    assert len(results) == 2500
+
+
+@pytest.mark.asyncio
+async def test_label_map_is_cached_and_refreshed_on_create(label_service):
+    context = _FakeContext()
+
+    for _ in range(3):
+        await tools.modify_email_labels_tool(
+            context,
+            message_ids=["m1"],
+            add_label_names=["Receipts"],
+            remove_label_names=None,
+            create_missing_labels=False,
+            archive=False,
+        )
+    assert label_service.list_calls == 1
+
+    await tools.modify_email_labels_tool(
+        context,
+        message_ids=["m1", "m2"],
+        add_label_names=["Travel"],
+        remove_label_names=None,
+        create_missing_labels=True,
+        archive=True,
+    )
+    await tools.modify_email_labels_tool(
+        context,
+        message_ids=["m1"],
+        add_label_names=["Travel"],
+        remove_label_names=None,
+        create_missing_labels=False,
+        archive=False,
+    )
+
+    assert label_service.created == ["Travel"]
+    # One re-list on the cache miss for "Travel", one after the create invalidated the map.
+    assert label_service.list_calls == 3
+    assert label_service.batch_modify_bodies[3] == {
+        "ids": ["m1", "m2"],
+        "addLabelIds": ["Label_Travel"],
+        "removeLabelIds": ["INBOX"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_unknown_label_without_create_reports_error(label_service):
+    context = _FakeContext()
+
+    with pytest.raises(ValueError, match="Gmail label does not exist: Missing"):
+        await tools.modify_email_labels_tool(
+            context,
+            message_ids=["m1"],
+            add_label_names=["Missing"],
+            remove_label_names=None,
+            create_missing_labels=False,
+            archive=False,
+        )
+
+    assert context.errors == ["Gmail label does not exist: Missing"]
+    assert label_service.batch_modify_bodies == []
@@ -6,6 +6,8 @@ from __future__ import annotations
 import logging
 import os
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
@@ -44,6 +46,7 @@ from mcp.server import FastMCP
 from mcp.server.fastmcp import Context
 
 from src.oauth_manager import UnrecoverableTokenError, load_and_init_oauth
+from src.whoop_api.client import close_http_pool, get_http_pool
 from src.whoop_mcp import tools
 
 logger = structlog.get_logger(__name__)
@@ -63,8 +66,19 @@ except Exception as exc:  # pragma: no cover - startup warning path
     logger.warning("WHOOP OAuth initialization warning", error=str(exc))
 
 
+@asynccontextmanager
+async def whoop_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Own the pooled WHOOP HTTP client for the lifetime of the server."""
+    get_http_pool()
+    try:
+        yield
+    finally:
+        await close_http_pool()
+
+
 mcp = FastMCP(
     name="whoop",
+    lifespan=whoop_lifespan,
     instructions=(
         "WHOOP MCP server for ATLAS. Provides high-level, provider-agnostic daily tools for "
         "sleep, recovery, cycle, and workout data. Prefer these normalized tools over raw WHOOP "
@@ -113,6 +127,32 @@ async def get_daily_workouts(
     return await tools.get_daily_workouts_tool(context, start_date, end_date)
 
 
+@mcp.tool()
+async def get_daily_overview(
+    context: Context,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> list[dict[str, Any]]:
+    """Get WHOOP sleep, recovery, and cycle data per day in one call (YYYY-MM-DD format).
+
+    The three collections are fetched concurrently, so prefer this over three separate calls.
+    """
+    return await tools.get_daily_overview_tool(context, start_date, end_date)
+
+
+@mcp.tool()
+async def get_daily_summary_range(
+    context: Context,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> dict[str, Any]:
+    """Get a compact per-day WHOOP table (recovery, sleep, strain, workouts) for a date range.
+
+    Prefer this over per-day calls for trends: each WHOOP collection is fetched once.
+    """
+    return await tools.get_daily_summary_range_tool(context, start_date, end_date)
+
+
 if __name__ == "__main__":
     logger.info("Starting WHOOP MCP server")
     mcp.run()
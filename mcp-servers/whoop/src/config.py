@@ -32,6 +32,18 @@ class Settings(BaseSettings):
         default="America/Los_Angeles",
         validation_alias="WHOOP_LOCAL_TIMEZONE",
     )
+    whoop_cache_enabled: bool = Field(default=True, validation_alias="WHOOP_CACHE_ENABLED")
+    whoop_cache_path: str | None = Field(default=None, validation_alias="WHOOP_CACHE_PATH")
+    whoop_cache_open_days: int = Field(default=3, validation_alias="WHOOP_CACHE_OPEN_DAYS")
+    whoop_cache_open_ttl_seconds: int = Field(
+        default=300,
+        validation_alias="WHOOP_CACHE_OPEN_TTL_SECONDS",
+    )
+    whoop_rate_limit_per_minute: int = Field(
+        default=100,
+        validation_alias="WHOOP_RATE_LIMIT_PER_MINUTE",
+    )
+    whoop_rate_limit_burst: int = Field(default=10, validation_alias="WHOOP_RATE_LIMIT_BURST")
 
 
 @lru_cache
@@ -1,5 +1,24 @@
 """WHOOP API client exports."""
 
-from .client import RateLimitError, WhoopAPIError, WhoopClient
+from .client import (
+    RateLimitError,
+    WhoopAPIError,
+    WhoopClient,
+    WhoopHTTPPool,
+    close_http_pool,
+    get_http_pool,
+)
+from .rate_limiter import TokenBucket, get_rate_limiter
+from .record_cache import WhoopRecordCache
 
-__all__ = ["RateLimitError", "WhoopAPIError", "WhoopClient"]
+__all__ = [
+    "RateLimitError",
+    "TokenBucket",
+    "WhoopAPIError",
+    "WhoopClient",
+    "WhoopHTTPPool",
+    "WhoopRecordCache",
+    "close_http_pool",
+    "get_http_pool",
+    "get_rate_limiter",
+]
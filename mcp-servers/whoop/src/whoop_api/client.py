@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import Any
 
@@ -10,6 +12,7 @@ import httpx
 import structlog
 
 from ..config import settings
+from .rate_limiter import TokenBucket
 
 logger = structlog.get_logger(__name__)
 
@@ -42,6 +45,13 @@ def _to_utc_iso(value: datetime) -> str:
     return value.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+def _retry_after_seconds(response: httpx.Response, default: int = 60) -> int:
+    try:
+        return max(int(response.headers.get("Retry-After", default)), 0)
+    except ValueError:
+        return default
+
+
 class WhoopClient:
     """Async WHOOP client for ATLAS health integrations."""
 
@@ -49,24 +59,42 @@ class WhoopClient:
     MAX_RETRIES = 3
     PAGE_LIMIT = 25
 
-    def __init__(self, access_token: str) -> None:
+    def __init__(
+        self,
+        access_token: str | None = None,
+        *,
+        token_provider: Callable[[], str] | None = None,
+        pool: WhoopHTTPPool | None = None,
+        rate_limiter: TokenBucket | None = None,
+    ) -> None:
+        if access_token is None and token_provider is None:
+            raise ValueError("WhoopClient needs an access_token or a token_provider")
         self.base_url = settings.whoop_api_base_url
         self.access_token = access_token
+        self._token_provider = token_provider
+        self._pool = pool
+        self._rate_limiter = rate_limiter
         self.session: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> WhoopClient:
-        """Open the shared async HTTP client."""
-        self.session = httpx.AsyncClient(timeout=httpx.Timeout(self.REQUEST_TIMEOUT))
+        """Borrow the pooled HTTP client, or open a private one when no pool is given."""
+        if self._pool is not None:
+            self.session = self._pool.client
+        else:
+            self.session = httpx.AsyncClient(timeout=httpx.Timeout(self.REQUEST_TIMEOUT))
         return self
 
     async def __aexit__(self, exc_type: Any, exc: Any, exc_tb: Any) -> None:
-        """Close the shared async HTTP client."""
-        if self.session is not None:
+        """Close a private HTTP client; pooled connections stay open for reuse."""
+        if self.session is not None and self._pool is None:
             await self.session.aclose()
+        self.session = None
 
     def _headers(self) -> dict[str, str]:
+        # Resolve the token per request so a long-lived pool never sends an expired one.
+        token = self._token_provider() if self._token_provider is not None else self.access_token
         return {
-            "Authorization": f"Bearer {self.access_token}",
+            "Authorization": f"Bearer {token}",
             "Accept": "application/json",
             "User-Agent": "atlas-whoop-mcp/1.0.0",
         }
@@ -84,6 +112,8 @@ class WhoopClient:
 
         url = f"{self.base_url}{endpoint}"
         for attempt in range(retries + 1):
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
             try:
                 response = await self.session.get(url, headers=self._headers(), params=params)
             except httpx.RequestError as exc:
@@ -92,13 +122,26 @@ class WhoopClient:
                     continue
                 raise WhoopAPIError(f"WHOOP request failed: {exc}") from exc
 
+            if self._pool is not None:
+                logger.debug(
+                    "WHOOP request completed",
+                    endpoint=endpoint,
+                    status_code=response.status_code,
+                    http_version=response.http_version,
+                    **self._pool.stats(),
+                )
+
             if response.status_code == 200:
                 return response.json()
 
             if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", "60"))
+                retry_after = _retry_after_seconds(response)
                 if attempt < retries:
-                    await asyncio.sleep(retry_after)
+                    if self._rate_limiter is not None:
+                        # Pause the shared bucket so concurrent requests back off together.
+                        self._rate_limiter.pause(retry_after)
+                    else:
+                        await asyncio.sleep(retry_after)
                     continue
                 raise RateLimitError(retry_after)
 
@@ -181,3 +224,82 @@ class WhoopClient:
     ) -> list[dict[str, Any]]:
         """Get all workout records in the requested window."""
         return await self._collect_records("/activity/workout", start=start, end=end)
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class WhoopHTTPPool:
+    """Process-wide pooled ``httpx.AsyncClient`` shared by every WHOOP request.
+
+    HTTP/2 is used when the optional ``h2`` package is installed. Request and new
+    connection counts come from httpcore trace events, so ``stats()`` shows reuse.
+    """
+
+    MAX_CONNECTIONS = 10
+    MAX_KEEPALIVE_CONNECTIONS = 5
+    KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+    def __init__(
+        self,
+        *,
+        http2: bool | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.http2 = _http2_available() if http2 is None else http2
+        self.requests = 0
+        self.connections_opened = 0
+        self.client = httpx.AsyncClient(
+            http2=self.http2,
+            timeout=httpx.Timeout(WhoopClient.REQUEST_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS,
+                max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=self.KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            transport=transport,
+            event_hooks={"request": [self._on_request]},
+        )
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        self.requests += 1
+        request.extensions["trace"] = self._trace
+
+    async def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return request and connection counters for debug logging."""
+        return {
+            "http2": self.http2,
+            "pool_requests": self.requests,
+            "pool_connections_opened": self.connections_opened,
+            "pool_connections_reused": max(self.requests - self.connections_opened, 0),
+        }
+
+    async def aclose(self) -> None:
+        """Close every pooled connection."""
+        await self.client.aclose()
+
+
+_http_pool: WhoopHTTPPool | None = None
+
+
+def get_http_pool() -> WhoopHTTPPool:
+    """Return the process-wide WHOOP HTTP pool, creating it on first use."""
+    global _http_pool
+    if _http_pool is None or _http_pool.client.is_closed:
+        _http_pool = WhoopHTTPPool()
+        logger.info("WHOOP HTTP pool opened", http2=_http_pool.http2)
+    return _http_pool
+
+
+async def close_http_pool() -> None:
+    """Close the process-wide WHOOP HTTP pool if it was opened."""
+    global _http_pool
+    if _http_pool is not None:
+        logger.info("WHOOP HTTP pool closed", **_http_pool.stats())
+        await _http_pool.aclose()
+        _http_pool = None
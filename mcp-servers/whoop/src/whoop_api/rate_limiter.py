@@ -0,0 +1,93 @@
+"""Process-wide token-bucket rate limiter for WHOOP API requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+import structlog
+
+from ..config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class TokenBucket:
+    """Async token bucket that also honours server-imposed pauses.
+
+    Tokens refill at ``rate`` per second up to ``capacity``. Waiters queue on one lock so
+    they are served in arrival order. ``pause`` drains the bucket and blocks every caller
+    until the deadline, so a single 429 backs off all concurrent requests together.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("TokenBucket needs a positive rate and a capacity of at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting as needed; return the seconds spent waiting."""
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = self._clock()
+                delay = self._paused_until - now
+                if delay <= 0:
+                    self._refill(now)
+                    # Tolerate float drift so a refill of exactly one token always counts.
+                    if self._tokens >= 1 - 1e-9:
+                        self._tokens = max(self._tokens - 1, 0.0)
+                        break
+                    delay = (1 - self._tokens) / self.rate
+                await self._sleep(delay)
+                waited += delay
+        if waited:
+            logger.debug("WHOOP rate limiter delayed request", waited_seconds=round(waited, 3))
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Block all callers for ``seconds``, then resume with a single token."""
+        now = self._clock()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = 1.0
+        self._updated_at = max(self._updated_at, self._paused_until)
+        logger.info("WHOOP rate limiter paused", seconds=seconds)
+
+
+_rate_limiter: TokenBucket | None = None
+
+
+def get_rate_limiter() -> TokenBucket:
+    """Return the process-wide WHOOP rate limiter built from settings."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = TokenBucket(
+            settings.whoop_rate_limit_per_minute / 60,
+            settings.whoop_rate_limit_burst,
+        )
+    return _rate_limiter
+
+
+def set_rate_limiter(limiter: TokenBucket | None) -> None:
+    """Replace the process-wide WHOOP rate limiter (mainly for tests)."""
+    global _rate_limiter
+    _rate_limiter = limiter
@@ -0,0 +1,249 @@
+"""SQLite-backed cache of WHOOP collection records with incremental day sync."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+COLLECTIONS = ("sleep", "recovery", "cycle", "workout")
+Fetcher = Callable[[datetime, datetime], Awaitable[list[dict[str, Any]]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    collection TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    updated_at TEXT,
+    start_at TEXT NOT NULL,
+    end_at TEXT,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (collection, record_id)
+);
+CREATE INDEX IF NOT EXISTS records_window ON records (collection, start_at);
+CREATE TABLE IF NOT EXISTS synced_days (
+    collection TEXT NOT NULL,
+    day TEXT NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (collection, day)
+);
+"""
+
+
+def _utc_iso(value: datetime) -> str:
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _parse_utc(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, timezone.utc)
+
+
+def _record_bounds(record: dict[str, Any]) -> tuple[str, str | None] | None:
+    """Return the (start, end) UTC instants a record occupies, if it has any."""
+    start_value = record.get("start") or record.get("created_at")
+    if not isinstance(start_value, str):
+        return None
+    start_at = _utc_iso(_parse_utc(start_value))
+    end_value = record.get("end") if "start" in record else start_value
+    end_at = _utc_iso(_parse_utc(end_value)) if isinstance(end_value, str) else None
+    return start_at, end_at
+
+
+def _record_id(collection: str, record: dict[str, Any]) -> str | None:
+    # Recovery records have no id of their own; WHOOP keys them by cycle.
+    value = record.get("id") if collection != "recovery" else record.get("cycle_id")
+    if value is None:
+        value = record.get("id")
+    return None if value is None else str(value)
+
+
+class WhoopRecordCache:
+    """Persist WHOOP records by id and refetch only days that may still change.
+
+    Sync happens in UTC days. A day is closed once it was last synced more than
+    ``open_days`` after it ended, and is not fetched again; any other day is refetched
+    when its last sync is older than ``open_ttl_seconds``, so a day first synced while
+    still open picks up later workouts and re-scores. A fetched day is authoritative:
+    cached records starting that day that WHOOP no longer returns (such as a deleted
+    workout) are dropped. Reads return cached records overlapping the requested window.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        open_days: int = 3,
+        open_ttl_seconds: int = 300,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.open_days = open_days
+        self.open_ttl_seconds = open_ttl_seconds
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._lock = threading.Lock()
+        self._sync_locks: dict[str, asyncio.Lock] = {}
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _synced_days(self, collection: str, days: list[date]) -> dict[str, datetime]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT day, synced_at FROM synced_days WHERE collection = ? AND day BETWEEN ? AND ?",
+                (collection, days[0].isoformat(), days[-1].isoformat()),
+            ).fetchall()
+        return {day: _parse_utc(synced_at) for day, synced_at in rows}
+
+    def stale_days(self, collection: str, start: datetime, end: datetime) -> list[date]:
+        """Return the UTC days in ``[start, end)`` that need a fetch from WHOOP."""
+        first_day = start.astimezone(timezone.utc).date()
+        last_day = (end.astimezone(timezone.utc) - timedelta(microseconds=1)).date()
+        if last_day < first_day:
+            return []
+        days = [first_day + timedelta(days=offset) for offset in range((last_day - first_day).days + 1)]
+
+        now = self._clock()
+        synced = self._synced_days(collection, days)
+        stale: list[date] = []
+        for day in days:
+            synced_at = synced.get(day.isoformat())
+            if synced_at is None:
+                stale.append(day)
+            elif synced_at < self._closes_at(day) and (
+                (now - synced_at).total_seconds() > self.open_ttl_seconds
+            ):
+                stale.append(day)
+        return stale
+
+    def _closes_at(self, day: date) -> datetime:
+        """Return when ``day`` stops changing; only a sync after this makes it final."""
+        return _day_start(day + timedelta(days=1 + self.open_days))
+
+    def store(
+        self,
+        collection: str,
+        records: list[dict[str, Any]],
+        *,
+        synced_days: list[date],
+    ) -> None:
+        """Replace the cached records of ``synced_days`` with ``records`` and mark them synced.
+
+        A record only replaces its cached copy when its ``updated_at`` is not older. Cached
+        records starting on a synced day but missing from ``records`` are deleted.
+        """
+        synced_at = _utc_iso(self._clock())
+        rows = []
+        for record in records:
+            record_id = _record_id(collection, record)
+            bounds = _record_bounds(record)
+            if record_id is None or bounds is None:
+                continue
+            rows.append(
+                (
+                    collection,
+                    record_id,
+                    record.get("updated_at"),
+                    bounds[0],
+                    bounds[1],
+                    json.dumps(record, sort_keys=True),
+                )
+            )
+
+        fetched_ids = {row[1] for row in rows}
+        with self._lock, self._connection:
+            for day in synced_days:
+                day_start = _utc_iso(_day_start(day))
+                day_end = _utc_iso(_day_start(day + timedelta(days=1)))
+                cached_ids = self._connection.execute(
+                    "SELECT record_id FROM records "
+                    "WHERE collection = ? AND start_at >= ? AND start_at < ?",
+                    (collection, day_start, day_end),
+                ).fetchall()
+                self._connection.executemany(
+                    "DELETE FROM records WHERE collection = ? AND record_id = ?",
+                    [
+                        (collection, record_id)
+                        for (record_id,) in cached_ids
+                        if record_id not in fetched_ids
+                    ],
+                )
+            self._connection.executemany(
+                """
+                INSERT INTO records (collection, record_id, updated_at, start_at, end_at, payload)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (collection, record_id) DO UPDATE SET
+                    updated_at = excluded.updated_at,
+                    start_at = excluded.start_at,
+                    end_at = excluded.end_at,
+                    payload = excluded.payload
+                WHERE records.updated_at IS NULL
+                    OR excluded.updated_at IS NULL
+                    OR excluded.updated_at >= records.updated_at
+                """,
+                rows,
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO synced_days (collection, day, synced_at) VALUES (?, ?, ?)",
+                [(collection, day.isoformat(), synced_at) for day in synced_days],
+            )
+
+    def load(self, collection: str, start: datetime, end: datetime) -> list[dict[str, Any]]:
+        """Return cached records that overlap ``[start, end)``, ordered by start."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT payload FROM records WHERE collection = ? AND start_at < ? "
+                "AND (end_at IS NULL OR end_at >= ?) ORDER BY start_at",
+                (collection, _utc_iso(end), _utc_iso(start)),
+            ).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    async def get_records(
+        self,
+        collection: str,
+        fetch: Fetcher,
+        *,
+        start: datetime,
+        end: datetime,
+    ) -> list[dict[str, Any]]:
+        """Sync stale days for ``collection`` through ``fetch`` and return cached records."""
+        lock = self._sync_locks.setdefault(collection, asyncio.Lock())
+        async with lock:
+            stale = self.stale_days(collection, start, end)
+            for run in _contiguous_runs(stale):
+                run_start = _day_start(run[0])
+                run_end = _day_start(run[-1] + timedelta(days=1))
+                records = await fetch(run_start, run_end)
+                self.store(collection, records, synced_days=run)
+            logger.debug(
+                "WHOOP record cache lookup",
+                collection=collection,
+                fetched_days=len(stale),
+            )
+        return self.load(collection, start, end)
+
+
+def _contiguous_runs(days: list[date]) -> list[list[date]]:
+    runs: list[list[date]] = []
+    for day in days:
+        if runs and day - runs[-1][-1] == timedelta(days=1):
+            runs[-1].append(day)
+        else:
+            runs.append([day])
+    return runs
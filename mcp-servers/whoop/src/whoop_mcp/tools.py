@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date, datetime, time, timedelta
+from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -11,12 +13,32 @@ from mcp.server.fastmcp import Context
 
 from src.config import settings
 from src.oauth_manager import get_valid_access_token
-from src.whoop_api.client import WhoopClient
+from src.whoop_api.client import WhoopClient, get_http_pool
+from src.whoop_api.rate_limiter import get_rate_limiter
+from src.whoop_api.record_cache import WhoopRecordCache
 
 logger = structlog.get_logger(__name__)
 
 
 DEFAULT_LOOKBACK_DAYS = 7
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[2] / "cache" / "whoop-records.sqlite3"
+MAX_RANGE_DAYS = 92
+DAILY_SUMMARY_COLUMNS = (
+    "date",
+    "recovery_score",
+    "hrv_rmssd_ms",
+    "resting_heart_rate_bpm",
+    "spo2_percentage",
+    "skin_temp_celsius",
+    "sleep_performance",
+    "asleep_hours",
+    "sleep_efficiency",
+    "respiratory_rate",
+    "strain",
+    "kilojoule",
+    "workout_count",
+    "workout_minutes",
+)
 
 
 def _local_timezone() -> ZoneInfo:
@@ -274,9 +296,123 @@ def normalize_workout_record(record: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def build_daily_summary_table(
+    days: list[date],
+    *,
+    sleep_records: list[dict[str, Any]],
+    recovery_records: list[dict[str, Any]],
+    cycle_records: list[dict[str, Any]],
+    workout_records: list[dict[str, Any]],
+) -> list[list[Any]]:
+    """Project WHOOP collections onto one row per day in ``DAILY_SUMMARY_COLUMNS`` order."""
+    workouts_by_day: dict[str, list[dict[str, Any]]] = {}
+    for record in workout_records:
+        workout = normalize_workout_record(record)
+        if workout["date"]:
+            workouts_by_day.setdefault(workout["date"], []).append(workout)
+
+    rows: list[list[Any]] = []
+    for target_day in days:
+        values: dict[str, Any] = {"date": target_day.isoformat()}
+        if (record := select_recovery_for_day(recovery_records, target_day)) is not None:
+            values.update(normalize_recovery_record(record, target_day))
+        if (record := select_primary_sleep(sleep_records, target_day)) is not None:
+            values.update(normalize_sleep_record(record, target_day))
+        if (record := select_cycle_for_day(cycle_records, target_day)) is not None:
+            values.update(normalize_cycle_record(record, target_day))
+
+        workouts = workouts_by_day.get(target_day.isoformat(), [])
+        values["workout_count"] = len(workouts)
+        values["workout_minutes"] = _round_or_none(
+            sum(workout["duration_minutes"] or 0 for workout in workouts)
+        )
+        rows.append([values.get(column) for column in DAILY_SUMMARY_COLUMNS])
+    return rows
+
+
+_record_cache: WhoopRecordCache | None = None
+
+
+def set_record_cache(cache: WhoopRecordCache | None) -> None:
+    """Inject the WHOOP record cache used by the daily tools."""
+    global _record_cache
+    _record_cache = cache
+
+
+def get_record_cache() -> WhoopRecordCache | None:
+    """Return the shared WHOOP record cache, creating it on first use when enabled."""
+    global _record_cache
+    if _record_cache is None and settings.whoop_cache_enabled:
+        _record_cache = WhoopRecordCache(
+            settings.whoop_cache_path or DEFAULT_CACHE_PATH,
+            open_days=settings.whoop_cache_open_days,
+            open_ttl_seconds=settings.whoop_cache_open_ttl_seconds,
+        )
+    return _record_cache
+
+
+async def _get_collection(
+    client: WhoopClient,
+    collection: str,
+    *,
+    start: datetime,
+    end: datetime,
+) -> list[dict[str, Any]]:
+    """Read a WHOOP collection through the record cache, syncing only stale days."""
+    fetchers = {
+        "sleep": client.get_sleep_collection,
+        "recovery": client.get_recovery_collection,
+        "cycle": client.get_cycle_collection,
+        "workout": client.get_workout_collection,
+    }
+    fetch = fetchers[collection]
+    cache = get_record_cache()
+    if cache is None:
+        return await fetch(start=start, end=end)
+    return await cache.get_records(
+        collection,
+        lambda fetch_start, fetch_end: fetch(start=fetch_start, end=fetch_end),
+        start=start,
+        end=end,
+    )
+
+
+async def _get_collections(
+    client: WhoopClient,
+    windows: dict[str, tuple[datetime, datetime]],
+) -> tuple[dict[str, list[dict[str, Any]]], dict[str, str]]:
+    """Fetch several collections concurrently; failed ones come back empty with an error.
+
+    Raises when every collection fails so callers can report a single error.
+    """
+    results = await asyncio.gather(
+        *(
+            _get_collection(client, name, start=start, end=end)
+            for name, (start, end) in windows.items()
+        ),
+        return_exceptions=True,
+    )
+    resolved: dict[str, list[dict[str, Any]]] = {}
+    errors: dict[str, str] = {}
+    for name, result in zip(windows, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning("WHOOP collection fetch failed", collection=name, error=str(result))
+            errors[name] = str(result)
+            resolved[name] = []
+        else:
+            resolved[name] = result
+    if len(errors) == len(resolved):
+        raise RuntimeError("; ".join(f"{name}: {error}" for name, error in errors.items()))
+    return resolved, errors
+
+
 async def get_whoop_client() -> WhoopClient:
-    """Return an authenticated WHOOP client."""
-    return WhoopClient(access_token=get_valid_access_token())
+    """Return a WHOOP client on the shared pool and rate limiter, fetching a token per request."""
+    return WhoopClient(
+        token_provider=get_valid_access_token,
+        pool=get_http_pool(),
+        rate_limiter=get_rate_limiter(),
+    )
 
 
 async def get_daily_sleep_tool(
@@ -289,7 +425,9 @@ async def get_daily_sleep_tool(
     try:
         days, window_start, window_end = _resolve_requested_dates(start_date, end_date)
         async with await get_whoop_client() as client:
-            records = await client.get_sleep_collection(
+            records = await _get_collection(
+                client,
+                "sleep",
                 start=window_start - timedelta(days=1),
                 end=window_end + timedelta(days=1),
             )
@@ -314,7 +452,9 @@ async def get_daily_recovery_tool(
     try:
         days, window_start, window_end = _resolve_requested_dates(start_date, end_date)
         async with await get_whoop_client() as client:
-            records = await client.get_recovery_collection(
+            records = await _get_collection(
+                client,
+                "recovery",
                 start=window_start - timedelta(days=1),
                 end=window_end + timedelta(days=1),
             )
@@ -339,7 +479,9 @@ async def get_daily_cycle_tool(
     try:
         days, window_start, window_end = _resolve_requested_dates(start_date, end_date)
         async with await get_whoop_client() as client:
-            records = await client.get_cycle_collection(
+            records = await _get_collection(
+                client,
+                "cycle",
                 start=window_start - timedelta(days=1),
                 end=window_end + timedelta(days=1),
             )
@@ -364,7 +506,9 @@ async def get_daily_workouts_tool(
     try:
         _, window_start, window_end = _resolve_requested_dates(start_date, end_date)
         async with await get_whoop_client() as client:
-            records = await client.get_workout_collection(start=window_start, end=window_end)
+            records = await _get_collection(
+                client, "workout", start=window_start, end=window_end
+            )
         workouts = [normalize_workout_record(record) for record in records]
         return sorted(
             workouts,
@@ -373,3 +517,84 @@ async def get_daily_workouts_tool(
     except Exception as exc:
         logger.error("Failed to get WHOOP workouts", error=str(exc))
         return [{"error": f"Failed to retrieve WHOOP workouts: {exc}"}]
+
+
+async def get_daily_summary_range_tool(
+    context: Context,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> dict[str, Any]:
+    """Get a compact per-day WHOOP table for a date range from one fetch per collection."""
+    del context
+    try:
+        days, window_start, window_end = _resolve_requested_dates(start_date, end_date)
+        if len(days) > MAX_RANGE_DAYS:
+            raise ValueError(f"Date range is limited to {MAX_RANGE_DAYS} days")
+
+        padded_start = window_start - timedelta(days=1)
+        padded_end = window_end + timedelta(days=1)
+        async with await get_whoop_client() as client:
+            resolved, errors = await _get_collections(
+                client,
+                {
+                    "sleep": (padded_start, padded_end),
+                    "recovery": (padded_start, padded_end),
+                    "cycle": (padded_start, padded_end),
+                    "workout": (window_start, window_end),
+                },
+            )
+
+        summary: dict[str, Any] = {
+            "source": "whoop",
+            "start_date": days[0].isoformat(),
+            "end_date": days[-1].isoformat(),
+            "columns": list(DAILY_SUMMARY_COLUMNS),
+            "rows": build_daily_summary_table(
+                days,
+                sleep_records=resolved["sleep"],
+                recovery_records=resolved["recovery"],
+                cycle_records=resolved["cycle"],
+                workout_records=resolved["workout"],
+            ),
+        }
+        if errors:
+            summary["errors"] = errors
+        return summary
+    except Exception as exc:
+        logger.error("Failed to get WHOOP daily summary range", error=str(exc))
+        return {"error": f"Failed to retrieve WHOOP daily summary range: {exc}"}
+
+
+async def get_daily_overview_tool(
+    context: Context,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> list[dict[str, Any]]:
+    """Get WHOOP sleep, recovery, and cycle data per day from concurrent collection fetches."""
+    del context
+    try:
+        days, window_start, window_end = _resolve_requested_dates(start_date, end_date)
+        padded = (window_start - timedelta(days=1), window_end + timedelta(days=1))
+        async with await get_whoop_client() as client:
+            resolved, errors = await _get_collections(
+                client,
+                {"sleep": padded, "recovery": padded, "cycle": padded},
+            )
+
+        overview: list[dict[str, Any]] = []
+        for target_day in days:
+            entry: dict[str, Any] = {"date": target_day.isoformat(), "source": "whoop"}
+            for name, select, normalize in (
+                ("sleep", select_primary_sleep, normalize_sleep_record),
+                ("recovery", select_recovery_for_day, normalize_recovery_record),
+                ("cycle", select_cycle_for_day, normalize_cycle_record),
+            ):
+                record = select(resolved[name], target_day)
+                entry[name] = normalize(record, target_day) if record is not None else None
+            if errors:
+                entry["errors"] = errors
+            overview.append(entry)
+        return overview
+    except Exception as exc:
+        logger.error("Failed to get WHOOP daily overview", error=str(exc))
+        return [{"error": f"Failed to retrieve WHOOP daily overview: {exc}"}]
@@ -1 +1,24 @@
 """Local pytest helpers for the WHOOP package."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_record_cache(request, tmp_path):
+    """Point the test module's WHOOP tools at a throwaway record cache.
+
+    The repo-wide conftest re-imports ``src`` when switching between MCP servers, so the
+    cache is injected into the exact ``tools`` module the test imported.
+    """
+    tools = getattr(request.module, "tools", None)
+    if tools is None:
+        yield None
+        return
+
+    cache = tools.WhoopRecordCache(tmp_path / "whoop-records.sqlite3")
+    tools.set_record_cache(cache)
+    yield cache
+    tools.set_record_cache(None)
+    cache.close()
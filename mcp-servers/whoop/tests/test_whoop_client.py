@@ -0,0 +1,63 @@
+"""Unit tests for the pooled WHOOP HTTP client."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from src.whoop_api.client import WhoopClient, WhoopHTTPPool
+
+
+def _pool_with_handler(handler) -> WhoopHTTPPool:
+    return WhoopHTTPPool(http2=False, transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_pooled_clients_share_session_and_fetch_token_per_request() -> None:
+    seen_tokens: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_tokens.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"user_id": 1})
+
+    pool = _pool_with_handler(handler)
+    tokens = iter(["token-1", "token-2"])
+
+    async with WhoopClient(token_provider=lambda: next(tokens), pool=pool) as client:
+        assert client.session is pool.client
+        await client.get_profile()
+    async with WhoopClient(token_provider=lambda: next(tokens), pool=pool) as client:
+        await client.get_profile()
+
+    assert seen_tokens == ["Bearer token-1", "Bearer token-2"]
+    assert not pool.client.is_closed
+    assert pool.stats()["pool_requests"] == 2
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_count_new_and_reused_connections() -> None:
+    pool = _pool_with_handler(lambda request: httpx.Response(200, json={}))
+    pool.requests = 3
+    await pool._trace("connection.connect_tcp.complete", {})
+    await pool._trace("http11.send_request_headers.complete", {})
+
+    stats = pool.stats()
+
+    assert stats["pool_connections_opened"] == 1
+    assert stats["pool_connections_reused"] == 2
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_client_without_pool_closes_its_private_session() -> None:
+    async with WhoopClient(access_token="token") as client:
+        session = client.session
+
+    assert session is not None
+    assert session.is_closed
+
+
+def test_client_requires_a_token_source() -> None:
+    with pytest.raises(ValueError, match="access_token or a token_provider"):
+        WhoopClient()
@@ -0,0 +1,72 @@
+"""Unit tests for the shared WHOOP rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.whoop_api.client import WhoopClient, WhoopHTTPPool
+from src.whoop_api.rate_limiter import TokenBucket
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_spaces_requests() -> None:
+    clock = _FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+    waits = [await bucket.acquire() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 0.5, 0.5]
+    assert clock.now == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause_blocks_concurrent_callers() -> None:
+    clock = _FakeClock()
+    bucket = TokenBucket(rate=10, capacity=5, clock=clock, sleep=clock.sleep)
+    bucket.pause(3)
+
+    await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+    assert clock.sleeps[0] == 3
+    assert clock.now >= 3
+
+
+def test_token_bucket_rejects_invalid_settings() -> None:
+    with pytest.raises(ValueError, match="positive rate"):
+        TokenBucket(rate=0, capacity=1)
+
+
+@pytest.mark.asyncio
+async def test_client_pauses_shared_bucket_on_429() -> None:
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(200, json={"user_id": 1}),
+        ]
+    )
+    pool = WhoopHTTPPool(http2=False, transport=httpx.MockTransport(lambda _: next(responses)))
+    clock = _FakeClock()
+    bucket = TokenBucket(rate=100, capacity=10, clock=clock, sleep=clock.sleep)
+
+    async with WhoopClient(access_token="token", pool=pool, rate_limiter=bucket) as client:
+        profile = await client.get_profile()
+
+    assert profile == {"user_id": 1}
+    assert clock.sleeps == [7]
+    await pool.aclose()
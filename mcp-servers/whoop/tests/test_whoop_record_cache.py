@@ -0,0 +1,175 @@
+"""Tests for the SQLite-backed WHOOP record cache."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.whoop_api.record_cache import WhoopRecordCache
+
+NOW = datetime(2026, 4, 20, 18, 0, tzinfo=timezone.utc)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class _Fetcher:
+    def __init__(self, records: list[dict]) -> None:
+        self.records = records
+        self.calls: list[tuple[datetime, datetime]] = []
+
+    async def __call__(self, start: datetime, end: datetime) -> list[dict]:
+        self.calls.append((start, end))
+        return [
+            record
+            for record in self.records
+            if start <= datetime.fromisoformat(record["start"].replace("Z", "+00:00")) < end
+        ]
+
+
+def _sleep(record_id: str, start: str, end: str, updated_at: str = "2026-04-01T00:00:00Z") -> dict:
+    return {"id": record_id, "start": start, "end": end, "updated_at": updated_at}
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock) -> WhoopRecordCache:
+    store = WhoopRecordCache(tmp_path / "cache.sqlite3", open_days=2, open_ttl_seconds=300, clock=clock)
+    yield store
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_closed_days_are_fetched_once(cache) -> None:
+    fetcher = _Fetcher([_sleep("a", "2026-04-10T06:00:00Z", "2026-04-10T14:00:00Z")])
+    start = datetime(2026, 4, 9, tzinfo=timezone.utc)
+    end = datetime(2026, 4, 12, tzinfo=timezone.utc)
+
+    first = await cache.get_records("sleep", fetcher, start=start, end=end)
+    second = await cache.get_records("sleep", fetcher, start=start, end=end)
+
+    assert [record["id"] for record in first] == ["a"]
+    assert second == first
+    assert fetcher.calls == [(start, end)]
+
+
+@pytest.mark.asyncio
+async def test_overlapping_ranges_only_fetch_missing_days(cache) -> None:
+    fetcher = _Fetcher([])
+    await cache.get_records(
+        "sleep",
+        fetcher,
+        start=datetime(2026, 4, 5, tzinfo=timezone.utc),
+        end=datetime(2026, 4, 8, tzinfo=timezone.utc),
+    )
+    await cache.get_records(
+        "sleep",
+        fetcher,
+        start=datetime(2026, 4, 6, tzinfo=timezone.utc),
+        end=datetime(2026, 4, 10, tzinfo=timezone.utc),
+    )
+
+    assert fetcher.calls[-1] == (
+        datetime(2026, 4, 8, tzinfo=timezone.utc),
+        datetime(2026, 4, 10, tzinfo=timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_open_days_refetch_after_ttl_and_keep_newest_version(cache, clock) -> None:
+    fetcher = _Fetcher([_sleep("today", "2026-04-20T06:00:00Z", "2026-04-20T14:00:00Z")])
+    start = datetime(2026, 4, 20, tzinfo=timezone.utc)
+    end = start + timedelta(days=1)
+
+    await cache.get_records("sleep", fetcher, start=start, end=end)
+    await cache.get_records("sleep", fetcher, start=start, end=end)
+    assert len(fetcher.calls) == 1
+
+    fetcher.records = [
+        _sleep("today", "2026-04-20T06:00:00Z", "2026-04-20T14:30:00Z", "2026-04-20T15:00:00Z")
+    ]
+    clock.now = NOW + timedelta(minutes=10)
+    records = await cache.get_records("sleep", fetcher, start=start, end=end)
+
+    assert len(fetcher.calls) == 2
+    assert records[0]["end"] == "2026-04-20T14:30:00Z"
+
+
+@pytest.mark.asyncio
+async def test_day_synced_while_open_is_refetched_after_it_closes(cache, clock) -> None:
+    fetcher = _Fetcher([_sleep("early", "2026-04-20T06:00:00Z", "2026-04-20T07:00:00Z")])
+    start = datetime(2026, 4, 20, tzinfo=timezone.utc)
+    end = start + timedelta(days=1)
+    await cache.get_records("sleep", fetcher, start=start, end=end)
+
+    fetcher.records.append(_sleep("late", "2026-04-20T19:00:00Z", "2026-04-20T20:00:00Z"))
+    clock.now = NOW + timedelta(days=5)
+    records = await cache.get_records("sleep", fetcher, start=start, end=end)
+    assert [record["id"] for record in records] == ["early", "late"]
+
+    # The second sync happened after the day closed, so it is final.
+    clock.now = NOW + timedelta(days=10)
+    await cache.get_records("sleep", fetcher, start=start, end=end)
+    assert len(fetcher.calls) == 2
+    assert cache.stale_days("sleep", start, end) == []
+
+
+@pytest.mark.asyncio
+async def test_records_deleted_upstream_are_dropped_on_resync(cache, clock) -> None:
+    fetcher = _Fetcher(
+        [
+            _sleep("run", "2026-04-20T06:00:00Z", "2026-04-20T07:00:00Z"),
+            _sleep("ride", "2026-04-20T16:00:00Z", "2026-04-20T17:00:00Z"),
+            _sleep("walk", "2026-04-21T06:00:00Z", "2026-04-21T07:00:00Z"),
+        ]
+    )
+    start = datetime(2026, 4, 20, tzinfo=timezone.utc)
+    end = start + timedelta(days=2)
+    await cache.get_records("workout", fetcher, start=start, end=end)
+
+    # The ride is deleted in WHOOP; the day is re-synced once it closes.
+    fetcher.records = [record for record in fetcher.records if record["id"] != "ride"]
+    clock.now = NOW + timedelta(days=5)
+    records = await cache.get_records("workout", fetcher, start=start, end=end)
+
+    assert [record["id"] for record in records] == ["run", "walk"]
+
+
+def test_stale_versions_do_not_overwrite_newer_records(cache) -> None:
+    day = datetime(2026, 4, 10, tzinfo=timezone.utc).date()
+    newer = _sleep("a", "2026-04-10T06:00:00Z", "2026-04-10T14:00:00Z", "2026-04-11T00:00:00Z")
+    older = _sleep("a", "2026-04-10T06:00:00Z", "2026-04-10T13:00:00Z", "2026-04-10T15:00:00Z")
+
+    cache.store("sleep", [newer], synced_days=[day])
+    cache.store("sleep", [older], synced_days=[day])
+
+    loaded = cache.load(
+        "sleep",
+        datetime(2026, 4, 10, tzinfo=timezone.utc),
+        datetime(2026, 4, 11, tzinfo=timezone.utc),
+    )
+    assert loaded == [newer]
+
+
+def test_recovery_records_are_keyed_by_cycle_and_created_at(cache) -> None:
+    day = datetime(2026, 4, 10, tzinfo=timezone.utc).date()
+    recovery = {"cycle_id": 42, "created_at": "2026-04-10T13:00:00Z", "score": {"recovery_score": 70}}
+
+    cache.store("recovery", [recovery, dict(recovery)], synced_days=[day])
+
+    loaded = cache.load(
+        "recovery",
+        datetime(2026, 4, 10, tzinfo=timezone.utc),
+        datetime(2026, 4, 11, tzinfo=timezone.utc),
+    )
+    assert loaded == [recovery]
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date
 
+import pytest
+
+from src.whoop_mcp import tools
 from src.whoop_mcp.tools import (
+    DAILY_SUMMARY_COLUMNS,
+    build_daily_summary_table,
     normalize_cycle_record,
     normalize_recovery_record,
     normalize_sleep_record,
@@ -177,3 +183,169 @@ def test_normalize_workout_record_surfaces_duration() -> None:
     assert normalized["date"] == "2026-04-17"
     assert normalized["duration_minutes"] == 60.0
     assert normalized["strain"] == 12.4
+
+
+_RANGE_SLEEP = {
+    "id": "sleep-1",
+    "start": "2026-04-17T05:00:00Z",
+    "end": "2026-04-17T13:00:00Z",
+    "score": {
+        "sleep_performance_percentage": 91.2,
+        "stage_summary": {"total_in_bed_time_milli": 28_800_000, "total_awake_time_milli": 0},
+    },
+}
+_RANGE_RECOVERY = {
+    "id": "recovery-1",
+    "created_at": "2026-04-17T13:00:00Z",
+    "score": {"recovery_score": 67, "hrv_rmssd_milli": 34.6},
+}
+_RANGE_CYCLE = {
+    "id": 22,
+    "start": "2026-04-17T12:00:00Z",
+    "end": "2026-04-18T11:00:00Z",
+    "score": {"strain": 14.8},
+}
+_RANGE_WORKOUT = {
+    "id": "workout-1",
+    "start": "2026-04-17T15:00:00Z",
+    "end": "2026-04-17T15:45:00Z",
+    "score": {"strain": 9.1},
+}
+
+
+def test_build_daily_summary_table_emits_one_row_per_day() -> None:
+    rows = build_daily_summary_table(
+        [date(2026, 4, 17), date(2026, 4, 18)],
+        sleep_records=[_RANGE_SLEEP],
+        recovery_records=[_RANGE_RECOVERY],
+        cycle_records=[_RANGE_CYCLE],
+        workout_records=[_RANGE_WORKOUT],
+    )
+
+    first = dict(zip(DAILY_SUMMARY_COLUMNS, rows[0], strict=True))
+    second = dict(zip(DAILY_SUMMARY_COLUMNS, rows[1], strict=True))
+    assert first["date"] == "2026-04-17"
+    assert first["recovery_score"] == 67
+    assert first["sleep_performance"] == 91.2
+    assert first["asleep_hours"] == 8.0
+    assert first["strain"] == 14.8
+    assert first["workout_count"] == 1
+    assert first["workout_minutes"] == 45.0
+    assert second["date"] == "2026-04-18"
+    assert second["recovery_score"] is None
+    assert second["workout_count"] == 0
+
+
+class _FakeRangeClient:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def __aenter__(self) -> _FakeRangeClient:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    async def get_sleep_collection(self, *, start, end):  # noqa: ANN001
+        self.calls.append("sleep")
+        return [_RANGE_SLEEP]
+
+    async def get_recovery_collection(self, *, start, end):  # noqa: ANN001
+        self.calls.append("recovery")
+        raise RuntimeError("HTTP 500")
+
+    async def get_cycle_collection(self, *, start, end):  # noqa: ANN001
+        self.calls.append("cycle")
+        return [_RANGE_CYCLE]
+
+    async def get_workout_collection(self, *, start, end):  # noqa: ANN001
+        self.calls.append("workout")
+        return []
+
+
+@pytest.mark.asyncio
+async def test_daily_summary_range_fetches_each_collection_once(monkeypatch) -> None:
+    client = _FakeRangeClient()
+
+    async def fake_get_client() -> _FakeRangeClient:
+        return client
+
+    monkeypatch.setattr(tools, "get_whoop_client", fake_get_client)
+
+    summary = await tools.get_daily_summary_range_tool(None, "2026-04-17", "2026-04-18")
+
+    assert sorted(client.calls) == ["cycle", "recovery", "sleep", "workout"]
+    assert summary["columns"] == list(DAILY_SUMMARY_COLUMNS)
+    assert [row[0] for row in summary["rows"]] == ["2026-04-17", "2026-04-18"]
+    assert summary["errors"] == {"recovery": "HTTP 500"}
+
+
+@pytest.mark.asyncio
+async def test_daily_summary_range_rejects_oversized_ranges() -> None:
+    summary = await tools.get_daily_summary_range_tool(None, "2026-01-01", "2026-12-31")
+
+    assert "limited to 92 days" in summary["error"]
+
+
+@pytest.mark.asyncio
+async def test_daily_tools_reuse_cached_records_for_closed_days(monkeypatch) -> None:
+    client = _FakeRangeClient()
+
+    async def fake_get_client() -> _FakeRangeClient:
+        return client
+
+    monkeypatch.setattr(tools, "get_whoop_client", fake_get_client)
+
+    first = await tools.get_daily_sleep_tool(None, "2026-04-17", "2026-04-17")
+    second = await tools.get_daily_sleep_tool(None, "2026-04-16", "2026-04-17")
+
+    assert first[0]["sleep_id"] == "sleep-1"
+    assert second == first
+    assert client.calls == ["sleep", "sleep"]
+
+
+@pytest.mark.asyncio
+async def test_daily_overview_fetches_collections_concurrently(monkeypatch) -> None:
+    client = _FakeRangeClient()
+    in_flight: list[int] = [0, 0]
+
+    async def tracked(name: str, payload: list[dict]) -> list[dict]:
+        client.calls.append(name)
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight[1], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return payload
+
+    client.get_sleep_collection = lambda **_: tracked("sleep", [_RANGE_SLEEP])
+    client.get_recovery_collection = lambda **_: tracked("recovery", [])
+    client.get_cycle_collection = lambda **_: tracked("cycle", [_RANGE_CYCLE])
+
+    async def fake_get_client() -> _FakeRangeClient:
+        return client
+
+    monkeypatch.setattr(tools, "get_whoop_client", fake_get_client)
+
+    overview = await tools.get_daily_overview_tool(None, "2026-04-17", "2026-04-17")
+
+    assert sorted(client.calls) == ["cycle", "recovery", "sleep"]
+    assert in_flight[1] == 3
+    assert overview[0]["date"] == "2026-04-17"
+    assert overview[0]["sleep"]["sleep_id"] == "sleep-1"
+    assert overview[0]["recovery"] is None
+    assert "errors" not in overview[0]
+
+
+@pytest.mark.asyncio
+async def test_daily_overview_reports_partial_collection_errors(monkeypatch) -> None:
+    client = _FakeRangeClient()
+
+    async def fake_get_client() -> _FakeRangeClient:
+        return client
+
+    monkeypatch.setattr(tools, "get_whoop_client", fake_get_client)
+
+    overview = await tools.get_daily_overview_tool(None, "2026-04-17", "2026-04-17")
+
+    assert overview[0]["errors"] == {"recovery": "HTTP 500"}
+    assert overview[0]["cycle"]["cycle_id"] == 22
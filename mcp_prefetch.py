@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Call repo-managed MCP tool functions directly so cron jobs can prefetch data."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from atlas_utils import kill_process
+
+BOT_DIR = Path(__file__).resolve().parent
+MCP_SERVERS_DIR = BOT_DIR / "mcp-servers"
+PREFETCH_SERVERS = ("garmin", "google_bot", "whoop")
+HELPER_PATH = Path(__file__).resolve()
+
+
+class PrefetchError(RuntimeError):
+    """Raised when a prefetch server or tool cannot be resolved."""
+
+
+def resolve_server_python(server: str, bot_dir: str | Path = BOT_DIR) -> str:
+    """Return the interpreter used for a repo-managed MCP server.
+
+    Mirrors the Codex MCP profile: ``<SERVER>_PYTHON`` wins, then the bot venv, then
+    the current interpreter.
+    """
+    explicit = os.getenv(f"{server.upper()}_PYTHON")
+    if explicit:
+        return explicit
+    default_bot_python = Path(bot_dir) / "venv" / "bin" / "python3"
+    return str(default_bot_python if default_bot_python.exists() else Path(sys.executable))
+
+
+def load_server_module(server: str) -> ModuleType:
+    """Import a server's ``mcp_server.py`` so its auth bootstrap and tools are initialized.
+
+    Each server ships its code as a top-level ``src`` package, so only one server can be
+    loaded per process.
+    """
+    if server not in PREFETCH_SERVERS:
+        raise PrefetchError(f"Unsupported prefetch server: {server}")
+
+    script_path = MCP_SERVERS_DIR / server / "mcp_server.py"
+    spec = importlib.util.spec_from_file_location(f"atlas_prefetch_{server}", script_path)
+    if spec is None or spec.loader is None:
+        raise PrefetchError(f"MCP server script not found: {script_path}")
+
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except SystemExit as exc:
+        raise PrefetchError(str(exc.code or f"{server} MCP server failed to start")) from exc
+    except Exception as exc:
+        raise PrefetchError(f"{server} MCP server failed to load: {exc}") from exc
+    return module
+
+
+class PrefetchContext:
+    """Stand-in for the MCP request context that tools use to report to the client.
+
+    Messages go to stderr, since stdout carries the helper's JSON result.
+    """
+
+    async def log(self, level: str, message: str, **extra: Any) -> None:
+        print(f"[{level}] {message}", file=sys.stderr)
+
+    async def debug(self, message: str, **extra: Any) -> None:
+        await self.log("debug", message)
+
+    async def info(self, message: str, **extra: Any) -> None:
+        await self.log("info", message)
+
+    async def warning(self, message: str, **extra: Any) -> None:
+        await self.log("warning", message)
+
+    async def error(self, message: str, **extra: Any) -> None:
+        await self.log("error", message)
+
+
+async def _call_tool(
+    tools_module: Any, call: dict[str, Any], context: PrefetchContext
+) -> dict[str, Any]:
+    tool_name = str(call.get("tool", ""))
+    args = call.get("args") or {}
+    result: dict[str, Any] = {"name": call.get("name") or tool_name, "tool": tool_name}
+
+    tool = getattr(tools_module, f"{tool_name}_tool", None)
+    if tool_name.startswith("_") or not callable(tool):
+        result["error"] = f"Unknown tool: {tool_name}"
+        return result
+
+    try:
+        result["data"] = await tool(context, **args)
+    except Exception as exc:
+        result["error"] = f"{exc.__class__.__name__}: {exc}"
+    return result
+
+
+async def run_calls(tools_module: Any, calls: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Run every requested tool call concurrently, preserving request order."""
+    context = PrefetchContext()
+    return list(await asyncio.gather(*(_call_tool(tools_module, call, context) for call in calls)))
+
+
+async def run_server_calls(
+    module: ModuleType, calls: Sequence[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Run calls inside the server's lifespan so its pooled clients are closed on exit."""
+    server = getattr(module, "mcp", None)
+    lifespan = getattr(getattr(server, "settings", None), "lifespan", None)
+    if lifespan is None:
+        return await run_calls(module.tools, calls)
+    async with lifespan(server):
+        return await run_calls(module.tools, calls)
+
+
+async def prefetch_server(
+    server: str,
+    calls: list[dict[str, Any]],
+    *,
+    timeout: float,
+    env: dict[str, str] | None = None,
+) -> list[dict[str, Any]]:
+    """Run one server's calls in a helper process and return per-call results.
+
+    Launch, timeout, and parse failures are reported as an error on every call so
+    callers always get one result per requested call.
+    """
+
+    def failed(message: str) -> list[dict[str, Any]]:
+        return [
+            {
+                "name": call.get("name") or call.get("tool"),
+                "tool": call.get("tool"),
+                "error": message,
+            }
+            for call in calls
+        ]
+
+    process: asyncio.subprocess.Process | None = None
+    try:
+        process = await asyncio.create_subprocess_exec(
+            resolve_server_python(server),
+            str(HELPER_PATH),
+            "--server",
+            server,
+            "--calls",
+            json.dumps(calls),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        if process is not None:
+            await kill_process(process)
+        return failed(f"{server} prefetch timed out after {timeout:g} seconds")
+    except Exception as exc:
+        return failed(f"{server} prefetch failed to start: {exc}")
+
+    try:
+        payload = json.loads(stdout.decode().strip().splitlines()[-1])
+    except (IndexError, json.JSONDecodeError):
+        return failed(f"{server} prefetch returned no JSON (exit {process.returncode})")
+    if "results" not in payload:
+        return failed(str(payload.get("error") or f"{server} prefetch failed"))
+    return payload["results"]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point used by the cron dispatcher."""
+    parser = argparse.ArgumentParser(description="Prefetch MCP tool results for ATLAS jobs.")
+    parser.add_argument("--server", required=True, choices=PREFETCH_SERVERS)
+    parser.add_argument(
+        "--calls",
+        required=True,
+        help='JSON list of {"name", "tool", "args"} objects to run against the server.',
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        calls = json.loads(args.calls)
+        if not isinstance(calls, list):
+            raise PrefetchError("--calls must be a JSON list")
+        module = load_server_module(args.server)
+        results = asyncio.run(run_server_calls(module, calls))
+    except (PrefetchError, json.JSONDecodeError) as exc:
+        print(json.dumps({"error": str(exc)}))
+        return 1
+
+    print(json.dumps({"results": results}, default=str))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,64 @@
+"""Token-bucket pacing shared by the bot's Discord message and webhook senders."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+
+class TokenBucket:
+    """Async token bucket shared by the bot's Discord senders.
+
+    ``rate`` tokens are added per second, up to ``capacity``. Callers wait on a single
+    lock, so they are served first come, first served. ``pause`` empties the bucket and
+    holds every caller until the deadline, which is how a ``Retry-After`` is honoured.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("TokenBucket needs a positive rate and a capacity of at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting as needed; return the seconds spent waiting."""
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = self._clock()
+                delay = self._paused_until - now
+                if delay <= 0:
+                    self._refill(now)
+                    # Tolerate float drift so a refill of exactly one token always counts.
+                    if self._tokens >= 1 - 1e-9:
+                        self._tokens = max(self._tokens - 1, 0.0)
+                        break
+                    delay = (1 - self._tokens) / self.rate
+                await self._sleep(delay)
+                waited += delay
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Block all callers for ``seconds``, then resume with a single token."""
+        now = self._clock()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = 1.0
+        self._updated_at = max(self._updated_at, self._paused_until)
@@ -7,6 +7,12 @@ Usage:
     python send_message.py "Your message here"
     python send_message.py --channel health "Your message here"
     python send_message.py --channel-id 123456789 "Your message here"
+    python send_message.py --transport webhook --channel health "Your message here"
+
+By default the message is posted with one REST call using the bot token, or through the
+channel's webhook when no token is configured. ``--transport control`` instead hands the
+text to the running bot as a prompt, which ATLAS answers in the channel.
+``--transport gateway`` logs in to the gateway and sends through a full client session.
 """
 
 import argparse
@@ -15,10 +21,13 @@ import os
 import sys
 from pathlib import Path
 
+import aiohttp
 import discord
 from dotenv import load_dotenv
 
-from channel_configs import get_channel_config_by_key, normalize_channel_key
+from atlas_control import default_socket_path, post_control_prompt
+from channel_configs import get_channel_config, get_channel_config_by_key, normalize_channel_key
+from webhook_sender import WebhookSender
 
 # Load environment
 BOT_DIR = Path(__file__).parent
@@ -26,6 +35,10 @@ load_dotenv(BOT_DIR / ".env")
 
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 CHANNEL_ID = int(os.getenv("DISCORD_CHANNEL_ID", "0"))
+DISCORD_API_BASE = "https://discord.com/api/v10"
+TRANSPORTS = ("auto", "control", "rest", "webhook", "gateway")
+CONTROL_SOCKET_PATH = os.getenv("ATLAS_CONTROL_SOCKET", str(default_socket_path(BOT_DIR)))
+TEXT_CHANNEL_TYPE = 0
 
 
 def _env_channel_id_for_name(channel_name: str) -> int:
@@ -55,13 +68,182 @@ def _find_channel_by_name(client, channel_name: str):
     return None
 
 
+def _bot_headers() -> dict[str, str]:
+    return {"Authorization": f"Bot {DISCORD_TOKEN}"}
+
+
+async def _get_json(session: aiohttp.ClientSession, path: str):
+    async with session.get(f"{DISCORD_API_BASE}{path}", headers=_bot_headers()) as resp:
+        resp.raise_for_status()
+        return await resp.json()
+
+
+async def _find_channel_id_via_rest(channel_name: str) -> int:
+    """Look up a text channel by name across the bot's guilds without a gateway session."""
+    target_name = normalize_channel_key(channel_name)
+    matches = []
+    async with aiohttp.ClientSession() as session:
+        for guild in await _get_json(session, "/users/@me/guilds"):
+            for channel in await _get_json(session, f"/guilds/{guild['id']}/channels"):
+                if channel.get("type") != TEXT_CHANNEL_TYPE:
+                    continue
+                if normalize_channel_key(channel.get("name", "")) == target_name:
+                    matches.append(int(channel["id"]))
+
+    if len(matches) == 1:
+        return matches[0]
+    if len(matches) > 1:
+        print(f"Error: Multiple channels named #{target_name}; use --channel-id")
+    else:
+        print(f"Error: Could not find channel named #{target_name}")
+    return 0
+
+
+async def send_via_rest(
+    content: str,
+    *,
+    channel_id: int | None = None,
+    channel_name: str | None = None,
+) -> bool:
+    """Post to a channel's messages endpoint with the bot token; no gateway login."""
+    if not DISCORD_TOKEN:
+        print("Error: DISCORD_TOKEN is not configured")
+        return False
+
+    if channel_id is not None:
+        target_channel_id = channel_id
+    elif channel_name:
+        target_channel_id = _env_channel_id_for_name(channel_name)
+        if target_channel_id <= 0:
+            try:
+                target_channel_id = await _find_channel_id_via_rest(channel_name)
+            except aiohttp.ClientError as e:
+                print(f"Error looking up channel #{normalize_channel_key(channel_name)}: {e}")
+                return False
+    else:
+        target_channel_id = CHANNEL_ID
+
+    if target_channel_id <= 0:
+        if not channel_name:
+            print(
+                "Error: channel is not configured; use --channel, --channel-id, or "
+                "DISCORD_CHANNEL_ID"
+            )
+        return False
+
+    sender = WebhookSender()
+    try:
+        sent = await sender.send(
+            f"{DISCORD_API_BASE}/channels/{target_channel_id}/messages",
+            content,
+            headers=_bot_headers(),
+        )
+    finally:
+        await sender.close()
+    if sent:
+        print(f"Message sent to channel {target_channel_id}")
+    else:
+        print(f"Error sending message to channel {target_channel_id}")
+    return sent
+
+
+def _webhook_url(channel_id: int | None, channel_name: str | None) -> str | None:
+    if channel_id is not None:
+        config = get_channel_config(channel_id=channel_id)
+    elif channel_name:
+        config = get_channel_config_by_key(channel_name, honor_allowlist=False)
+    else:
+        config = None
+    for env_name in (config.webhook_env if config else None, "DISCORD_WEBHOOK_URL"):
+        url = os.getenv(env_name) if env_name else None
+        if url:
+            return url
+    return None
+
+
+async def send_via_webhook(
+    content: str,
+    *,
+    channel_id: int | None = None,
+    channel_name: str | None = None,
+) -> bool:
+    """Post through the channel's configured webhook, falling back to ``DISCORD_WEBHOOK_URL``."""
+    url = _webhook_url(channel_id, channel_name)
+    if not url:
+        target = channel_name or channel_id or "the default channel"
+        print(f"Error: no webhook configured for {target}")
+        return False
+
+    sender = WebhookSender()
+    try:
+        sent = await sender.send(url, content)
+    finally:
+        await sender.close()
+    print("Message sent via webhook" if sent else "Error sending message via webhook")
+    return sent
+
+
+async def send_via_control(
+    content: str,
+    *,
+    channel_id: int | None = None,
+    channel_name: str | None = None,
+) -> bool:
+    """Hand the prompt to the running bot, which runs it in the channel under its lock."""
+    if channel_id is None and not channel_name and CHANNEL_ID > 0:
+        channel_id = CHANNEL_ID
+    if channel_id is None and not channel_name:
+        print(
+            "Error: channel is not configured; use --channel, --channel-id, or DISCORD_CHANNEL_ID"
+        )
+        return False
+
+    try:
+        await post_control_prompt(
+            content,
+            socket_path=CONTROL_SOCKET_PATH,
+            channel_id=channel_id,
+            channel_name=channel_name,
+        )
+    except (OSError, aiohttp.ClientError, RuntimeError) as e:
+        print(f"Error reaching the ATLAS control API: {e}")
+        return False
+    print(f"Prompt handed to ATLAS for channel {channel_name or channel_id}")
+    return True
+
+
 async def send_message(
     content: str,
     *,
     channel_id: int | None = None,
     channel_name: str | None = None,
+    transport: str = "auto",
 ) -> bool:
-    """Send message to Discord channel via bot."""
+    """Send message to a Discord channel.
+
+    ``transport`` is ``rest`` (bot token, one HTTP call), ``webhook`` (channel webhook),
+    ``gateway`` (full client login), ``auto`` (REST when a bot token is configured,
+    otherwise the webhook), or ``control``, which runs ``content`` as an agent prompt in
+    the running bot rather than posting it. ``auto`` never uses the control socket.
+    """
+    if transport == "auto":
+        transport = "rest" if DISCORD_TOKEN else "webhook"
+    if transport == "control":
+        return await send_via_control(content, channel_id=channel_id, channel_name=channel_name)
+    if transport == "rest":
+        return await send_via_rest(content, channel_id=channel_id, channel_name=channel_name)
+    if transport == "webhook":
+        return await send_via_webhook(content, channel_id=channel_id, channel_name=channel_name)
+    return await send_via_gateway(content, channel_id=channel_id, channel_name=channel_name)
+
+
+async def send_via_gateway(
+    content: str,
+    *,
+    channel_id: int | None = None,
+    channel_name: str | None = None,
+) -> bool:
+    """Send message to Discord channel via a gateway bot session."""
     if not DISCORD_TOKEN:
         print("Error: DISCORD_TOKEN is not configured")
         return False
@@ -117,6 +299,15 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Send a message to a Discord channel.")
     parser.add_argument("--channel", help="Configured channel key or Discord channel name")
     parser.add_argument("--channel-id", type=int, help="Discord channel ID")
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default="auto",
+        help=(
+            "How to deliver: REST call, webhook, or gateway; 'control' runs the text as a "
+            "prompt in the running bot (default: auto, REST or webhook)"
+        ),
+    )
     parser.add_argument("message", nargs="+", help="Message text to send")
     return parser.parse_args(argv)
 
@@ -133,6 +324,7 @@ def main():
             message,
             channel_id=args.channel_id,
             channel_name=args.channel,
+            transport=args.transport,
         )
     )
     sys.exit(0 if success else 1)
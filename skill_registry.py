@@ -0,0 +1,160 @@
+"""In-process registry of repo-local ATLAS skill definitions."""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+SKILL_FILE_SUFFIX = ".md"
+SKILL_DIRECTORY_ENTRYPOINT = "SKILL.md"
+
+
+@dataclass(frozen=True)
+class SkillDefinition:
+    """One loaded skill definition and the file state it was read from."""
+
+    name: str
+    path: Path
+    content: str
+    mtime_ns: int
+    size: int
+
+
+class SkillRegistry:
+    """Index a skills directory once and serve cached skill contents by name.
+
+    The directory listing is re-scanned only when the mtime of the skills directory or of
+    one of its subdirectories changes (so a new ``<name>/SKILL.md`` is seen), and each
+    skill body is re-read only when its own mtime or size changes.
+    """
+
+    def __init__(self, skills_dir: str | Path):
+        self.skills_dir = Path(skills_dir)
+        self._lock = threading.Lock()
+        self._index: dict[str, Path] = {}
+        self._index_signature: tuple[int, tuple[tuple[str, int], ...]] | None = None
+        self._definitions: dict[str, SkillDefinition] = {}
+
+    def _scan(self) -> dict[str, Path]:
+        index: dict[str, Path] = {}
+        try:
+            entries = sorted(os.scandir(self.skills_dir), key=lambda entry: entry.name)
+        except OSError:
+            return index
+
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_file() and entry.name.endswith(SKILL_FILE_SUFFIX):
+                index[entry.name[: -len(SKILL_FILE_SUFFIX)].lower()] = Path(entry.path)
+            elif entry.is_dir():
+                entrypoint = Path(entry.path) / SKILL_DIRECTORY_ENTRYPOINT
+                if entrypoint.is_file():
+                    index.setdefault(entry.name.lower(), entrypoint)
+        return index
+
+    def _signature(self) -> tuple[int, tuple[tuple[str, int], ...]] | None:
+        """Return the mtimes of the skills directory and its subdirectories."""
+        try:
+            mtime_ns = self.skills_dir.stat().st_mtime_ns
+            subdirectories = []
+            with os.scandir(self.skills_dir) as entries:
+                for entry in entries:
+                    if not entry.name.startswith(".") and entry.is_dir():
+                        subdirectories.append((entry.name, entry.stat().st_mtime_ns))
+        except OSError:
+            return None
+        return mtime_ns, tuple(sorted(subdirectories))
+
+    def _refresh_index_locked(self) -> None:
+        signature = self._signature()
+        if signature is None:
+            self._index = {}
+            self._index_signature = None
+            self._definitions.clear()
+            return
+
+        if signature == self._index_signature:
+            return
+
+        self._index = self._scan()
+        self._index_signature = signature
+        for name in list(self._definitions):
+            if name not in self._index:
+                del self._definitions[name]
+
+    def names(self) -> list[str]:
+        """Return the sorted names of all indexed skills."""
+        with self._lock:
+            self._refresh_index_locked()
+            return sorted(self._index)
+
+    def get(self, name: str) -> SkillDefinition | None:
+        """Return a skill definition by name, reloading it only when the file changed."""
+        key = name.lower()
+        with self._lock:
+            self._refresh_index_locked()
+            path = self._index.get(key)
+            if path is None:
+                return None
+
+            try:
+                stat = path.stat()
+            except OSError:
+                self._definitions.pop(key, None)
+                return None
+
+            cached = self._definitions.get(key)
+            if (
+                cached is not None
+                and cached.path == path
+                and cached.mtime_ns == stat.st_mtime_ns
+                and cached.size == stat.st_size
+            ):
+                return cached
+
+            try:
+                content = path.read_text(encoding="utf-8").strip()
+            except OSError:
+                self._definitions.pop(key, None)
+                return None
+
+            definition = SkillDefinition(
+                name=key,
+                path=path,
+                content=content,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+            )
+            self._definitions[key] = definition
+            return definition
+
+    def clear(self) -> None:
+        """Drop the cached index and all loaded skill bodies."""
+        with self._lock:
+            self._index = {}
+            self._index_signature = None
+            self._definitions.clear()
+
+
+_registries: dict[str, SkillRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_skill_registry(skills_dir: str | Path) -> SkillRegistry:
+    """Return the shared process-wide registry for a skills directory."""
+    key = os.path.realpath(skills_dir)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = SkillRegistry(skills_dir)
+            _registries[key] = registry
+        return registry
+
+
+def reset_skill_registries() -> None:
+    """Forget every shared registry (useful for tests)."""
+    with _registries_lock:
+        _registries.clear()
@@ -352,6 +352,71 @@ async def test_run_job_prompt_claude_uses_augmented_prompt(tmp_path, monkeypatch
     assert "Do the scheduled work." in prompt
 
 
+@pytest.mark.asyncio
+async def test_run_job_prompt_claude_disables_prompt_caching_by_default(tmp_path, monkeypatch):
+    captured: dict[str, dict] = {}
+
+    class _ClaudeProcess:
+        returncode = 0
+
+        async def communicate(self):
+            return b"done", b""
+
+    async def fake_create_subprocess_exec(*args, **kwargs):
+        captured["env"] = kwargs["env"]
+        return _ClaudeProcess()
+
+    monkeypatch.setenv("ATLAS_AGENT_PROVIDER", "claude")
+    monkeypatch.delenv("ANTHROPIC_DISABLE_PROMPT_CACHING", raising=False)
+    monkeypatch.setattr(agent_runner.asyncio, "create_subprocess_exec", fake_create_subprocess_exec)
+
+    job_kwargs = {
+        "prompt": "Do the scheduled work.",
+        "model": "opus",
+        "allowed_tools": ["Read"],
+        "timeout": 10,
+        "bot_dir": str(tmp_path),
+        "vault_path": str(tmp_path / "vault"),
+    }
+    await agent_runner.run_job_prompt(**job_kwargs)
+    assert captured["env"]["ANTHROPIC_DISABLE_PROMPT_CACHING"] == "1"
+
+    await agent_runner.run_job_prompt(**job_kwargs, prompt_cache=True)
+    assert "ANTHROPIC_DISABLE_PROMPT_CACHING" not in captured["env"]
+
+
+@pytest.mark.asyncio
+async def test_prepare_atlas_prompt_cache_layout_orders_stable_sections_first(tmp_path):
+    skills_dir = tmp_path / ".claude" / "skills"
+    skills_dir.mkdir(parents=True)
+    (skills_dir / "second-brain-librarian.md").write_text("Librarian steps.", encoding="utf-8")
+    index_path = tmp_path / "vault" / "System" / "vault-index.md"
+    index_path.parent.mkdir(parents=True)
+    index_path.write_text("# Vault Index", encoding="utf-8")
+
+    prompt = await agent_runner._prepare_atlas_prompt(
+        prompt="Run the second-brain-librarian skill.\n\n**Current Time:** Monday 07:45",
+        bot_dir=str(tmp_path),
+        vault_path=str(tmp_path / "vault"),
+        cwd=str(tmp_path),
+        allowed_tools=["Read"],
+        include_scheduled_job_note=True,
+        include_allowed_tools_note=True,
+        cache_friendly_layout=True,
+    )
+
+    positions = [
+        prompt.index("## Execution Context"),
+        prompt.index("## Allowed Tools"),
+        prompt.index("## ATLAS Skill Definition: second-brain-librarian"),
+        prompt.index("## Preloaded Vault Index"),
+        prompt.index("**Current Time:** Monday 07:45"),
+    ]
+    assert positions == sorted(positions)
+    assert prompt.count(agent_runner.PROMPT_CACHE_BOUNDARY) == 3
+    assert prompt.rindex(agent_runner.PROMPT_CACHE_BOUNDARY) < positions[-1]
+
+
 @pytest.mark.asyncio
 async def test_run_job_prompt_codex_treats_closed_stdin_notice_as_empty_output(
     tmp_path, monkeypatch
@@ -0,0 +1,179 @@
+"""Tests for the local control API used by cron and scripts to prompt the running bot."""
+
+import asyncio
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import bot
+import discord_delivery
+import send_message
+from atlas_control import (
+    ControlChannelNotAllowedError,
+    ControlChannelNotFoundError,
+    create_control_app,
+    post_control_prompt,
+    start_control_server,
+)
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to ~100 bytes, so avoid pytest's long tmp_path.
+    with tempfile.TemporaryDirectory(prefix="atlas-") as directory:
+        yield Path(directory) / "control.sock"
+
+
+@pytest.fixture
+async def control_server(socket_path):
+    runs = []
+    done = asyncio.Event()
+
+    def resolve(channel_id, channel_name):
+        if channel_name == "missing":
+            raise ControlChannelNotFoundError("Unknown channel: missing")
+        if channel_name == "random":
+            raise ControlChannelNotAllowedError("#random is not an auto-activated ATLAS channel")
+        if channel_name == "broken":
+            return SimpleNamespace(id=13, name="broken")
+        return SimpleNamespace(id=channel_id or 42, name=channel_name or "atlas")
+
+    async def run(channel, prompt):
+        if channel.name == "broken":
+            done.set()
+            raise RuntimeError("agent crashed")
+        runs.append((channel.id, channel.name, prompt))
+        done.set()
+        return f"echo: {prompt}"
+
+    runner = await start_control_server(create_control_app(resolve, run), socket_path)
+    yield SimpleNamespace(runs=runs, done=done)
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_waited_prompt_returns_agent_response(control_server, socket_path):
+    result = await post_control_prompt(
+        "summarize today", socket_path=socket_path, channel_name="briefings", wait=True
+    )
+
+    assert result == {"status": "done", "response": "echo: summarize today"}
+    assert control_server.runs == [(42, "briefings", "summarize today")]
+    assert socket_path.stat().st_mode & 0o777 == 0o600
+
+
+@pytest.mark.asyncio
+async def test_unwaited_prompt_is_accepted_and_run(control_server, socket_path):
+    result = await post_control_prompt("hello", socket_path=socket_path, channel_id=7)
+
+    assert result == {"status": "accepted"}
+    await asyncio.wait_for(control_server.done.wait(), timeout=1)
+    assert control_server.runs == [(7, "atlas", "hello")]
+
+
+@pytest.mark.asyncio
+async def test_unknown_channel_and_bad_requests_are_rejected(control_server, socket_path):
+    with pytest.raises(RuntimeError, match="Unknown channel"):
+        await post_control_prompt("hi", socket_path=socket_path, channel_name="missing")
+    with pytest.raises(RuntimeError, match="not an auto-activated"):
+        await post_control_prompt("hi", socket_path=socket_path, channel_name="random")
+    with pytest.raises(RuntimeError, match="prompt is required"):
+        await post_control_prompt("  ", socket_path=socket_path, channel_id=1)
+    assert control_server.runs == []
+
+
+@pytest.mark.asyncio
+async def test_unwaited_prompt_failure_is_logged(control_server, socket_path, capsys):
+    result = await post_control_prompt("hello", socket_path=socket_path, channel_name="broken")
+
+    assert result == {"status": "accepted"}
+    await asyncio.wait_for(control_server.done.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert "Control prompt failed: RuntimeError: agent crashed" in capsys.readouterr().out
+
+
+@pytest.mark.asyncio
+async def test_send_message_uses_control_only_when_asked(control_server, socket_path, monkeypatch):
+    monkeypatch.setattr(send_message, "CONTROL_SOCKET_PATH", str(socket_path))
+    monkeypatch.setattr(send_message, "DISCORD_TOKEN", "token")
+    rest = AsyncMock(return_value=True)
+    monkeypatch.setattr(send_message, "send_via_rest", rest)
+
+    assert await send_message.send_message("Reminder: stretch", channel_name="atlas")
+    rest.assert_awaited_once()
+    assert control_server.runs == []
+
+    assert await send_message.send_message(
+        "nightly summary", channel_name="atlas", transport="control"
+    )
+    await asyncio.wait_for(control_server.done.wait(), timeout=1)
+    assert control_server.runs == [(42, "atlas", "nightly summary")]
+
+
+@pytest.mark.asyncio
+async def test_control_transport_fails_when_bot_is_down(socket_path, monkeypatch):
+    monkeypatch.setattr(send_message, "CONTROL_SOCKET_PATH", str(socket_path))
+    rest = AsyncMock(return_value=True)
+    monkeypatch.setattr(send_message, "send_via_rest", rest)
+
+    assert not await send_message.send_message("hi", channel_name="atlas", transport="control")
+    rest.assert_not_awaited()
+
+
+class TestBotControlHandlers:
+    """bot.resolve_control_channel() and bot.run_control_prompt()."""
+
+    @pytest.fixture(autouse=True)
+    def _client(self, monkeypatch, mock_channel):
+        monkeypatch.delenv("ATLAS_CHANNEL_ID_HEALTH", raising=False)
+        health = SimpleNamespace(id=555, name="health")
+        random = SimpleNamespace(id=556, name="random")
+        client = MagicMock()
+        client.guilds = [SimpleNamespace(text_channels=[mock_channel, health, random])]
+        client.get_channel = MagicMock(
+            side_effect=lambda cid: {mock_channel.id: mock_channel}.get(cid)
+        )
+        monkeypatch.setattr(bot, "client", client)
+        bot.channel_locks.clear()
+        discord_delivery._channel_buckets.clear()
+        self.health = health
+
+    def test_resolves_by_id_pin_and_name(self, monkeypatch, mock_channel):
+        assert bot.resolve_control_channel(mock_channel.id, None) is mock_channel
+        assert bot.resolve_control_channel(None, "#Health") is self.health
+
+        monkeypatch.setenv("ATLAS_CHANNEL_ID_HEALTH", str(mock_channel.id))
+        assert bot.resolve_control_channel(None, "health") is mock_channel
+
+        with pytest.raises(ControlChannelNotFoundError):
+            bot.resolve_control_channel(None, "nowhere")
+
+    def test_rejects_channels_the_bot_does_not_auto_activate_in(self, monkeypatch):
+        monkeypatch.setattr(bot, "CONTROL_ALLOWED_CHANNELS", set())
+        with pytest.raises(ControlChannelNotAllowedError):
+            bot.resolve_control_channel(None, "random")
+
+        monkeypatch.setenv("ATLAS_CONFIGURED_CHANNELS", "atlas")
+        with pytest.raises(ControlChannelNotAllowedError):
+            bot.resolve_control_channel(None, "health")
+
+        monkeypatch.setattr(bot, "CONTROL_ALLOWED_CHANNELS", {"random"})
+        assert bot.resolve_control_channel(None, "#Random").name == "random"
+
+    @pytest.mark.asyncio
+    async def test_prompt_runs_under_channel_lock_and_posts_reply(self, mock_channel):
+        lock = bot.get_channel_lock(mock_channel.id)
+
+        async def fake_agent(channel_id, prompt, **kwargs):
+            assert lock.locked()
+            return f"done: {prompt}"
+
+        with patch("bot.run_agent", side_effect=fake_agent) as agent:
+            response = await bot.run_control_prompt(mock_channel, "write the summary")
+
+        assert response == "done: write the summary"
+        assert agent.call_args.kwargs["channel_name"] == "atlas"
+        mock_channel.send.assert_awaited_once_with("done: write the summary")
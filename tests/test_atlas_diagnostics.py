@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+from unittest.mock import AsyncMock
+
+import pytest
 
 import atlas_diagnostics as diagnostics
 
@@ -62,6 +67,44 @@ def test_parse_ps_output():
     assert rows[1].cmd == "python mcp_server.py"
 
 
+def _proc_entry(proc_root, pid: int, stat: str, cmdline: bytes) -> None:
+    pid_dir = proc_root / str(pid)
+    pid_dir.mkdir()
+    (pid_dir / "stat").write_text(stat, encoding="utf-8")
+    (pid_dir / "cmdline").write_bytes(cmdline)
+
+
+def test_read_proc_processes(tmp_path):
+    ticks = os.sysconf("SC_CLK_TCK")
+    (tmp_path / "uptime").write_text("1000.50 2000.00\n", encoding="utf-8")
+    (tmp_path / "self").mkdir()
+    tail = " ".join(["0"] * 15)
+    _proc_entry(
+        tmp_path,
+        10,
+        f"10 (python3) S 1 10 10 {tail} {400 * ticks} 0 0\n",
+        b"python\0bot.py\0",
+    )
+    _proc_entry(
+        tmp_path,
+        11,
+        f"11 (node (mcp) x) S 10 10 10 {tail} {877 * ticks} 0 0\n",
+        b"npx\0weather-mcp\0",
+    )
+    _proc_entry(tmp_path, 2, f"2 (kthreadd) S 0 0 0 {tail} 0 0 0\n", b"")
+
+    rows = diagnostics.read_proc_processes(tmp_path)
+
+    assert [row.pid for row in rows] == [2, 10, 11]
+    assert rows[0].cmd == "[kthreadd]"
+    assert rows[1] == diagnostics.ProcessInfo(
+        pid=10, ppid=1, pgid=10, sid=10, stat="S", elapsed_seconds=600, cmd="python bot.py"
+    )
+    assert rows[2].ppid == 10
+    assert rows[2].cmd == "npx weather-mcp"
+    assert diagnostics.get_orphan_mcp_helpers(rows, orphan_min_seconds=60) == ()
+
+
 def test_get_bot_processes_filters_python_bot():
     rows = (
         _process(10, 1, "/home/jmooney/atlas-bot/venv/bin/python bot.py"),
@@ -94,6 +137,58 @@ def test_parse_systemctl_show():
     assert status.main_pid == 42
 
 
+@pytest.mark.asyncio
+async def test_collect_diagnostics_snapshot_queries_services_concurrently(monkeypatch):
+    running = 0
+    peak = 0
+
+    async def fake_status(name, *, user=False):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return _service(scope="user" if user else "system")
+
+    monkeypatch.setattr(diagnostics, "get_service_status_async", fake_status)
+    monkeypatch.setattr(diagnostics, "get_processes", lambda: (_process(10, 1, "python bot.py"),))
+    monkeypatch.setattr(diagnostics, "get_cron_job_statuses", lambda: ())
+
+    snapshot = await diagnostics.collect_diagnostics_snapshot()
+
+    assert peak == 2
+    assert [process.pid for process in snapshot.bot_processes] == [10]
+    assert (snapshot.system_service.scope, snapshot.user_service.scope) == ("system", "user")
+
+
+@pytest.mark.asyncio
+async def test_service_status_async_reports_missing_systemctl(monkeypatch):
+    monkeypatch.setenv("PATH", "")
+
+    status = await diagnostics.get_service_status_async(user=True)
+
+    assert status.scope == "user"
+    assert status.active_state == "unknown"
+    assert status.error
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_cache_reuses_and_coalesces_snapshots():
+    now = [0.0]
+    collect = AsyncMock(side_effect=lambda: object())
+    cache = diagnostics.DiagnosticsCache(15, collect=collect, clock=lambda: now[0])
+
+    first, second = await asyncio.gather(cache.get(), cache.get())
+    now[0] = 10.0
+    cached = await cache.get()
+    now[0] = 16.0
+    refreshed = await cache.get()
+
+    assert first is second is cached
+    assert refreshed is not first
+    assert collect.await_count == 2
+
+
 def test_get_cron_job_statuses_reads_jobs_and_state(tmp_path):
     jobs_file = tmp_path / "jobs.json"
     state_file = tmp_path / "last_runs.json"
@@ -0,0 +1,206 @@
+"""Tests for attachment preprocessing before agent runs."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+import attachment_pipeline
+
+
+@pytest.fixture
+def attachments_dir(tmp_path):
+    d = tmp_path / "sessions" / "100" / "attachments"
+    d.mkdir(parents=True)
+    return d
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def fake_downscale(monkeypatch):
+    """Count derivations and write a marker file instead of decoding real images."""
+    calls = []
+
+    def downscale(source: Path, target_base: Path) -> Path:
+        calls.append(source.name)
+        target = Path(f"{target_base}.jpg")
+        target.write_bytes(b"small")
+        return target
+
+    monkeypatch.setattr(attachment_pipeline, "_downscale_image", downscale)
+    return calls
+
+
+def _write(directory: Path, name: str, content: bytes) -> str:
+    path = directory / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_file_sha256_matches_hashlib(tmp_path):
+    path = tmp_path / "blob.bin"
+    path.write_bytes(b"x" * 3_000_000)
+
+    assert attachment_pipeline.file_sha256(path) == hashlib.sha256(b"x" * 3_000_000).hexdigest()
+
+
+def test_identical_files_in_one_message_are_passed_once(attachments_dir, cache_dir, monkeypatch):
+    monkeypatch.setattr(attachment_pipeline, "_derive", lambda source, digest, cache: None)
+    first = _write(attachments_dir, "aaaa1111_shot.png", b"same")
+    second = _write(attachments_dir, "bbbb2222_shot.png", b"same")
+    other = _write(attachments_dir, "cccc3333_other.png", b"different")
+
+    result = attachment_pipeline.preprocess_attachments([first, second, other], cache_dir=cache_dir)
+
+    assert result == [first, other]
+
+
+def test_derivative_is_cached_by_content_hash(attachments_dir, cache_dir, fake_downscale):
+    first = _write(attachments_dir, "aaaa1111_shot.png", b"pixels")
+    second = _write(attachments_dir, "bbbb2222_shot.png", b"pixels")
+
+    first_result = attachment_pipeline.preprocess_attachments([first], cache_dir=cache_dir)
+    second_result = attachment_pipeline.preprocess_attachments([second], cache_dir=cache_dir)
+
+    assert fake_downscale == ["aaaa1111_shot.png"]
+    assert first_result == [str(attachments_dir / "aaaa1111_shot.atlas.jpg")]
+    assert second_result == [str(attachments_dir / "bbbb2222_shot.atlas.jpg")]
+    assert Path(second_result[0]).read_bytes() == b"small"
+
+
+def test_files_needing_no_derivative_are_remembered(attachments_dir, cache_dir, monkeypatch):
+    calls = []
+
+    def downscale(source: Path, target_base: Path) -> None:
+        calls.append(source.name)
+
+    monkeypatch.setattr(attachment_pipeline, "_downscale_image", downscale)
+    monkeypatch.setattr(attachment_pipeline, "_optional_module", lambda name: object())
+    path = _write(attachments_dir, "aaaa1111_small.png", b"tiny")
+
+    assert attachment_pipeline.preprocess_attachments([path], cache_dir=cache_dir) == [path]
+    assert attachment_pipeline.preprocess_attachments([path], cache_dir=cache_dir) == [path]
+    assert calls == ["aaaa1111_small.png"]
+
+
+def test_missing_optional_libraries_pass_files_through(attachments_dir, cache_dir, monkeypatch):
+    monkeypatch.setattr(attachment_pipeline, "_optional_module", lambda name: None)
+    image = _write(attachments_dir, "aaaa1111_shot.png", b"pixels")
+    pdf = _write(attachments_dir, "bbbb2222_doc.pdf", b"%PDF-1.4")
+
+    result = attachment_pipeline.preprocess_attachments([image, pdf], cache_dir=cache_dir)
+
+    assert result == [image, pdf]
+    assert not list(cache_dir.rglob("*.none"))
+
+
+def test_processing_errors_and_missing_files_pass_through(attachments_dir, cache_dir, monkeypatch):
+    def broken(source: Path, target_base: Path) -> Path:
+        raise ValueError("cannot identify image file")
+
+    monkeypatch.setattr(attachment_pipeline, "_downscale_image", broken)
+    image = _write(attachments_dir, "aaaa1111_shot.png", b"not an image")
+    missing = str(attachments_dir / "gone.png")
+
+    result = attachment_pipeline.preprocess_attachments([image, missing], cache_dir=cache_dir)
+
+    assert result == [image, missing]
+
+
+def test_large_image_is_downscaled_to_pixel_budget(attachments_dir, cache_dir, monkeypatch):
+    image_module = pytest.importorskip("PIL.Image")
+    monkeypatch.setattr(attachment_pipeline, "ATTACHMENT_IMAGE_MAX_PIXELS", 10_000)
+    source = attachments_dir / "aaaa1111_shot.png"
+    image_module.new("RGB", (400, 300), "white").save(source)
+
+    result = attachment_pipeline.preprocess_attachments([str(source)], cache_dir=cache_dir)
+
+    assert result[0].endswith("aaaa1111_shot.atlas.jpg")
+    with image_module.open(result[0]) as derived:
+        assert derived.size[0] * derived.size[1] <= 10_000
+        assert derived.size[0] > derived.size[1]
+
+
+def test_exif_rotated_image_keeps_its_upright_aspect_ratio(attachments_dir, cache_dir, monkeypatch):
+    image_module = pytest.importorskip("PIL.Image")
+    monkeypatch.setattr(attachment_pipeline, "ATTACHMENT_IMAGE_MAX_PIXELS", 10_000)
+    source = attachments_dir / "aaaa1111_photo.jpg"
+    # Stored landscape with Orientation=6 (rotate 90 CW), as phone cameras write portraits.
+    stored = image_module.new("RGB", (400, 200), "white")
+    exif = image_module.Exif()
+    exif[0x0112] = 6
+    stored.save(source, exif=exif)
+
+    result = attachment_pipeline.preprocess_attachments([str(source)], cache_dir=cache_dir)
+
+    with image_module.open(result[0]) as derived:
+        width, height = derived.size
+    assert width * height <= 10_000
+    assert height / width == pytest.approx(2, rel=0.05)
+
+
+def _write_text_pdf(path: Path, pages: list[str]) -> None:
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for text in pages:
+        stream = f"BT /F1 10 Tf 20 700 Td ({text}) Tj ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+
+    body = b"%PDF-1.4\n"
+    offsets = []
+    for number, content in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += b"%d 0 obj\n%s\nendobj\n" % (number, content)
+    xref = len(body)
+    body += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    body += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    body += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    path.write_bytes(body)
+
+
+def test_pdf_text_is_extracted_up_to_page_limit(attachments_dir, cache_dir, monkeypatch):
+    pytest.importorskip("pypdf")
+    monkeypatch.setattr(attachment_pipeline, "ATTACHMENT_PDF_MAX_PAGES", 2)
+    source = attachments_dir / "aaaa1111_labs.pdf"
+    _write_text_pdf(source, [f"Page {n} ferritin result " + "x" * 120 for n in (1, 2, 3)])
+
+    result = attachment_pipeline.preprocess_attachments([str(source)], cache_dir=cache_dir)
+
+    assert result == [str(attachments_dir / "aaaa1111_labs.atlas.txt")]
+    text = Path(result[0]).read_text()
+    assert text.startswith("# Extracted PDF text (pages 1-2 of 3)")
+    assert "Page 1 ferritin result" in text
+    assert "Page 2 ferritin result" in text
+    assert "Page 3" not in text
+    assert "Only the first 2 pages were extracted" in text
+
+
+def test_pdf_with_too_little_text_passes_through(attachments_dir, cache_dir):
+    pytest.importorskip("pypdf")
+    source = attachments_dir / "aaaa1111_scan.pdf"
+    _write_text_pdf(source, ["scan"])
+
+    result = attachment_pipeline.preprocess_attachments([str(source)], cache_dir=cache_dir)
+
+    assert result == [str(source)]
@@ -0,0 +1,106 @@
+"""Tests for the content-addressed attachment store and its garbage collector."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from attachment_store import AttachmentStore
+
+DAY = 86400
+
+
+@pytest.fixture
+def store(tmp_path):
+    return AttachmentStore(tmp_path / "store", tmp_path / "sessions")
+
+
+def _download(store: AttachmentStore, channel: str, name: str, content: bytes) -> Path:
+    directory = store.sessions_dir / channel / "attachments"
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_bytes(content)
+    return path
+
+
+def _age(path: Path, seconds: float) -> None:
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def test_identical_uploads_across_channels_share_one_blob(store):
+    first = _download(store, "100", "aaaa1111_shot.png", b"same")
+    second = _download(store, "200", "bbbb2222_shot.png", b"same")
+
+    first_blob = store.ingest(first)
+    second_blob = store.ingest(second)
+
+    assert first_blob == second_blob
+    assert first.stat().st_ino == second.stat().st_ino == first_blob.stat().st_ino
+    assert first_blob.stat().st_nlink == 3
+    assert second.read_bytes() == b"same"
+
+
+def test_unreferenced_blobs_are_removed(store):
+    path = _download(store, "100", "aaaa1111_shot.png", b"pixels")
+    blob = store.ingest(path)
+    path.unlink()
+
+    result = store.collect_garbage()
+
+    assert not blob.exists()
+    assert result.blobs_removed == 1
+    assert result.bytes_freed == len(b"pixels")
+
+
+def test_retention_expires_content_not_uploaded_recently(store, tmp_path):
+    old = _download(store, "100", "aaaa1111_old.png", b"old")
+    old_blob = store.ingest(old)
+    _age(old_blob, 40 * DAY)
+    fresh = _download(store, "200", "bbbb2222_new.png", b"new")
+    store.ingest(fresh)
+    legacy = _download(store, "300", "cccc3333_legacy.pdf", b"legacy")
+    _age(legacy, 40 * DAY)
+    derived_dir = tmp_path / "cache"
+    derived = derived_dir / "ab" / "abcdef.img.jpg"
+    derived.parent.mkdir(parents=True)
+    derived.write_bytes(b"small")
+    derived_link = old.with_name("aaaa1111_old.atlas.jpg")
+    os.link(derived, derived_link)
+    _age(derived, 40 * DAY)
+
+    result = store.collect_garbage(max_age_days=30, derived_dirs=(derived_dir,))
+
+    assert not old.exists() and not old_blob.exists()
+    assert not legacy.exists()
+    assert not derived.exists() and not derived_link.exists()
+    assert fresh.exists()
+    assert (result.blobs_removed, result.derived_removed, result.session_files_removed) == (1, 1, 3)
+
+
+def test_reupload_refreshes_retention(store):
+    first = _download(store, "100", "aaaa1111_shot.png", b"same")
+    blob = store.ingest(first)
+    _age(blob, 40 * DAY)
+
+    store.ingest(_download(store, "200", "bbbb2222_shot.png", b"same"))
+    store.collect_garbage(max_age_days=30)
+
+    assert first.exists() and blob.exists()
+
+
+def test_size_cap_evicts_oldest_blobs_with_their_links(store):
+    paths = []
+    for index, age_days in enumerate((3, 2, 1)):
+        path = _download(store, str(index), f"{index:08x}_file.pdf", bytes([index]) * 100)
+        _age(store.ingest(path), age_days * DAY)
+        paths.append(path)
+
+    result = store.collect_garbage(max_bytes=150)
+
+    assert [path.exists() for path in paths] == [False, False, True]
+    assert result.blobs_removed == 2
+    assert result.store_bytes == 100
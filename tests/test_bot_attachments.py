@@ -1,25 +1,42 @@
 """Tests for bot attachment download and prompt building."""
 
+import asyncio
 import os
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 import bot
+from atlas_utils import env_number
 
 
 class TestDownloadAttachments:
-    """download_attachments() saves supported files to session dir."""
+    """download_attachments() streams supported files to session dir."""
 
     @pytest.fixture(autouse=True)
     def _patch(self, sessions_dir, monkeypatch):
         monkeypatch.setattr(bot, "SESSIONS_DIR", str(sessions_dir))
+        monkeypatch.setattr(bot, "ATTACHMENT_STORE_DIR", str(sessions_dir / ".attachment-store"))
         self.sessions_dir = sessions_dir
+        self.streamed = []
+        self.failing_urls = set()
 
-    def _make_att(self, filename):
+        async def fake_stream(session, url, file_path, max_bytes):
+            if url in self.failing_urls:
+                raise Exception("network error")
+            self.streamed.append((url, max_bytes))
+            with open(file_path, "wb") as f:
+                f.write(b"data")
+            return 4
+
+        self.stream = AsyncMock(side_effect=fake_stream)
+        monkeypatch.setattr(bot, "_stream_attachment", self.stream)
+
+    def _make_att(self, filename, size=1024):
         att = MagicMock()
         att.filename = filename
-        att.save = AsyncMock()
+        att.url = f"https://cdn.example.com/{filename}"
+        att.size = size
         return att
 
     @pytest.mark.asyncio
@@ -27,7 +44,8 @@ class TestDownloadAttachments:
         att = self._make_att("photo.png")
         paths = await bot.download_attachments(100, [att])
         assert len(paths) == 1
-        att.save.assert_called_once()
+        self.stream.assert_called_once()
+        assert open(paths[0], "rb").read() == b"data"
 
     @pytest.mark.asyncio
     async def test_downloads_pdf(self):
@@ -40,7 +58,7 @@ class TestDownloadAttachments:
         att = self._make_att("data.csv")
         paths = await bot.download_attachments(100, [att])
         assert len(paths) == 0
-        att.save.assert_not_called()
+        self.stream.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_uuid_prefix_in_filename(self):
@@ -61,6 +79,7 @@ class TestDownloadAttachments:
         atts = [self._make_att("a.png"), self._make_att("b.jpg"), self._make_att("c.gif")]
         paths = await bot.download_attachments(100, atts)
         assert len(paths) == 3
+        assert [os.path.basename(path)[9:] for path in paths] == ["a.png", "b.jpg", "c.gif"]
 
     @pytest.mark.asyncio
     async def test_mixed_supported_unsupported(self):
@@ -71,7 +90,7 @@ class TestDownloadAttachments:
     @pytest.mark.asyncio
     async def test_save_failure_skips_file(self):
         att = self._make_att("photo.png")
-        att.save = AsyncMock(side_effect=Exception("network error"))
+        self.failing_urls.add(att.url)
         paths = await bot.download_attachments(100, [att])
         assert len(paths) == 0
 
@@ -91,6 +110,129 @@ class TestDownloadAttachments:
         assert "/" not in filename
         assert "quarterly_report_" in filename
 
+    @pytest.mark.asyncio
+    async def test_does_not_prepare_full_session(self, monkeypatch):
+        ensure = MagicMock()
+        monkeypatch.setattr(bot, "ensure_channel_session", ensure)
+        paths = await bot.download_attachments(100, [self._make_att("photo.png")])
+        assert os.path.dirname(paths[0]) == str(self.sessions_dir / "100" / "attachments")
+        ensure.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_identical_uploads_share_one_stored_copy(self):
+        first = await bot.download_attachments(100, [self._make_att("photo.png")])
+        second = await bot.download_attachments(200, [self._make_att("photo.png")])
+
+        assert os.stat(first[0]).st_ino == os.stat(second[0]).st_ino
+        assert len(list((self.sessions_dir / ".attachment-store").rglob("*.png"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_skips_files_over_per_file_limit(self, monkeypatch):
+        monkeypatch.setattr(bot, "ATTACHMENT_MAX_FILE_BYTES", 2048)
+        atts = [self._make_att("big.png", size=4096), self._make_att("small.png", size=100)]
+        paths = await bot.download_attachments(100, atts)
+        assert [url for url, _ in self.streamed] == ["https://cdn.example.com/small.png"]
+        assert len(paths) == 1
+
+    @pytest.mark.asyncio
+    async def test_enforces_per_message_budget_in_order(self, monkeypatch):
+        monkeypatch.setattr(bot, "ATTACHMENT_MAX_MESSAGE_BYTES", 2500)
+        atts = [self._make_att(f"{name}.png", size=1000) for name in ("a", "b", "c")]
+        paths = await bot.download_attachments(100, atts)
+        assert len(paths) == 2
+        assert self.streamed == [
+            ("https://cdn.example.com/a.png", 1000),
+            ("https://cdn.example.com/b.png", 1000),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_zero_or_missing_sizes_share_the_remaining_budget(self, monkeypatch, capsys):
+        monkeypatch.setattr(bot, "ATTACHMENT_MAX_MESSAGE_BYTES", 2500)
+        atts = [
+            self._make_att("empty.png", size=0),
+            self._make_att("known.png", size=1000),
+            self._make_att("unknown.png", size=None),
+        ]
+        paths = await bot.download_attachments(100, atts)
+
+        assert len(paths) == 2
+        assert self.streamed == [
+            ("https://cdn.example.com/empty.png", 1500),
+            ("https://cdn.example.com/known.png", 1000),
+        ]
+        assert "unknown.png: size unknown and no per-message attachment budget left" in (
+            capsys.readouterr().out
+        )
+
+    @pytest.mark.asyncio
+    async def test_downloads_run_concurrently_within_limit(self, monkeypatch):
+        monkeypatch.setattr(bot, "ATTACHMENT_DOWNLOAD_CONCURRENCY", 2)
+        active = 0
+        peak = 0
+
+        async def slow_stream(session, url, file_path, max_bytes):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return 0
+
+        monkeypatch.setattr(bot, "_stream_attachment", slow_stream)
+        atts = [self._make_att(f"{index}.png") for index in range(5)]
+        paths = await bot.download_attachments(100, atts)
+        assert len(paths) == 5
+        assert peak == 2
+
+
+class _FakeContent:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def iter_chunked(self, size):
+        for chunk in self.chunks:
+            yield chunk
+
+
+class _FakeResponse:
+    def __init__(self, chunks):
+        self.content = _FakeContent(chunks)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        return None
+
+
+class TestStreamAttachment:
+    """_stream_attachment() writes chunks to disk and enforces the byte cap."""
+
+    @pytest.mark.asyncio
+    async def test_writes_all_chunks(self, tmp_path):
+        session = MagicMock()
+        session.get.return_value = _FakeResponse([b"ab", b"cd"])
+        target = tmp_path / "file.png"
+
+        written = await bot._stream_attachment(session, "https://cdn/x", str(target), 10)
+
+        assert written == 4
+        assert target.read_bytes() == b"abcd"
+
+    @pytest.mark.asyncio
+    async def test_aborts_and_cleans_up_over_limit(self, tmp_path):
+        session = MagicMock()
+        session.get.return_value = _FakeResponse([b"abc", b"def"])
+        target = tmp_path / "file.png"
+
+        with pytest.raises(bot.AttachmentTooLargeError):
+            await bot._stream_attachment(session, "https://cdn/x", str(target), 4)
+
+        assert list(tmp_path.iterdir()) == []
+
 
 class TestBuildPromptWithFiles:
     """build_prompt_with_files() appends file references to content."""
@@ -107,3 +249,14 @@ class TestBuildPromptWithFiles:
     def test_empty_content_default(self):
         result = bot.build_prompt_with_files("", ["/tmp/a.png"])
         assert "analyze the attached" in result.lower()
+
+
+def test_attachment_limits_fall_back_on_malformed_env(monkeypatch):
+    monkeypatch.setenv("ATLAS_ATTACHMENT_MAX_FILE_BYTES", "25MB")
+    monkeypatch.setenv("ATLAS_ATTACHMENT_CONCURRENCY", "")
+
+    assert env_number("ATLAS_ATTACHMENT_MAX_FILE_BYTES", default=1024) == 1024
+    assert env_number("ATLAS_ATTACHMENT_CONCURRENCY", default=4) == 4
+
+    monkeypatch.setenv("ATLAS_ATTACHMENT_CONCURRENCY", "8")
+    assert env_number("ATLAS_ATTACHMENT_CONCURRENCY", default=4) == 8
@@ -6,6 +6,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 import bot
+import discord_delivery
+from atlas_diagnostics import DiagnosticsCache
 from tests.conftest import AsyncContextManager
 
 
@@ -23,6 +25,7 @@ def _patch_env(sessions_dir, monkeypatch):
         monkeypatch.delenv(key, raising=False)
     monkeypatch.setattr(bot, "SESSIONS_DIR", str(sessions_dir))
     bot.channel_locks.clear()
+    discord_delivery._channel_buckets.clear()
 
 
 @pytest.fixture(autouse=True)
@@ -132,26 +135,29 @@ class TestHelpCommand:
 class TestStatusCommand:
     """!status / !ops returns operational diagnostics."""
 
+    @pytest.fixture(autouse=True)
+    def mock_snapshot(self, monkeypatch):
+        collect = AsyncMock(return_value=object())
+        monkeypatch.setattr(bot, "status_snapshots", DiagnosticsCache(collect=collect))
+        return collect
+
     @pytest.mark.asyncio
     @patch("bot.format_status_report", return_value="status report")
-    @patch("bot.build_diagnostics_snapshot", return_value=object())
     @patch("bot.run_agent", return_value="should not run")
-    async def test_status_command(self, mock_agent, mock_snapshot, mock_format):
+    async def test_status_command(self, mock_agent, mock_format, mock_snapshot):
         msg = _make_message("!status", channel_name="atlas-dev", channel_id=500)
 
         await bot.on_message(msg)
+        await bot.on_message(_make_message("!status", channel_name="atlas-dev", channel_id=500))
 
         msg.channel.send.assert_called_once_with("status report")
-        mock_snapshot.assert_called_once_with()
-        mock_format.assert_called_once()
+        mock_snapshot.assert_awaited_once_with()
+        assert mock_format.call_count == 2
         mock_agent.assert_not_called()
 
     @pytest.mark.asyncio
     @patch("bot.format_status_report", return_value="ops report")
-    @patch("bot.build_diagnostics_snapshot", return_value=object())
-    async def test_ops_alias_uses_channel_id_resolution(
-        self, mock_snapshot, mock_format, monkeypatch
-    ):
+    async def test_ops_alias_uses_channel_id_resolution(self, mock_format, monkeypatch):
         monkeypatch.setenv("ATLAS_CHANNEL_ID_ATLAS_DEV", "500")
         msg = _make_message("!ops", channel_name="renamed-channel", channel_id=500)
 
@@ -0,0 +1,76 @@
+"""Tests for Discord message chunking, file fallback and send pacing."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import discord_delivery
+from discord_delivery import deliver_response, split_message
+
+
+@pytest.fixture(autouse=True)
+def _clear_buckets():
+    discord_delivery._channel_buckets.clear()
+
+
+def _channel(channel_id=100):
+    channel = MagicMock()
+    channel.id = channel_id
+    channel.send = AsyncMock()
+    return channel
+
+
+class TestSplitMessage:
+    def test_short_text_is_one_chunk(self):
+        assert split_message("hello") == ["hello"]
+
+    def test_prefers_paragraph_boundaries(self):
+        first = "a" * 60
+        second = "word " * 11 + "end"
+        chunks = split_message(f"{first}\n\n{second}", limit=100)
+        assert chunks == [first, second]
+
+    def test_packs_lines_without_breaking_them(self):
+        lines = [f"| row {i} | value {i} |" for i in range(40)]
+        chunks = split_message("\n".join(lines), limit=200)
+        assert all(len(chunk) <= 200 for chunk in chunks)
+        assert [line for chunk in chunks for line in chunk.split("\n")] == lines
+
+    def test_never_splits_words(self):
+        chunks = split_message("lorem ipsum " * 200, limit=150)
+        assert all(len(chunk) <= 150 for chunk in chunks)
+        assert {word for chunk in chunks for word in chunk.split()} == {"lorem", "ipsum"}
+
+    def test_reopens_code_fence_across_chunks(self):
+        code = "\n".join(f"value_{i} = {i}" for i in range(30))
+        chunks = split_message(f"Intro\n\n```python\n{code}\n```\n\nDone.", limit=200)
+
+        assert len(chunks) > 2
+        assert all(len(chunk) <= 200 for chunk in chunks)
+        for chunk in chunks:
+            assert chunk.count("```") % 2 == 0
+        assert chunks[1].startswith("```python\n")
+        assert chunks[-1].endswith("Done.")
+
+
+class TestDeliverResponse:
+    @pytest.mark.asyncio
+    async def test_sends_chunks_in_order(self):
+        channel = _channel()
+        await deliver_response(channel, "first\n\n" + "x " * 1200)
+
+        sent = [call.args[0] for call in channel.send.call_args_list]
+        assert len(sent) == 2
+        assert sent[0].startswith("first")
+
+    @pytest.mark.asyncio
+    async def test_long_reply_sent_as_one_file(self, monkeypatch):
+        monkeypatch.setattr(discord_delivery, "FILE_THRESHOLD_CHARS", 3000)
+        channel = _channel()
+        await deliver_response(channel, "Summary line.\n\n" + "detail " * 1000)
+
+        channel.send.assert_called_once()
+        preview = channel.send.call_args.args[0]
+        assert preview.startswith("Summary line.")
+        assert "response.md" in preview
+        assert channel.send.call_args.kwargs["file"].filename == "response.md"
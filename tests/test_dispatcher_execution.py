@@ -1,6 +1,7 @@
 """Tests for dispatcher job execution (run_shell_command, run_agent_job, execute_job)."""
 
 import asyncio
+import json
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -202,6 +203,22 @@ class TestRunAgentJob:
 
         assert mock_run_job.call_args.kwargs["reasoning_effort"] == "medium"
 
+    @pytest.mark.asyncio
+    @patch("cron.dispatcher.run_job_prompt", return_value=("ok", True))
+    async def test_prompt_cache_defaults_on_and_can_be_disabled(self, mock_run_job):
+        job = {
+            "prompt": "test",
+            "allowed_tools": ["Read"],
+            "timeout_seconds": 60,
+            "model": "sonnet",
+            "timezone": "UTC",
+        }
+        await dispatcher.run_agent_job(job)
+        assert mock_run_job.call_args.kwargs["prompt_cache"] is True
+
+        await dispatcher.run_agent_job({**job, "prompt_cache": False})
+        assert mock_run_job.call_args.kwargs["prompt_cache"] is False
+
     @pytest.mark.asyncio
     @patch("cron.dispatcher.get_agent_provider", return_value="codex")
     @patch("cron.dispatcher.run_job_prompt", return_value=("ok", True))
@@ -222,6 +239,217 @@ class TestRunAgentJob:
         assert mock_run_job.call_args.kwargs["timeout"] == 360
 
 
+class TestResultCache:
+    @pytest.fixture(autouse=True)
+    def _isolate_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(dispatcher, "RESULT_CACHE_DIR", tmp_path / "result_cache")
+        monkeypatch.setenv("VAULT_PATH", str(tmp_path / "vault"))
+        self.vault = tmp_path / "vault"
+        (self.vault / "System").mkdir(parents=True)
+
+    def _job(self, **cache_config):
+        return {
+            "id": "librarian_digest",
+            "prompt": "Digest at {current_datetime} from {vault_path}",
+            "allowed_tools": ["Read"],
+            "timeout_seconds": 60,
+            "model": "sonnet",
+            "timezone": "UTC",
+            "result_cache": {"vault_index": True, **cache_config},
+        }
+
+    def _write_index(self, generated_at: str) -> None:
+        (self.vault / "System" / "vault-index.json").write_text(
+            json.dumps({"generated_at": generated_at})
+        )
+
+    @pytest.mark.asyncio
+    @patch("cron.dispatcher.run_job_prompt", return_value=("digest", True))
+    async def test_hit_skips_provider_run(self, mock_run_job):
+        self._write_index("2026-10-19T02:15:00Z")
+
+        assert await dispatcher.run_agent_job(self._job()) == ("digest", True)
+        assert await dispatcher.run_agent_job(self._job()) == ("digest", True)
+
+        assert mock_run_job.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch("cron.dispatcher.run_job_prompt", return_value=("digest", True))
+    async def test_input_change_invalidates(self, mock_run_job):
+        self._write_index("2026-10-19T02:15:00Z")
+        await dispatcher.run_agent_job(self._job())
+
+        self._write_index("2026-10-20T02:15:00Z")
+        await dispatcher.run_agent_job(self._job())
+
+        assert mock_run_job.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("cron.dispatcher.run_job_prompt", return_value=("digest", True))
+    async def test_file_input_content_is_fingerprinted(self, mock_run_job):
+        note = self.vault / "Projects" / "alpha.md"
+        note.parent.mkdir(parents=True)
+        note.write_text("v1")
+        job = self._job(inputs=["{vault_path}/Projects/alpha.md"])
+
+        await dispatcher.run_agent_job(job)
+        note.write_text("v2")
+        await dispatcher.run_agent_job(job)
+
+        assert mock_run_job.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("cron.dispatcher.run_job_prompt", return_value=("digest", True))
+    async def test_entries_older_than_max_age_are_ignored(self, mock_run_job):
+        self._write_index("2026-10-19T02:15:00Z")
+        await dispatcher.run_agent_job(self._job(max_age_seconds=0))
+
+        cache_file = dispatcher.RESULT_CACHE_DIR / "librarian_digest.json"
+        entry = json.loads(cache_file.read_text())
+        entry["stored_at"] = "2000-01-01T00:00:00+00:00"
+        cache_file.write_text(json.dumps(entry))
+        await dispatcher.run_agent_job(self._job(max_age_seconds=0))
+
+        assert mock_run_job.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("cron.dispatcher.run_job_prompt", return_value=("Error: boom", False))
+    async def test_failures_are_not_cached(self, mock_run_job):
+        await dispatcher.run_agent_job(self._job())
+        await dispatcher.run_agent_job(self._job())
+
+        assert mock_run_job.call_count == 2
+        assert not (dispatcher.RESULT_CACHE_DIR / "librarian_digest.json").exists()
+
+
+class TestPrefetch:
+    def _job(self, **overrides):
+        return {
+            "id": "morning_briefing",
+            "prompt": "Brief me at {current_datetime}",
+            "allowed_tools": ["Read"],
+            "timeout_seconds": 60,
+            "timezone": "UTC",
+            "prefetch": [
+                {
+                    "name": "whoop_sleep",
+                    "server": "whoop",
+                    "tool": "get_daily_sleep",
+                    "args": {"start_date": "{today-6d}", "end_date": "{today}"},
+                },
+                {"name": "garmin_stats", "server": "garmin", "tool": "get_stats", "args": {}},
+            ],
+            **overrides,
+        }
+
+    def test_render_prefetch_value_substitutes_dates(self):
+        from datetime import date
+
+        rendered = dispatcher._render_prefetch_value(
+            {"range": ["{today-6d}", "{yesterday}", "{today}"], "limit": 3},
+            today=date(2026, 10, 19),
+        )
+
+        assert rendered == {"range": ["2026-10-13", "2026-10-18", "2026-10-19"], "limit": 3}
+
+    def test_render_prefetch_value_substitutes_local_day_bounds(self):
+        from datetime import date
+
+        rendered = dispatcher._render_prefetch_value(
+            {"time_min": "{day_start}", "time_max": "{day_start+1d}"},
+            today=date(2026, 11, 1),
+            tz=dispatcher.ZoneInfo("America/Los_Angeles"),
+        )
+
+        # The DST change on 2026-11-01 gives the two bounds different offsets.
+        assert rendered == {
+            "time_min": "2026-11-01T00:00:00-07:00",
+            "time_max": "2026-11-02T00:00:00-08:00",
+        }
+
+    @pytest.mark.asyncio
+    @patch("cron.dispatcher.run_job_prompt", return_value=("briefing", True))
+    @patch("cron.dispatcher.prefetch_server")
+    async def test_results_are_injected_into_prompt(self, mock_server, mock_run_job):
+        async def fake_server(server, calls, *, timeout, env):
+            if server == "garmin":
+                return [{"name": "garmin_stats", "tool": "get_stats", "error": "auth expired"}]
+            today = dispatcher.datetime.now(dispatcher.ZoneInfo("UTC")).date()
+            assert calls[0]["args"]["end_date"] == today.isoformat()
+            return [{"name": "whoop_sleep", "tool": "get_daily_sleep", "data": [{"score": 91}]}]
+
+        mock_server.side_effect = fake_server
+
+        await dispatcher.run_agent_job(self._job())
+
+        assert sorted(call.args[0] for call in mock_server.call_args_list) == ["garmin", "whoop"]
+        prompt = mock_run_job.call_args.kwargs["prompt"]
+        assert prompt.startswith("Brief me at ")
+        assert "## Prefetched Data" in prompt
+        assert "### whoop_sleep (`mcp__whoop__get_daily_sleep`)" in prompt
+        assert '"score": 91' in prompt
+        assert "Error: auth expired" in prompt
+
+    @pytest.mark.asyncio
+    @patch("cron.dispatcher.run_job_prompt", return_value=("review", True))
+    @patch("cron.dispatcher.prefetch_health_range")
+    @patch("cron.dispatcher.prefetch_server")
+    async def test_health_range_entries_use_merged_table(
+        self, mock_server, mock_health_range, mock_run_job
+    ):
+        mock_health_range.return_value = [
+            {"name": "health_week", "tool": "get_health_range", "data": {"rows": []}}
+        ]
+        job = self._job(
+            prefetch=[
+                {
+                    "name": "health_week",
+                    "server": "health_range",
+                    "tool": "get_health_range",
+                    "args": {"start_date": "{today-6d}", "end_date": "{today}"},
+                }
+            ]
+        )
+
+        await dispatcher.run_agent_job(job)
+
+        mock_server.assert_not_called()
+        calls = mock_health_range.call_args.args[0]
+        assert calls[0]["tool"] == "get_health_range"
+        prompt = mock_run_job.call_args.kwargs["prompt"]
+        assert "### health_week (`health_range.py: merged WHOOP/Garmin range tools`)" in prompt
+
+    @pytest.mark.asyncio
+    @patch("cron.dispatcher.run_job_prompt", return_value=("briefing", True))
+    @patch("cron.dispatcher.prefetch_server")
+    async def test_jobs_without_prefetch_skip_helper(self, mock_server, mock_run_job):
+        await dispatcher.run_agent_job(self._job(prefetch=[]))
+
+        mock_server.assert_not_called()
+        assert "Prefetched Data" not in mock_run_job.call_args.kwargs["prompt"]
+
+    @pytest.mark.asyncio
+    @patch("cron.dispatcher.run_job_prompt", return_value=("updated", True))
+    @patch("cron.dispatcher.prefetch_server")
+    async def test_run_if_exists_skips_prefetch_and_agent(
+        self, mock_server, mock_run_job, monkeypatch, tmp_path
+    ):
+        monkeypatch.setenv("VAULT_PATH", str(tmp_path))
+        mock_server.return_value = []
+        job = self._job(run_if_exists="{vault_path}/Workout-Logs/{today}.md")
+
+        assert await dispatcher.run_agent_job(job) == ("", True)
+        mock_server.assert_not_called()
+        mock_run_job.assert_not_called()
+
+        today = dispatcher.datetime.now(dispatcher.ZoneInfo("UTC")).date()
+        (tmp_path / "Workout-Logs").mkdir()
+        (tmp_path / "Workout-Logs" / f"{today.isoformat()}.md").write_text("log")
+
+        assert await dispatcher.run_agent_job(job) == ("updated", True)
+        assert mock_server.call_count == 2
+
+
 class TestExecuteJob:
     """execute_job() dispatches to shell or the active agent and handles notification."""
 
@@ -5,13 +5,44 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 import cron.dispatcher as dispatcher
+import webhook_sender
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _response(status, headers=None):
+    resp = MagicMock()
+    resp.status = status
+    resp.headers = headers or {}
+    resp.__aenter__ = AsyncMock(return_value=resp)
+    resp.__aexit__ = AsyncMock(return_value=False)
+    return resp
+
+
+def _session(mock_session_cls, *responses):
+    session = MagicMock()
+    session.closed = False
+    session.post = MagicMock(side_effect=list(responses))
+    mock_session_cls.return_value = session
+    return session
 
 
 class TestSendWebhook:
     """send_webhook() posts content to Discord webhook URL."""
 
     @pytest.fixture(autouse=True)
-    def _clear_webhook_env(self, monkeypatch):
+    def _clear_webhook_env(self, monkeypatch, tmp_path):
         for key in (
             "DISCORD_WEBHOOK_HEALTH",
             "DISCORD_WEBHOOK_PROJECTS",
@@ -21,9 +52,16 @@ class TestSendWebhook:
             "DISCORD_WEBHOOK_URL",
         ):
             monkeypatch.delenv(key, raising=False)
+        monkeypatch.setattr(dispatcher, "STATE_FILE", tmp_path / "state" / "last_runs.json")
+        self.clock = _Clock()
+        monkeypatch.setattr(
+            dispatcher,
+            "_webhook_sender",
+            webhook_sender.WebhookSender(clock=self.clock, sleep=self.clock.sleep),
+        )
 
     @pytest.mark.asyncio
-    @patch("cron.dispatcher.aiohttp.ClientSession")
+    @patch("webhook_sender.aiohttp.ClientSession")
     async def test_short_message_single_chunk(self, mock_session_cls, monkeypatch):
         monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/webhook")
 
@@ -43,7 +81,7 @@ class TestSendWebhook:
         mock_session.post.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("cron.dispatcher.aiohttp.ClientSession")
+    @patch("webhook_sender.aiohttp.ClientSession")
     async def test_long_message_chunked(self, mock_session_cls, monkeypatch):
         monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/webhook")
 
@@ -69,7 +107,7 @@ class TestSendWebhook:
         assert result is False
 
     @pytest.mark.asyncio
-    @patch("cron.dispatcher.aiohttp.ClientSession")
+    @patch("webhook_sender.aiohttp.ClientSession")
     async def test_channel_webhook_preferred(self, mock_session_cls, monkeypatch):
         monkeypatch.setenv("DISCORD_WEBHOOK_HEALTH", "https://discord.com/health")
         monkeypatch.setenv("DISCORD_WEBHOOK_ATLAS", "https://discord.com/atlas")
@@ -90,7 +128,7 @@ class TestSendWebhook:
         assert mock_session.post.call_args[0][0] == "https://discord.com/health"
 
     @pytest.mark.asyncio
-    @patch("cron.dispatcher.aiohttp.ClientSession")
+    @patch("webhook_sender.aiohttp.ClientSession")
     async def test_falls_back_to_atlas_webhook(self, mock_session_cls, monkeypatch):
         monkeypatch.setenv("DISCORD_WEBHOOK_ATLAS", "https://discord.com/atlas")
         monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/legacy")
@@ -110,7 +148,7 @@ class TestSendWebhook:
         assert mock_session.post.call_args[0][0] == "https://discord.com/atlas"
 
     @pytest.mark.asyncio
-    @patch("cron.dispatcher.aiohttp.ClientSession")
+    @patch("webhook_sender.aiohttp.ClientSession")
     async def test_falls_back_to_legacy_webhook(self, mock_session_cls, monkeypatch):
         monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/legacy")
 
@@ -129,7 +167,7 @@ class TestSendWebhook:
         assert mock_session.post.call_args[0][0] == "https://discord.com/legacy"
 
     @pytest.mark.asyncio
-    @patch("cron.dispatcher.aiohttp.ClientSession")
+    @patch("webhook_sender.aiohttp.ClientSession")
     async def test_failure_status_code(self, mock_session_cls, monkeypatch):
         monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/webhook")
 
@@ -146,9 +184,72 @@ class TestSendWebhook:
 
         result = await dispatcher.send_webhook("msg", {"url_env": "DISCORD_WEBHOOK_URL"})
         assert result is False
+        assert mock_session.post.call_count == webhook_sender.WEBHOOK_MAX_ATTEMPTS
+
+    @pytest.mark.asyncio
+    @patch("webhook_sender.aiohttp.ClientSession")
+    async def test_rate_limit_waits_for_retry_after(self, mock_session_cls, monkeypatch):
+        monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/webhook")
+        session = _session(mock_session_cls, _response(429, {"Retry-After": "2.5"}), _response(204))
+
+        assert await dispatcher.send_webhook("msg", {"url_env": "DISCORD_WEBHOOK_URL"})
+        assert session.post.call_count == 2
+        assert self.clock.now == pytest.approx(2.5)
+
+    @pytest.mark.asyncio
+    @patch("webhook_sender.aiohttp.ClientSession")
+    async def test_exhausted_rate_limit_bucket_pauses_next_post(
+        self, mock_session_cls, monkeypatch
+    ):
+        monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/webhook")
+        headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "1.5"}
+        _session(mock_session_cls, _response(204, headers), _response(204))
+
+        assert await dispatcher.send_webhook("a " * 1500, {"url_env": "DISCORD_WEBHOOK_URL"})
+        assert self.clock.now == pytest.approx(1.5)
+
+    @pytest.mark.asyncio
+    @patch("webhook_sender.aiohttp.ClientSession")
+    async def test_client_error_is_not_retried(self, mock_session_cls, monkeypatch):
+        monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/webhook")
+        session = _session(mock_session_cls, _response(400))
+
+        assert not await dispatcher.send_webhook("msg", {"url_env": "DISCORD_WEBHOOK_URL"})
+        session.post.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("webhook_sender.aiohttp.ClientSession")
+    async def test_server_errors_retry_with_backoff(self, mock_session_cls, monkeypatch):
+        monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/webhook")
+        session = _session(mock_session_cls, _response(502), _response(503), _response(204))
+
+        assert await dispatcher.send_webhook("msg", {"url_env": "DISCORD_WEBHOOK_URL"})
+        assert session.post.call_count == 3
+        assert self.clock.sleeps == [1.0, 2.0]
+
+    @pytest.mark.asyncio
+    @patch("webhook_sender.aiohttp.ClientSession")
+    async def test_undelivered_chunks_are_retried_next_run(self, mock_session_cls, monkeypatch):
+        monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/webhook")
+        failures = [_response(500)] * webhook_sender.WEBHOOK_MAX_ATTEMPTS
+        session = _session(mock_session_cls, _response(204), *failures)
+        notify = {"url_env": "DISCORD_WEBHOOK_URL", "username": "ATLAS Briefing"}
+
+        content = "first " * 300 + "\n\n" + "second " * 250
+        assert not await dispatcher.send_webhook(content, notify)
+        queued = dispatcher.webhook_outbox()._load()
+        assert len(queued) == 1
+        assert queued[0]["target"] == notify
+        assert queued[0]["parts"][0]["content"].startswith("second")
+
+        session.post.side_effect = [_response(204)]
+        await dispatcher.flush_webhook_outbox()
+
+        assert session.post.call_args[1]["json"]["content"].startswith("second")
+        assert dispatcher.webhook_outbox()._load() == []
 
     @pytest.mark.asyncio
-    @patch("cron.dispatcher.aiohttp.ClientSession")
+    @patch("webhook_sender.aiohttp.ClientSession")
     async def test_network_error_returns_false(self, mock_session_cls, monkeypatch):
         monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/webhook")
 
@@ -162,7 +263,7 @@ class TestSendWebhook:
         assert result is False
 
     @pytest.mark.asyncio
-    @patch("cron.dispatcher.aiohttp.ClientSession")
+    @patch("webhook_sender.aiohttp.ClientSession")
     async def test_custom_username(self, mock_session_cls, monkeypatch):
         monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/webhook")
 
@@ -185,7 +286,7 @@ class TestSendWebhook:
         assert call_kwargs["json"]["username"] == "Custom Bot"
 
     @pytest.mark.asyncio
-    @patch("cron.dispatcher.aiohttp.ClientSession")
+    @patch("webhook_sender.aiohttp.ClientSession")
     async def test_success_status_200(self, mock_session_cls, monkeypatch):
         monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/webhook")
 
@@ -202,3 +303,25 @@ class TestSendWebhook:
 
         result = await dispatcher.send_webhook("msg", {"url_env": "DISCORD_WEBHOOK_URL"})
         assert result is True
+
+    @pytest.mark.asyncio
+    @patch("webhook_sender.aiohttp.ClientSession")
+    async def test_oversized_message_sent_as_one_file(self, mock_session_cls, monkeypatch):
+        monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/webhook")
+        monkeypatch.setattr(webhook_sender, "FILE_THRESHOLD_CHARS", 5000)
+
+        mock_resp = MagicMock()
+        mock_resp.status = 200
+        mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
+        mock_resp.__aexit__ = AsyncMock(return_value=False)
+
+        mock_session = MagicMock()
+        mock_session.post = MagicMock(return_value=mock_resp)
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=False)
+        mock_session_cls.return_value = mock_session
+
+        result = await dispatcher.send_webhook("word " * 2000, {"url_env": "DISCORD_WEBHOOK_URL"})
+        assert result is True
+        mock_session.post.assert_called_once()
+        assert isinstance(mock_session.post.call_args[1]["data"], webhook_sender.aiohttp.FormData)
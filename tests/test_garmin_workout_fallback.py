@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import threading
 import time
 from pathlib import Path
 
@@ -159,6 +160,107 @@ def test_fetch_workout_snapshot_success_path(tmp_path):
     assert snapshot.warnings == []
 
 
+def _minimal_activity_responses() -> dict[str, object]:
+    return {
+        "/mobile-gateway/heartRate/forDate/2026-04-15": {
+            "ActivitiesForDay": {
+                "payload": [{"activityId": 222, "startTimeLocal": "2026-04-15T18:30:00.0"}]
+            }
+        },
+        "/activity-service/activity/222": {"activityId": 222, "summaryDTO": {}},
+    }
+
+
+class _SlowGarminClient(_FakeGarminClient):
+    def __init__(self, responses: dict[str, object], *, delay: float) -> None:
+        super().__init__(responses)
+        self._delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def connectapi(self, path: str, method: str = "GET", **kwargs: object) -> object:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self._delay)
+            return super().connectapi(path, method, **kwargs)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_fetch_workout_snapshot_overlaps_independent_lookups(tmp_path):
+    responses = _minimal_activity_responses()
+    responses.update(
+        {
+            "/metrics-service/metrics/trainingreadiness/2026-04-15": [],
+            "/hrv-service/hrv/2026-04-15": {},
+            "/wellness-service/wellness/dailySleepData/display-name": {},
+            "/activity-service/activity/222/hrTimeInZones": [],
+            "/wellness-service/wellness/bodyBattery/events/2026-04-15": [],
+        }
+    )
+    client = _SlowGarminClient(responses, delay=0.05)
+
+    garmin_fallback.fetch_workout_snapshot(
+        activity_date="2026-04-15",
+        auth_home=tmp_path,
+        client=client,
+    )
+
+    assert client.max_active >= 4
+
+
+def test_fetch_workout_snapshot_keeps_warning_order_under_concurrency(tmp_path):
+    responses = _minimal_activity_responses()
+    responses.update(
+        {
+            "/metrics-service/metrics/trainingreadiness/2026-04-15": RuntimeError("HTTP 500"),
+            "/hrv-service/hrv/2026-04-15": RuntimeError("HTTP 502"),
+            "/wellness-service/wellness/dailySleepData/display-name": RuntimeError("HTTP 503"),
+            "/activity-service/activity/222/hrTimeInZones": RuntimeError("HTTP 504"),
+            "/wellness-service/wellness/bodyBattery/events/2026-04-15": [],
+        }
+    )
+    client = _SlowGarminClient(responses, delay=0.0)
+
+    snapshot = garmin_fallback.fetch_workout_snapshot(
+        activity_date="2026-04-15",
+        auth_home=tmp_path,
+        client=client,
+    )
+
+    assert [warning.split(":")[0] for warning in snapshot.warnings] == [
+        "Training readiness unavailable",
+        "HRV unavailable",
+        "Sleep unavailable",
+        "Heart-rate zones unavailable",
+    ]
+    assert snapshot.hr_zones == []
+
+
+def test_fetch_workout_snapshot_propagates_auth_errors_from_parallel_lookups(tmp_path):
+    responses = _minimal_activity_responses()
+    responses.update(
+        {
+            "/metrics-service/metrics/trainingreadiness/2026-04-15": [],
+            "/hrv-service/hrv/2026-04-15": RuntimeError("401 Unauthorized"),
+            "/wellness-service/wellness/dailySleepData/display-name": {},
+            "/activity-service/activity/222/hrTimeInZones": [],
+            "/wellness-service/wellness/bodyBattery/events/2026-04-15": [],
+        }
+    )
+
+    with pytest.raises(garmin_fallback.GarminTokensExpiredError):
+        garmin_fallback.fetch_workout_snapshot(
+            activity_date="2026-04-15",
+            auth_home=tmp_path,
+            client=_FakeGarminClient(responses),
+        )
+
+
 def test_fetch_workout_snapshot_missing_tokens_fails_fast(tmp_path):
     with pytest.raises(garmin_fallback.GarminTokensMissingError) as exc_info:
         garmin_fallback.fetch_workout_snapshot(activity_date="2026-04-15", auth_home=tmp_path)
@@ -0,0 +1,107 @@
+"""Tests for the cross-provider health range aggregator."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+import health_range
+
+
+def test_merge_range_tables_prefixes_columns_and_fills_missing_days():
+    merged = health_range.merge_range_tables(
+        "2026-10-18",
+        "2026-10-19",
+        {
+            "whoop": {
+                "columns": ["date", "recovery_score"],
+                "rows": [["2026-10-19", 72]],
+            },
+            "garmin": {
+                "columns": ["date", "steps", "hrv_status"],
+                "rows": [["2026-10-18", 9100, "BALANCED"], ["2026-10-19", 4000, "LOW"]],
+                "errors": ["hrv 2026-10-19: timeout"],
+            },
+        },
+    )
+
+    assert merged["columns"] == [
+        "date",
+        "whoop_recovery_score",
+        "garmin_steps",
+        "garmin_hrv_status",
+    ]
+    assert merged["rows"] == [
+        ["2026-10-18", None, 9100, "BALANCED"],
+        ["2026-10-19", 72, 4000, "LOW"],
+    ]
+    assert merged["errors"] == {"garmin": ["hrv 2026-10-19: timeout"]}
+
+
+def test_merge_range_tables_reports_provider_failures():
+    merged = health_range.merge_range_tables(
+        "2026-10-19", "2026-10-19", {"whoop": {"error": "WHOOP auth missing"}}
+    )
+
+    assert merged["columns"] == ["date"]
+    assert merged["rows"] == [["2026-10-19"]]
+    assert merged["errors"] == {"whoop": "WHOOP auth missing"}
+
+
+@pytest.mark.asyncio
+@patch("health_range.prefetch_server")
+async def test_fetch_health_range_calls_each_provider_once(mock_prefetch):
+    async def fake_prefetch(server, calls, *, timeout, env=None):
+        assert calls == [
+            {
+                "name": server,
+                "tool": health_range.RANGE_TOOLS[server],
+                "args": {"start_date": "2026-10-19", "end_date": "2026-10-19"},
+            }
+        ]
+        if server == "garmin":
+            return [{"name": server, "tool": calls[0]["tool"], "error": "timed out"}]
+        table = {"columns": ["date", "strain"], "rows": [["2026-10-19", 11.2]]}
+        return [{"name": server, "tool": calls[0]["tool"], "data": table}]
+
+    mock_prefetch.side_effect = fake_prefetch
+
+    merged = await health_range.fetch_health_range("2026-10-19", "2026-10-19")
+
+    assert mock_prefetch.call_count == 2
+    assert merged["rows"] == [["2026-10-19", 11.2]]
+    assert merged["errors"] == {"garmin": "timed out"}
+
+
+@pytest.mark.asyncio
+@patch("health_range.fetch_health_range")
+async def test_prefetch_calls_return_one_result_per_call(mock_fetch):
+    mock_fetch.return_value = {"columns": ["date"], "rows": [["2026-10-19"]]}
+
+    results = await health_range.prefetch_calls(
+        [
+            {
+                "name": "health_week",
+                "tool": "get_health_range",
+                "args": {"start_date": "2026-10-13", "end_date": "2026-10-19"},
+            },
+            {"name": "bad", "tool": "get_health_range", "args": {"start_date": "2026-10-13"}},
+            {"name": "other", "tool": "get_daily_sleep"},
+        ],
+        timeout=30,
+        env={"PATH": "/usr/bin"},
+    )
+
+    assert results[0] == {
+        "name": "health_week",
+        "tool": "get_health_range",
+        "data": {"columns": ["date"], "rows": [["2026-10-19"]]},
+    }
+    assert mock_fetch.call_args.kwargs == {
+        "providers": health_range.DEFAULT_PROVIDERS,
+        "timeout": 30,
+        "env": {"PATH": "/usr/bin"},
+    }
+    assert results[1]["error"] == "KeyError: 'end_date'"
+    assert results[2]["error"] == "Unknown tool: get_daily_sleep"
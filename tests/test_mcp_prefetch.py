@@ -0,0 +1,163 @@
+"""Tests for the direct MCP tool prefetch helper."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import mcp_prefetch
+
+
+def _fake_tools():
+    async def get_daily_sleep_tool(context, start_date=None, end_date=None):
+        assert isinstance(context, mcp_prefetch.PrefetchContext)
+        await asyncio.sleep(0)
+        return [{"date": start_date, "sleep_hours": 7.5}]
+
+    async def get_daily_recovery_tool(context, start_date=None, end_date=None):
+        raise RuntimeError("token expired")
+
+    return SimpleNamespace(
+        get_daily_sleep_tool=get_daily_sleep_tool,
+        get_daily_recovery_tool=get_daily_recovery_tool,
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_calls_preserves_order_and_isolates_errors():
+    results = await mcp_prefetch.run_calls(
+        _fake_tools(),
+        [
+            {"name": "sleep", "tool": "get_daily_sleep", "args": {"start_date": "2026-10-19"}},
+            {"name": "recovery", "tool": "get_daily_recovery"},
+            {"tool": "missing"},
+        ],
+    )
+
+    assert results[0] == {
+        "name": "sleep",
+        "tool": "get_daily_sleep",
+        "data": [{"date": "2026-10-19", "sleep_hours": 7.5}],
+    }
+    assert results[1]["error"] == "RuntimeError: token expired"
+    assert results[2] == {"name": "missing", "tool": "missing", "error": "Unknown tool: missing"}
+
+
+@pytest.mark.asyncio
+async def test_tool_failure_reported_through_context_keeps_real_error(capsys):
+    async def search_events_tool(context, calendar_id="primary"):
+        # Mirrors google_bot's _dispatch, which reports through the context and re-raises.
+        try:
+            raise PermissionError("403 insufficient calendar scope")
+        except Exception as exc:
+            await context.error(str(exc))
+            raise
+
+    results = await mcp_prefetch.run_calls(
+        SimpleNamespace(search_events_tool=search_events_tool),
+        [{"name": "calendar_today", "tool": "search_events"}],
+    )
+
+    assert results[0]["error"] == "PermissionError: 403 insufficient calendar scope"
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "[error] 403 insufficient calendar scope" in captured.err
+
+
+@pytest.mark.asyncio
+async def test_run_server_calls_closes_server_resources():
+    events = []
+
+    @asynccontextmanager
+    async def lifespan(server):
+        events.append("open")
+        try:
+            yield
+        finally:
+            events.append("close")
+
+    module = SimpleNamespace(
+        tools=_fake_tools(),
+        mcp=SimpleNamespace(settings=SimpleNamespace(lifespan=lifespan)),
+    )
+
+    results = await mcp_prefetch.run_server_calls(module, [{"tool": "get_daily_sleep"}])
+
+    assert results[0]["data"] == [{"date": None, "sleep_hours": 7.5}]
+    assert events == ["open", "close"]
+
+
+def test_resolve_server_python_prefers_server_override(tmp_path, monkeypatch):
+    monkeypatch.setenv("WHOOP_PYTHON", "/opt/whoop/python3")
+    assert mcp_prefetch.resolve_server_python("whoop", tmp_path) == "/opt/whoop/python3"
+
+    monkeypatch.delenv("WHOOP_PYTHON")
+    venv_python = tmp_path / "venv" / "bin" / "python3"
+    venv_python.parent.mkdir(parents=True)
+    venv_python.write_text("")
+    assert mcp_prefetch.resolve_server_python("whoop", tmp_path) == str(venv_python)
+
+
+def test_main_reports_server_load_failure(monkeypatch, capsys):
+    def fail_to_load(server):
+        raise mcp_prefetch.PrefetchError(f"{server} auth missing")
+
+    monkeypatch.setattr(mcp_prefetch, "load_server_module", fail_to_load)
+
+    exit_code = mcp_prefetch.main(["--server", "whoop", "--calls", "[]"])
+
+    assert exit_code == 1
+    assert json.loads(capsys.readouterr().out) == {"error": "whoop auth missing"}
+
+
+def test_main_emits_results_json(monkeypatch, capsys):
+    monkeypatch.setattr(
+        mcp_prefetch, "load_server_module", lambda server: SimpleNamespace(tools=_fake_tools())
+    )
+
+    exit_code = mcp_prefetch.main(
+        ["--server", "whoop", "--calls", json.dumps([{"tool": "get_daily_sleep"}])]
+    )
+
+    assert exit_code == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["results"][0]["data"] == [{"date": None, "sleep_hours": 7.5}]
+
+
+@pytest.mark.asyncio
+@patch("mcp_prefetch.asyncio.create_subprocess_exec")
+async def test_prefetch_server_failure_marks_every_call(mock_exec):
+    proc = MagicMock()
+    proc.returncode = 1
+    proc.communicate = AsyncMock(return_value=(b'{"error": "WHOOP auth missing"}\n', b""))
+    mock_exec.return_value = proc
+
+    results = await mcp_prefetch.prefetch_server(
+        "whoop",
+        [{"name": "a", "tool": "get_daily_sleep"}, {"name": "b", "tool": "get_daily_cycle"}],
+        timeout=5,
+    )
+
+    assert [result["error"] for result in results] == ["WHOOP auth missing"] * 2
+    assert mock_exec.call_args.args[1:4] == (str(mcp_prefetch.HELPER_PATH), "--server", "whoop")
+
+
+@pytest.mark.asyncio
+@patch("mcp_prefetch.kill_process", new_callable=AsyncMock)
+@patch("mcp_prefetch.asyncio.create_subprocess_exec")
+async def test_prefetch_server_timeout_kills_helper(mock_exec, mock_kill):
+    proc = MagicMock()
+    proc.communicate = AsyncMock(side_effect=asyncio.TimeoutError)
+    mock_exec.return_value = proc
+
+    results = await mcp_prefetch.prefetch_server(
+        "whoop", [{"name": "a", "tool": "get_daily_sleep"}], timeout=5
+    )
+
+    mock_kill.assert_awaited_once_with(proc)
+    assert results[0]["error"] == "whoop prefetch timed out after 5 seconds"
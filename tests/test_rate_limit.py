@@ -0,0 +1,40 @@
+"""Tests for the token bucket that paces Discord sends."""
+
+import pytest
+
+from rate_limit import TokenBucket
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_allows_burst_then_paces(self):
+        clock = _Clock()
+        bucket = TokenBucket(1.0, 3, clock=clock, sleep=clock.sleep)
+
+        for _ in range(5):
+            await bucket.acquire()
+
+        assert clock.sleeps == [1.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_pause_blocks_until_deadline(self):
+        clock = _Clock()
+        bucket = TokenBucket(1.0, 5, clock=clock, sleep=clock.sleep)
+
+        bucket.pause(2.5)
+        waited = await bucket.acquire()
+
+        assert waited == 2.5
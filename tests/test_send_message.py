@@ -2,7 +2,7 @@
 
 import sys
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -51,7 +51,7 @@ class TestMainCli:
 
 
 class TestSendMessageFunction:
-    """send_message.send_message() is callable with correct signature."""
+    """send_message.send_message() over the gateway transport."""
 
     def test_channel_id_from_env(self, monkeypatch):
         """CHANNEL_ID reads from env with default fallback."""
@@ -84,7 +84,7 @@ class TestSendMessageFunction:
         monkeypatch.setattr(send_message, "CHANNEL_ID", 123)
         monkeypatch.setattr(send_message.discord, "Client", FakeClient)
 
-        assert await send_message.send_message("hello") is False
+        assert await send_message.send_message("hello", transport="gateway") is False
 
     @pytest.mark.asyncio
     async def test_returns_true_only_after_successful_send(self, monkeypatch):
@@ -113,7 +113,7 @@ class TestSendMessageFunction:
         monkeypatch.setattr(send_message, "CHANNEL_ID", 123)
         monkeypatch.setattr(send_message.discord, "Client", FakeClient)
 
-        assert await send_message.send_message("hello") is True
+        assert await send_message.send_message("hello", transport="gateway") is True
         channel.send.assert_awaited_once_with("hello")
 
     @pytest.mark.asyncio
@@ -148,7 +148,9 @@ class TestSendMessageFunction:
         monkeypatch.setenv("ATLAS_CHANNEL_ID_HEALTH", "789")
         monkeypatch.setattr(send_message.discord, "Client", FakeClient)
 
-        assert await send_message.send_message("hello", channel_id=456, channel_name="health")
+        assert await send_message.send_message(
+            "hello", channel_id=456, channel_name="health", transport="gateway"
+        )
         assert requested_ids == [456]
 
     @pytest.mark.asyncio
@@ -183,7 +185,7 @@ class TestSendMessageFunction:
         monkeypatch.setenv("ATLAS_CHANNEL_ID_HEALTH", "789")
         monkeypatch.setattr(send_message.discord, "Client", FakeClient)
 
-        assert await send_message.send_message("hello", channel_name="health")
+        assert await send_message.send_message("hello", channel_name="health", transport="gateway")
         assert requested_ids == [789]
 
     @pytest.mark.asyncio
@@ -218,7 +220,97 @@ class TestSendMessageFunction:
         monkeypatch.delenv("ATLAS_CHANNEL_ID_HEALTH", raising=False)
         monkeypatch.setattr(send_message.discord, "Client", FakeClient)
 
-        assert await send_message.send_message("hello", channel_name="health")
+        assert await send_message.send_message("hello", channel_name="health", transport="gateway")
         assert requested_ids == []
         channel.send.assert_awaited_once_with("hello")
         legacy_channel.send.assert_not_called()
+
+
+def _json_response(status=200, payload=None):
+    resp = MagicMock()
+    resp.status = status
+    resp.headers = {}
+    resp.json = AsyncMock(return_value=payload)
+    resp.raise_for_status = MagicMock()
+    resp.__aenter__ = AsyncMock(return_value=resp)
+    resp.__aexit__ = AsyncMock(return_value=False)
+    return resp
+
+
+class TestRestAndWebhookTransports:
+    """send_message() posts over HTTP without opening a gateway session."""
+
+    @pytest.fixture(autouse=True)
+    def _session(self, monkeypatch):
+        import send_message
+
+        self.session = MagicMock()
+        self.session.closed = False
+        self.session.close = AsyncMock()
+        self.session.post = MagicMock(return_value=_json_response(200))
+        self.session.__aenter__ = AsyncMock(return_value=self.session)
+        self.session.__aexit__ = AsyncMock(return_value=False)
+        monkeypatch.setattr(send_message.aiohttp, "ClientSession", lambda **kwargs: self.session)
+        monkeypatch.setattr(send_message.discord, "Client", MagicMock(side_effect=AssertionError))
+        monkeypatch.setattr(send_message, "CHANNEL_ID", 123)
+        monkeypatch.setattr(send_message, "CONTROL_SOCKET_PATH", "")
+        for key in ("ATLAS_CHANNEL_ID_HEALTH", "DISCORD_WEBHOOK_HEALTH", "DISCORD_WEBHOOK_URL"):
+            monkeypatch.delenv(key, raising=False)
+
+    @pytest.mark.asyncio
+    async def test_rest_posts_to_channel_with_bot_token(self, monkeypatch):
+        import send_message
+
+        monkeypatch.setattr(send_message, "DISCORD_TOKEN", "token")
+        monkeypatch.setenv("ATLAS_CHANNEL_ID_HEALTH", "789")
+
+        assert await send_message.send_message("hello", channel_name="health")
+
+        url = self.session.post.call_args[0][0]
+        kwargs = self.session.post.call_args[1]
+        assert url == "https://discord.com/api/v10/channels/789/messages"
+        assert kwargs["headers"] == {"Authorization": "Bot token"}
+        assert kwargs["json"] == {"content": "hello"}
+        self.session.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rest_resolves_unpinned_channel_name(self, monkeypatch):
+        import send_message
+
+        monkeypatch.setattr(send_message, "DISCORD_TOKEN", "token")
+        self.session.get = MagicMock(
+            side_effect=[
+                _json_response(payload=[{"id": "1"}]),
+                _json_response(
+                    payload=[
+                        {"id": "555", "name": "health", "type": 2},
+                        {"id": "789", "name": "health", "type": 0},
+                        {"id": "123", "name": "atlas", "type": 0},
+                    ]
+                ),
+            ]
+        )
+
+        assert await send_message.send_message("hello", channel_name="#Health")
+        assert self.session.post.call_args[0][0].endswith("/channels/789/messages")
+
+    @pytest.mark.asyncio
+    async def test_rest_reports_failure_status(self, monkeypatch):
+        import send_message
+
+        monkeypatch.setattr(send_message, "DISCORD_TOKEN", "token")
+        self.session.post = MagicMock(return_value=_json_response(403))
+
+        assert await send_message.send_message("hello") is False
+        self.session.post.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_auto_uses_channel_webhook_without_token(self, monkeypatch):
+        import send_message
+
+        monkeypatch.setattr(send_message, "DISCORD_TOKEN", None)
+        monkeypatch.setenv("DISCORD_WEBHOOK_HEALTH", "https://discord.com/api/webhooks/health")
+
+        assert await send_message.send_message("hello", channel_name="health")
+        assert self.session.post.call_args[0][0] == "https://discord.com/api/webhooks/health"
+        assert self.session.post.call_args[1]["headers"] is None
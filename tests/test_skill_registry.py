@@ -0,0 +1,113 @@
+"""Tests for the in-process ATLAS skill registry."""
+
+from __future__ import annotations
+
+import os
+
+import agent_runner
+from skill_registry import SkillRegistry, get_skill_registry, reset_skill_registries
+
+
+def _bump_mtime(path, delta_ns: int = 5_000_000_000) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + delta_ns))
+
+
+def test_registry_indexes_flat_and_directory_skills(tmp_path):
+    (tmp_path / "morning-briefing.md").write_text("# Morning\n", encoding="utf-8")
+    (tmp_path / "weekly-review").mkdir()
+    (tmp_path / "weekly-review" / "SKILL.md").write_text("# Weekly\n", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    registry = SkillRegistry(tmp_path)
+
+    assert registry.names() == ["morning-briefing", "weekly-review"]
+    assert registry.get("weekly-review").content == "# Weekly"
+    assert registry.get("Morning-Briefing").name == "morning-briefing"
+    assert registry.get("missing") is None
+
+
+def test_registry_reuses_cached_content_until_mtime_changes(tmp_path, monkeypatch):
+    skill_path = tmp_path / "daily-summary.md"
+    skill_path.write_text("v1", encoding="utf-8")
+    registry = SkillRegistry(tmp_path)
+
+    first = registry.get("daily-summary")
+    reads: list[str] = []
+    original_read_text = type(skill_path).read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self.name)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(skill_path), "read_text", counting_read_text)
+
+    assert registry.get("daily-summary") is first
+    assert reads == []
+
+    skill_path.write_text("v2", encoding="utf-8")
+    _bump_mtime(skill_path)
+
+    assert registry.get("daily-summary").content == "v2"
+    assert reads == ["daily-summary.md"]
+
+
+def test_registry_picks_up_added_and_removed_skills(tmp_path):
+    registry = SkillRegistry(tmp_path)
+    assert registry.names() == []
+
+    (tmp_path / "log-workout.md").write_text("log", encoding="utf-8")
+    _bump_mtime(tmp_path)
+    assert registry.names() == ["log-workout"]
+
+    (tmp_path / "log-workout.md").unlink()
+    _bump_mtime(tmp_path, delta_ns=10_000_000_000)
+    assert registry.get("log-workout") is None
+
+
+def test_registry_picks_up_skill_file_added_inside_existing_directory(tmp_path):
+    (tmp_path / "health-pattern-monitor").mkdir()
+    registry = SkillRegistry(tmp_path)
+    assert registry.names() == []
+    top_mtime_ns = tmp_path.stat().st_mtime_ns
+
+    skill_dir = tmp_path / "health-pattern-monitor"
+    (skill_dir / "SKILL.md").write_text("# Monitor\n", encoding="utf-8")
+    _bump_mtime(skill_dir)
+
+    assert tmp_path.stat().st_mtime_ns == top_mtime_ns
+    assert registry.names() == ["health-pattern-monitor"]
+    assert registry.get("health-pattern-monitor").content == "# Monitor"
+
+
+def test_get_skill_registry_shares_one_instance_per_directory(tmp_path):
+    reset_skill_registries()
+    try:
+        assert get_skill_registry(tmp_path) is get_skill_registry(str(tmp_path))
+    finally:
+        reset_skill_registries()
+
+
+def test_expand_skill_prompt_and_agents_content_share_registry(tmp_path):
+    reset_skill_registries()
+    skills_dir = tmp_path / ".claude" / "skills"
+    skills_dir.mkdir(parents=True)
+    (skills_dir / "morning-briefing.md").write_text("Do the briefing.", encoding="utf-8")
+
+    try:
+        expanded = agent_runner._expand_skill_prompt_if_needed(
+            "Run the morning-briefing skill for today.", str(tmp_path)
+        )
+        agents_content = agent_runner._build_codex_agents_content(
+            bot_dir=str(tmp_path),
+            system_prompt_path=str(tmp_path / "missing-system.md"),
+            context_path=str(tmp_path / "missing-context.md"),
+            channel_dir=str(tmp_path / "session"),
+        )
+
+        assert "## ATLAS Skill Definition: morning-briefing" in expanded
+        assert "Do the briefing." in expanded
+        assert "- Available skills: `morning-briefing`." in agents_content
+        assert agent_runner.get_bot_skill_registry(str(tmp_path)) is get_skill_registry(skills_dir)
+    finally:
+        reset_skill_registries()
@@ -0,0 +1,267 @@
+"""Shared Discord webhook delivery: pooled session, rate-limit handling and an outbox."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fcntl
+import json
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from atlas_utils import atomic_write_text
+from discord_delivery import FILE_THRESHOLD_CHARS, RESPONSE_FILENAME, file_preview, split_message
+from rate_limit import TokenBucket
+
+WEBHOOK_MAX_ATTEMPTS = 4
+WEBHOOK_BACKOFF_SECONDS = 1.0
+WEBHOOK_TIMEOUT_SECONDS = 30
+# A longer Retry-After than this is left to the outbox instead of holding the caller.
+WEBHOOK_MAX_RETRY_AFTER_SECONDS = 60.0
+# Discord allows about five webhook executions per two seconds.
+WEBHOOK_SEND_RATE = 2.5
+WEBHOOK_SEND_BURST = 5
+
+OUTBOX_MAX_ATTEMPTS = 10
+OUTBOX_MAX_AGE_SECONDS = 24 * 60 * 60
+
+
+def webhook_parts(content: str, *, username: str | None = None) -> list[dict[str, Any]]:
+    """Return the webhook posts needed to deliver ``content``.
+
+    Each part is JSON-serialisable so undelivered parts can be queued in the outbox.
+    Content above ``FILE_THRESHOLD_CHARS`` becomes one post with a ``response.md`` file.
+    """
+    extra = {"username": username} if username else {}
+    if len(content) > FILE_THRESHOLD_CHARS:
+        return [{"content": file_preview(content), "file": content, **extra}]
+    return [{"content": chunk, **extra} for chunk in split_message(content) or [content]]
+
+
+def _request_kwargs(part: dict[str, Any]) -> dict[str, Any]:
+    """Build ``session.post`` arguments; multipart bodies are rebuilt for every attempt."""
+    if "file" not in part:
+        return {"json": part}
+    payload = {key: value for key, value in part.items() if key != "file"}
+    form = aiohttp.FormData()
+    form.add_field("payload_json", json.dumps(payload), content_type="application/json")
+    form.add_field(
+        "files[0]",
+        part["file"].encode("utf-8"),
+        filename=RESPONSE_FILENAME,
+        content_type="text/markdown",
+    )
+    return {"data": form}
+
+
+def _header_seconds(headers: Any, name: str) -> float | None:
+    value = headers.get(name) if headers is not None else None
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+class WebhookSender:
+    """Post to Discord webhooks over one pooled HTTP session.
+
+    Posts to each webhook URL are paced by a token bucket. Discord's ``X-RateLimit-*``
+    headers pause the bucket before the limit is hit, and a 429 pauses it for
+    ``Retry-After`` and retries. Network errors and 5xx responses are retried with
+    exponential backoff, up to ``max_attempts`` per post; other 4xx responses fail at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = WEBHOOK_MAX_ATTEMPTS,
+        backoff_seconds: float = WEBHOOK_BACKOFF_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._session: aiohttp.ClientSession | None = None
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=WEBHOOK_TIMEOUT_SECONDS)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled session if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _bucket(self, url: str) -> TokenBucket:
+        bucket = self._buckets.get(url)
+        if bucket is None:
+            bucket = self._buckets[url] = TokenBucket(
+                WEBHOOK_SEND_RATE, WEBHOOK_SEND_BURST, clock=self._clock, sleep=self._sleep
+            )
+        return bucket
+
+    async def post(
+        self,
+        url: str,
+        part: dict[str, Any],
+        *,
+        headers: dict[str, str] | None = None,
+    ) -> bool:
+        """Deliver one post, retrying rate limits and transient failures.
+
+        ``headers`` are sent as-is, for example a bot ``Authorization`` header when posting
+        to a channel's REST messages endpoint instead of a webhook.
+        """
+        bucket = self._bucket(url)
+        for attempt in range(1, self.max_attempts + 1):
+            await bucket.acquire()
+            try:
+                kwargs = _request_kwargs(part)
+                async with self._get_session().post(url, headers=headers, **kwargs) as resp:
+                    if resp.status in (200, 204):
+                        if _header_seconds(resp.headers, "X-RateLimit-Remaining") == 0:
+                            reset_after = _header_seconds(resp.headers, "X-RateLimit-Reset-After")
+                            if reset_after:
+                                bucket.pause(reset_after)
+                        return True
+                    if resp.status == 429:
+                        retry_after = _header_seconds(resp.headers, "Retry-After")
+                        retry_after = self.backoff_seconds if retry_after is None else retry_after
+                        if retry_after > WEBHOOK_MAX_RETRY_AFTER_SECONDS:
+                            print(f"Webhook rate limited for {retry_after:.0f}s; giving up")
+                            return False
+                        print(f"Webhook rate limited; retrying after {retry_after:.1f}s")
+                        bucket.pause(retry_after)
+                        continue
+                    print(f"Webhook failed with status {resp.status}")
+                    if resp.status < 500:
+                        return False
+            except (aiohttp.ClientError, TimeoutError) as e:
+                print(f"Webhook error: {e}")
+            if attempt < self.max_attempts:
+                await self._sleep(self.backoff_seconds * 2 ** (attempt - 1))
+        return False
+
+    async def send_parts(
+        self,
+        url: str,
+        parts: list[dict[str, Any]],
+        *,
+        headers: dict[str, str] | None = None,
+    ) -> int:
+        """Post ``parts`` in order, stopping at the first failure; return how many were sent."""
+        for index, part in enumerate(parts):
+            if not await self.post(url, part, headers=headers):
+                return index
+        return len(parts)
+
+    async def send(
+        self,
+        url: str,
+        content: str,
+        *,
+        username: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> bool:
+        """Deliver ``content`` to a webhook, chunked or as a file as needed."""
+        parts = webhook_parts(content, username=username)
+        return await self.send_parts(url, parts, headers=headers) == len(parts)
+
+
+class WebhookOutbox:
+    """Notifications whose delivery failed, kept on disk and retried on a later run.
+
+    Entries hold the caller's ``target`` (for example a notify config, so the webhook
+    URL is resolved again rather than written to disk) and the parts still to post.
+    An fcntl lock guards the file so overlapping dispatcher runs do not lose entries.
+    Entries are dropped after ``max_attempts`` retries or ``max_age_seconds``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_attempts: int = OUTBOX_MAX_ATTEMPTS,
+        max_age_seconds: float = OUTBOX_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[list[dict[str, Any]]]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.path.with_name(f"{self.path.name}.lock")
+        with open(lock_path, "w", encoding="utf-8") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield self._load()
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _load(self) -> list[dict[str, Any]]:
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+        return entries if isinstance(entries, list) else []
+
+    def _save(self, entries: list[dict[str, Any]]) -> None:
+        atomic_write_text(self.path, json.dumps(entries, indent=2))
+
+    def enqueue(self, target: dict[str, Any], parts: list[dict[str, Any]]) -> None:
+        """Queue undelivered ``parts`` for ``target``."""
+        if not parts:
+            return
+        entry = {"target": target, "parts": parts, "attempts": 0, "queued_at": self._clock()}
+        with self._locked() as entries:
+            entries.append(entry)
+            self._save(entries)
+
+    async def flush(
+        self,
+        deliver: Callable[[dict[str, Any], list[dict[str, Any]]], Awaitable[int]],
+    ) -> int:
+        """Retry queued entries with ``deliver``; return the number fully delivered.
+
+        ``deliver`` returns how many of the parts it posted; the rest stay queued.
+        """
+        with self._locked() as entries:
+            if not entries:
+                return 0
+            self._save([])
+
+        delivered = 0
+        remaining: list[dict[str, Any]] = []
+        now = self._clock()
+        for entry in entries:
+            sent = await deliver(entry["target"], entry["parts"])
+            parts = entry["parts"][sent:]
+            if not parts:
+                delivered += 1
+                continue
+            attempts = entry.get("attempts", 0) + 1
+            if attempts >= self.max_attempts or now - entry["queued_at"] > self.max_age_seconds:
+                print(f"Dropping undelivered webhook notification after {attempts} retries")
+                continue
+            remaining.append({**entry, "parts": parts, "attempts": attempts})
+
+        if remaining:
+            with self._locked() as entries:
+                self._save(remaining + entries)
+        return delivered